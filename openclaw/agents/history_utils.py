@@ -87,6 +87,32 @@ def sanitize_session_history(messages: list[dict[str, Any]]) -> list[dict[str, A
     return sanitized
 
 
+def resolve_max_history_turns(
+    max_turns: int | None = None,
+    provider: str | None = None
+) -> int | None:
+    """
+    Resolve the user-message limit used by limit_history_turns.
+    
+    Args:
+        max_turns: Explicit limit (takes precedence)
+        provider: Provider name for default limits
+        
+    Returns:
+        Effective limit, or None for no limit
+    """
+    # Apply provider-specific defaults
+    if max_turns is None and provider:
+        provider = provider.lower()
+        if provider in ("gemini", "google"):
+            return 20  # Keep last 20 user messages
+        elif provider in ("anthropic", "claude"):
+            return 30
+        else:
+            return 50  # Default
+    return max_turns
+
+
 def limit_history_turns(
     messages: list[dict[str, Any]],
     max_turns: int | None = None,
@@ -108,14 +134,7 @@ def limit_history_turns(
     Returns:
         Limited messages
     """
-    # Apply provider-specific defaults
-    if max_turns is None and provider:
-        if provider.lower() in ["gemini", "google"]:
-            max_turns = 20  # Keep last 20 user messages
-        elif provider.lower() in ["anthropic", "claude"]:
-            max_turns = 30
-        else:
-            max_turns = 50  # Default
+    max_turns = resolve_max_history_turns(max_turns, provider)
     
     if max_turns is None or max_turns <= 0:
         return messages
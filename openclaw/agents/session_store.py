@@ -3,6 +3,7 @@ Session Store for managing session metadata and transcripts
 
 Implements the pi-mono architecture:
 - sessions.json: Metadata and session_key → session_id mappings
+- sessions.log: Append-only journal of mutations since the last snapshot
 - {sessionId}.jsonl: JSONL transcript format (one message per line)
 
 With openclaw-ts cache optimization:
@@ -25,6 +26,18 @@ from pydantic import BaseModel, Field
 
 from openclaw.agents.session_ids import generate_session_id, looks_like_session_id
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    orjson = None  # type: ignore
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
 logger = logging.getLogger(__name__)
 
 
@@ -88,7 +101,9 @@ class SessionStore:
     Manages session metadata and transcripts with cache optimization
     
     Architecture:
-    - sessions.json: Contains all session metadata and session_key mappings
+    - sessions.json: Snapshot of all session metadata and session_key mappings
+    - sessions.log: Append-only journal of upsert/delete records, replayed on
+      top of the snapshot and compacted into it past a size threshold
     - transcripts/{sessionId}.jsonl: JSONL format (one message per line)
     
     Cache features (aligned with openclaw-ts):
@@ -98,6 +113,8 @@ class SessionStore:
     """
     
     DEFAULT_TTL_MS = 45_000  # 45 seconds - aligned with openclaw-ts
+    JOURNAL_MAX_ENTRIES = 1000
+    JOURNAL_MAX_BYTES = 1024 * 1024
 
     def __init__(
         self, 
@@ -109,6 +126,7 @@ class SessionStore:
         self._sessions_dir = workspace_dir / ".sessions"
         self._transcripts_dir = self._sessions_dir / "transcripts"
         self._sessions_file = self._sessions_dir / "sessions.json"
+        self._journal_file = self._sessions_dir / "sessions.log"
         self.reset_config = reset_config or SessionResetConfig()
         self.cache_ttl_ms = cache_ttl_ms
 
@@ -119,38 +137,97 @@ class SessionStore:
         # Cache infrastructure - aligned with openclaw-ts
         self._cache: dict[str, SessionStoreCacheEntry] = {}
         self._lock = asyncio.Lock()
+
+        # Journal bookkeeping (records/bytes appended since last snapshot)
+        self._journal_entries = 0
+        self._journal_bytes = 0
+
+        # Load session metadata, folding any leftover journal into the snapshot
+        self._sessions: dict[str, SessionEntry] = self._load_sessions()
+        if self._journal_entries:
+            self._save_sessions()
     
     @property
     def sessions_dir(self) -> Path:
         """Public accessor for sessions directory"""
         return self._sessions_dir
 
-        # Load session metadata
-        self._sessions: dict[str, SessionEntry] = self._load_sessions()
+    def _store_mtime(self) -> float:
+        """Latest modification time across snapshot and journal"""
+        mtime = 0.0
+        for path in (self._sessions_file, self._journal_file):
+            try:
+                mtime = max(mtime, path.stat().st_mtime)
+            except OSError:
+                pass
+        return mtime
 
     def _load_sessions(self) -> dict[str, SessionEntry]:
         """
-        Load session metadata from sessions.json (without cache)
+        Load session metadata from sessions.json + sessions.log (without cache)
         
         Used during initialization only. For cached access, use _load_sessions_cached()
         """
-        if not self._sessions_file.exists():
-            return {}
+        sessions: dict[str, SessionEntry] = {}
 
-        try:
-            with open(self._sessions_file) as f:
-                data = json.load(f)
+        if self._sessions_file.exists():
+            try:
+                with open(self._sessions_file) as f:
+                    data = json.load(f)
 
-            sessions = {}
-            for session_id, entry_data in data.get("sessions", {}).items():
-                sessions[session_id] = SessionEntry(**entry_data)
+                for session_id, entry_data in data.get("sessions", {}).items():
+                    sessions[session_id] = SessionEntry(**entry_data)
 
-            logger.info(f"Loaded {len(sessions)} sessions from store")
-            return sessions
+            except Exception as e:
+                logger.error(f"Failed to load sessions.json: {e}")
+                sessions = {}
 
-        except Exception as e:
-            logger.error(f"Failed to load sessions.json: {e}")
-            return {}
+        self._replay_journal(sessions)
+
+        logger.info(f"Loaded {len(sessions)} sessions from store")
+        return sessions
+
+    def _replay_journal(self, sessions: dict[str, SessionEntry]) -> None:
+        """Apply sessions.log records on top of the loaded snapshot"""
+        self._journal_entries = 0
+        self._journal_bytes = 0
+
+        try:
+            raw = self._journal_file.read_bytes()
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            logger.error(f"Failed to read sessions.log: {e}")
+            return
+
+        if raw and not raw.endswith(b"\n"):
+            # Crash mid-append: drop the torn tail so the next append starts
+            # on its own line instead of being glued onto (and lost with) it
+            keep = raw.rfind(b"\n") + 1
+            logger.warning("Discarding torn trailing sessions.log record")
+            try:
+                with open(self._journal_file, "r+b") as f:
+                    f.truncate(keep)
+                raw = raw[:keep]
+            except OSError as e:
+                logger.error(f"Failed to truncate sessions.log: {e}")
+
+        self._journal_bytes = len(raw)
+        for line in raw.split(b"\n"):
+            if not line or line.isspace():
+                continue
+            try:
+                record = _json_loads(line)
+                entry_data = record["entry"]
+                if record["op"] == "delete":
+                    sessions.pop(entry_data["session_id"], None)
+                else:
+                    sessions[entry_data["session_id"]] = SessionEntry(**entry_data)
+            except Exception as e:
+                # A torn trailing write must not discard the rest of the store
+                logger.warning(f"Skipping malformed sessions.log record: {e}")
+                continue
+            self._journal_entries += 1
     
     async def _load_sessions_cached(self) -> dict[str, SessionEntry]:
         """
@@ -169,7 +246,7 @@ class SessionStore:
             if cached:
                 # Check file modification time
                 try:
-                    current_mtime = self._sessions_file.stat().st_mtime if self._sessions_file.exists() else 0
+                    current_mtime = self._store_mtime()
                     
                     if current_mtime == cached.mtime:
                         # File hasn't changed, check TTL
@@ -187,15 +264,22 @@ class SessionStore:
             # Update cache
             self._cache[cache_key] = SessionStoreCacheEntry(
                 data=copy.deepcopy({"sessions": {sid: entry.model_dump() for sid, entry in self._sessions.items()}}),
-                mtime=self._sessions_file.stat().st_mtime if self._sessions_file.exists() else 0,
+                mtime=self._store_mtime(),
                 cached_at=time.time() * 1000
             )
             
             return self._sessions
 
+    def _invalidate_cache(self) -> None:
+        """Drop the cached sessions.json view - aligned with openclaw-ts"""
+        cache_key = str(self._sessions_file)
+        if cache_key in self._cache:
+            del self._cache[cache_key]
+            logger.debug(f"Invalidated session store cache: {cache_key}")
+
     def _save_sessions(self) -> None:
         """
-        Save session metadata to sessions.json and invalidate cache
+        Write a full sessions.json snapshot, truncate the journal and invalidate cache
         
         Aligned with openclaw-ts saveSessionStore()
         """
@@ -209,16 +293,53 @@ class SessionStore:
 
             with open(self._sessions_file, "w") as f:
                 json.dump(data, f, indent=2)
-            
-            # Invalidate cache - aligned with openclaw-ts
-            cache_key = str(self._sessions_file)
-            if cache_key in self._cache:
-                del self._cache[cache_key]
-                logger.debug(f"Invalidated session store cache: {cache_key}")
+
+            # Snapshot now covers every journaled mutation
+            if self._journal_file.exists():
+                self._journal_file.unlink()
+            self._journal_entries = 0
+            self._journal_bytes = 0
+
+            self._invalidate_cache()
 
         except Exception as e:
             logger.error(f"Failed to save sessions.json: {e}")
 
+    def _append_journal(self, op: str, entry_data: dict[str, Any]) -> None:
+        """
+        Append a single mutation record to sessions.log
+
+        O(1) bytes per logical change; compacts into sessions.json once the
+        journal grows past JOURNAL_MAX_ENTRIES or JOURNAL_MAX_BYTES.
+        """
+        try:
+            line = _json_dumps({"op": op, "entry": entry_data}) + b"\n"
+            with open(self._journal_file, "ab") as f:
+                f.write(line)
+            self._journal_entries += 1
+            self._journal_bytes += len(line)
+            self._invalidate_cache()
+
+        except Exception as e:
+            logger.error(f"Failed to append to sessions.log: {e}")
+            # Fall back to a full snapshot so the mutation is not lost
+            self._save_sessions()
+            return
+
+        if (
+            self._journal_entries >= self.JOURNAL_MAX_ENTRIES
+            or self._journal_bytes >= self.JOURNAL_MAX_BYTES
+        ):
+            self._save_sessions()
+
+    def _journal_upsert(self, entry: SessionEntry) -> None:
+        """Record an inserted or updated session entry"""
+        self._append_journal("upsert", entry.model_dump())
+
+    def _journal_delete(self, session_id: str) -> None:
+        """Record a deleted session entry"""
+        self._append_journal("delete", {"session_id": session_id})
+
     async def get_or_create_session_async(
         self,
         session_key: str | None = None,
@@ -271,7 +392,7 @@ class SessionStore:
                 thinking_level=thinking_level,
             )
             self._sessions[session_id] = entry
-            self._save_sessions()
+            self._journal_upsert(entry)
             return entry, True
 
         # If session_key provided, lookup by key
@@ -289,7 +410,7 @@ class SessionStore:
                 thinking_level=thinking_level,
             )
             self._sessions[new_session_id] = entry
-            self._save_sessions()
+            self._journal_upsert(entry)
             return entry, True
 
         # No session_id or session_key - create new
@@ -300,7 +421,7 @@ class SessionStore:
             thinking_level=thinking_level,
         )
         self._sessions[new_session_id] = entry
-        self._save_sessions()
+        self._journal_upsert(entry)
         return entry, True
 
     def get_session(self, session_id: str) -> SessionEntry | None:
@@ -327,7 +448,7 @@ class SessionStore:
         # Always update last_active_at
         entry.last_active_at = datetime.now(UTC).isoformat()
 
-        self._save_sessions()
+        self._journal_upsert(entry)
 
     def delete_session(self, session_id: str) -> bool:
         """Delete session and its transcript"""
@@ -342,8 +463,8 @@ class SessionStore:
         if transcript_file.exists():
             transcript_file.unlink()
 
-        # Save sessions.json
-        self._save_sessions()
+        # Record deletion in the journal
+        self._journal_delete(session_id)
 
         logger.info(f"Deleted session {session_id}")
         return True
@@ -377,14 +498,13 @@ class SessionStore:
             return []
 
         try:
-            messages = []
-            with open(transcript_file) as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    data = json.loads(line)
-                    messages.append(TranscriptMessage(**data))
+            # Single bulk read + split keeps the per-line loop in C
+            raw = transcript_file.read_bytes()
+            messages = [
+                TranscriptMessage.model_validate(_json_loads(line))
+                for line in raw.split(b"\n")
+                if line and not line.isspace()
+            ]
 
             logger.info(f"Loaded {len(messages)} messages from transcript {session_id}")
             return messages
@@ -411,7 +531,7 @@ class SessionStore:
                 entry = self._sessions[session_id]
                 entry.message_count += 1
                 entry.last_active_at = datetime.now(UTC).isoformat()
-                self._save_sessions()
+                self._journal_upsert(entry)
 
         except Exception as e:
             logger.error(f"Failed to append message to transcript {session_id}: {e}")
@@ -434,7 +554,7 @@ class SessionStore:
                 entry = self._sessions[session_id]
                 entry.message_count = len(messages)
                 entry.last_active_at = datetime.now(UTC).isoformat()
-                self._save_sessions()
+                self._journal_upsert(entry)
 
             logger.info(f"Saved {len(messages)} messages to transcript {session_id}")
 
@@ -453,7 +573,7 @@ class SessionStore:
             entry = self._sessions[session_id]
             entry.message_count = 0
             entry.last_active_at = datetime.now(UTC).isoformat()
-            self._save_sessions()
+            self._journal_upsert(entry)
 
         logger.info(f"Cleared transcript {session_id}")
 
@@ -522,7 +642,7 @@ class SessionStore:
         entry.last_reset_at = datetime.now(UTC).isoformat()
         entry.last_active_at = datetime.now(UTC).isoformat()
 
-        self._save_sessions()
+        self._journal_upsert(entry)
 
         logger.info(f"Reset session {session_id}" + (f" (reason: {reason})" if reason else ""))
         return True
@@ -568,13 +688,24 @@ class SessionFreshness:
     idle_expires_at: int | None = None
 
 
+_DAY_MS = 86_400_000
+
+# (utc_day_bucket, at_hour) -> that day's reset boundary in ms; at most 2 kept
+_daily_reset_cache: dict[tuple[int, int], int] = {}
+
+
 def resolve_daily_reset_at_ms(now_ms: int, at_hour: int) -> int:
     """Resolve the daily reset threshold timestamp (ms)."""
-    from datetime import datetime, timezone
-
-    now_dt = datetime.fromtimestamp(now_ms / 1000, tz=timezone.utc)
-    reset_dt = now_dt.replace(hour=at_hour, minute=0, second=0, microsecond=0)
-    reset_ms = int(reset_dt.timestamp() * 1000)
+    key = (now_ms // _DAY_MS, at_hour)
+    reset_ms = _daily_reset_cache.get(key)
+    if reset_ms is None:
+        now_dt = datetime.fromtimestamp(now_ms / 1000, tz=UTC)
+        reset_dt = now_dt.replace(hour=at_hour, minute=0, second=0, microsecond=0)
+        reset_ms = int(reset_dt.timestamp() * 1000)
+        if len(_daily_reset_cache) >= 2:
+            # Boundaries only move forward; drop the oldest day bucket
+            del _daily_reset_cache[min(_daily_reset_cache)]
+        _daily_reset_cache[key] = reset_ms
 
     # If now is before the reset hour today, use yesterday's reset
     if now_ms < reset_ms:
@@ -6,11 +6,74 @@ Handles skill-specific configuration from OpenClaw config.
 from __future__ import annotations
 
 import logging
+from dataclasses import dataclass
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class SkillsConfigView:
+    """
+    Flattened view of the `skills` section of an OpenClaw config.
+    
+    Attributes:
+        entries: skills.entries (skill_key -> skill config dict)
+        allow_bundled: skills.allowBundled as a bool, a frozenset of
+            allowed names/keys, or None when unset or unrecognized
+        disabled: skill keys whose entry sets enabled to False
+    """
+    entries: dict[str, Any]
+    allow_bundled: bool | frozenset[str] | None = None
+    disabled: frozenset[str] = frozenset()
+
+
+_EMPTY_VIEW = SkillsConfigView(entries={})
+
+
+def get_skills_config_view(config: dict | None) -> SkillsConfigView:
+    """
+    Get the flattened skills view for a config.
+    
+    Not cached: the view is rebuilt from the live config on every call, so
+    in-place config edits are never masked. Build it once per pass over
+    many skills (see make_eligibility_predicate).
+    
+    Args:
+        config: OpenClaw configuration
+        
+    Returns:
+        SkillsConfigView for the config's skills section
+    """
+    if not config:
+        return _EMPTY_VIEW
+    
+    skills_config = config.get('skills')
+    if not isinstance(skills_config, dict):
+        return _EMPTY_VIEW
+    
+    entries = _entries(skills_config)
+    allow_bundled = skills_config.get('allowBundled')
+    if isinstance(allow_bundled, list):
+        allow_bundled = frozenset(allow_bundled)
+    elif not isinstance(allow_bundled, bool):
+        allow_bundled = None
+    return SkillsConfigView(
+        entries=entries,
+        allow_bundled=allow_bundled,
+        disabled=frozenset(
+            key for key, value in entries.items()
+            if isinstance(value, dict) and value.get('enabled') is False
+        ),
+    )
+
+
+def _entries(skills_config: Any) -> dict[str, Any]:
+    """skills.entries from a skills section, or {} when missing or malformed"""
+    entries = skills_config.get('entries') if isinstance(skills_config, dict) else None
+    return entries if isinstance(entries, dict) else {}
+
+
 def get_skill_config(config: dict | None, skill_key: str) -> dict | None:
     """
     Get configuration for a specific skill.
@@ -27,10 +90,8 @@ def get_skill_config(config: dict | None, skill_key: str) -> dict | None:
     if not config:
         return None
     
-    skills_config = config.get('skills', {})
-    entries = skills_config.get('entries', {})
-    
-    return entries.get(skill_key)
+    # Same live entries dict the config view wraps, without building the view
+    return _entries(config.get('skills')).get(skill_key)
 
 
 def is_skill_enabled(config: dict | None, skill_key: str) -> bool:
@@ -80,6 +141,8 @@ def get_skill_value(config: dict | None, skill_key: str, value_key: str, default
 
 
 __all__ = [
+    "SkillsConfigView",
+    "get_skills_config_view",
     "get_skill_config",
     "is_skill_enabled",
     "get_skill_value",
@@ -6,14 +6,36 @@ ignore files (.gitignore, .ignore, .fdignore).
 """
 from __future__ import annotations
 
+import fnmatch
 import logging
+import os
+import re
 from pathlib import Path
+from typing import Any, NamedTuple
+
+try:
+    import pathspec
+
+    PATHSPEC_AVAILABLE = True
+except ImportError:
+    pathspec = None  # type: ignore
+    PATHSPEC_AVAILABLE = False
 
 from .frontmatter import parse_skill_frontmatter
 from .types import Skill, LoadSkillsResult
 
 logger = logging.getLogger(__name__)
 
+_DEFAULT_IGNORE_PATTERNS = ("node_modules", ".git", "__pycache__", "*.pyc")
+
+_NEVER_MATCH = re.compile(r"(?!)")
+
+
+class _CompiledIgnorePatterns(NamedTuple):
+    """Fallback ignore matcher used when pathspec is not installed"""
+    literal: re.Pattern  # literal patterns, searched as substrings of the relative path
+    wildcard: re.Pattern  # union of fnmatch-translated "*" patterns, matched per path part
+
 
 def load_skills_from_dir(
     dir_path: Path,
@@ -40,35 +62,68 @@ def load_skills_from_dir(
     skills = []
     errors = []
     
-    if not dir_path.exists() or not dir_path.is_dir():
+    # One scandir both probes the directory and lists the root, replacing
+    # separate exists()/is_dir() stats on the common "no skills" path
+    try:
+        with os.scandir(dir_path) as it:
+            root_entries = list(it)
+    except (FileNotFoundError, NotADirectoryError):
         return LoadSkillsResult(skills=skills, errors=[f"Directory not found: {dir_path}"])
+    except OSError as e:
+        logger.error(f"Error discovering skills from {dir_path}: {e}")
+        return LoadSkillsResult(skills=skills, errors=[f"Discovery error: {e}"])
+    
+    # Nothing to discover without a root .md file or a subdirectory to walk;
+    # skip reading the ignore files too
+    if not any(
+        entry.name.endswith(".md") or entry.is_dir(follow_symlinks=False)
+        for entry in root_entries
+    ):
+        return LoadSkillsResult(skills=skills, errors=errors)
     
     # Load ignore patterns
     ignore_patterns = _load_ignore_patterns(dir_path)
+    root_str = os.path.join(str(dir_path), "")
     
     try:
-        # Find root-level .md files
-        if include_root_files:
-            for md_file in dir_path.glob("*.md"):
-                if _should_ignore(md_file, dir_path, ignore_patterns):
+        # Single scandir walk: root-level .md files plus SKILL.md at any depth.
+        # DirEntry type checks reuse readdir's d_type, and ignored directories
+        # are pruned before they are ever listed.
+        stack = [(str(dir_path), True)]
+        while stack:
+            current, at_root = stack.pop()
+            subdirs = []
+            
+            if at_root:
+                entries = root_entries
+            else:
+                with os.scandir(current) as it:
+                    entries = list(it)
+            
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if not _should_ignore(entry.path, root_str, ignore_patterns, is_dir=True):
+                        subdirs.append((entry.path, False))
                     continue
                 
-                skill = _load_skill_file(md_file, source)
-                if skill:
-                    skills.append(skill)
-                else:
-                    errors.append(f"Failed to parse skill: {md_file}")
-        
-        # Find SKILL.md files in subdirectories
-        for skill_md in dir_path.rglob("SKILL.md"):
-            if _should_ignore(skill_md, dir_path, ignore_patterns):
-                continue
+                name = entry.name
+                if name == "SKILL.md" or (
+                    at_root and include_root_files and name.endswith(".md")
+                ):
+                    if not entry.is_file():
+                        continue
+                    if _should_ignore(entry.path, root_str, ignore_patterns):
+                        continue
+                    
+                    md_file = Path(entry.path)
+                    skill = _load_skill_file(md_file, source)
+                    if skill:
+                        skills.append(skill)
+                    else:
+                        errors.append(f"Failed to parse skill: {md_file}")
             
-            skill = _load_skill_file(skill_md, source)
-            if skill:
-                skills.append(skill)
-            else:
-                errors.append(f"Failed to parse skill: {skill_md}")
+            # Reverse so subdirectories are visited in listing order
+            stack.extend(reversed(subdirs))
     
     except Exception as e:
         logger.error(f"Error discovering skills from {dir_path}: {e}", exc_info=True)
@@ -94,14 +149,17 @@ def _load_skill_file(file_path: Path, source: str) -> Skill | None:
         return None
 
 
-def _load_ignore_patterns(dir_path: Path) -> set[str]:
+def _load_ignore_patterns(dir_path: Path) -> Any:
     """
     Load ignore patterns from .gitignore, .ignore, .fdignore
     
+    When pathspec is installed, all patterns are compiled once into a
+    gitwildmatch PathSpec so each path is matched in a single pass.
+    
     Returns:
-        Set of ignore patterns
+        Compiled PathSpec, or a _CompiledIgnorePatterns if pathspec is unavailable
     """
-    patterns = {"node_modules", ".git", "__pycache__", "*.pyc"}
+    lines = list(_DEFAULT_IGNORE_PATTERNS)
     
     ignore_files = [".gitignore", ".ignore", ".fdignore"]
     
@@ -113,52 +171,66 @@ def _load_ignore_patterns(dir_path: Path) -> set[str]:
                 for line in content.split('\n'):
                     line = line.strip()
                     if line and not line.startswith('#'):
-                        patterns.add(line)
+                        lines.append(line)
             except Exception:
                 pass
     
-    return patterns
+    if PATHSPEC_AVAILABLE:
+        return pathspec.PathSpec.from_lines("gitwildmatch", lines)
+    
+    patterns = dict.fromkeys(lines)  # de-duplicate, keep order
+    literals = [p for p in patterns if '*' not in p]
+    wildcards = [p for p in patterns if '*' in p]
+    return _CompiledIgnorePatterns(
+        literal=re.compile("|".join(map(re.escape, literals))) if literals else _NEVER_MATCH,
+        wildcard=re.compile("|".join(map(fnmatch.translate, wildcards))) if wildcards else _NEVER_MATCH,
+    )
 
 
-def _should_ignore(file_path: Path, root: Path, patterns: set[str]) -> bool:
+def _should_ignore(
+    path: str,
+    root_str: str,
+    patterns: Any,
+    is_dir: bool = False,
+) -> bool:
     """
     Check if file should be ignored based on patterns.
     
+    Works on plain strings (no Path.relative_to / .parts) since it runs
+    for every candidate entry of the discovery walk.
+    
     Args:
-        file_path: File to check
-        root: Root directory
-        patterns: Ignore patterns
+        path: File or directory path to check
+        root_str: Root directory path, ending with os.sep
+        patterns: Compiled PathSpec or _CompiledIgnorePatterns (see _load_ignore_patterns)
+        is_dir: Whether path is a directory (lets "dir/" patterns match)
         
     Returns:
         True if file should be ignored
     """
-    try:
-        relative = file_path.relative_to(root)
-        parts = relative.parts
-        
-        # Check each part against patterns
-        for part in parts:
-            if part in patterns:
-                return True
-            
-            # Check wildcard patterns
-            for pattern in patterns:
-                if '*' in pattern:
-                    # Simple wildcard matching
-                    pattern_parts = pattern.split('*')
-                    if all(p in part for p in pattern_parts if p):
-                        return True
-        
-        # Check full path patterns
-        relative_str = str(relative)
-        for pattern in patterns:
-            if pattern in relative_str:
-                return True
-        
+    if not path.startswith(root_str):
         return False
+    relative_str = path[len(root_str):]
     
-    except ValueError:
-        return False
+    if PATHSPEC_AVAILABLE:
+        rel = relative_str if os.sep == "/" else relative_str.replace(os.sep, "/")
+        return patterns.match_file(rel + "/" if is_dir else rel)
+    
+    if is_dir:
+        relative_str += os.sep
+    
+    # Literal patterns: one search covers both exact path parts and
+    # substrings of the full relative path
+    if patterns.literal.search(relative_str):
+        return True
+    
+    # Wildcard patterns: one automaton match per path part
+    wildcard = patterns.wildcard
+    for part in relative_str.split(os.sep):
+        if part and wildcard.match(part):
+            return True
+    
+    return False
 
 
 __all__ = [
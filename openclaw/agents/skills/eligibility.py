@@ -10,11 +10,14 @@ Determines whether a skill should be included based on:
 """
 from __future__ import annotations
 
+import functools
 import logging
+import os
 import platform
-import shutil
+from collections.abc import Callable
 from typing import Any
 
+from .config import get_skills_config_view
 from .types import SkillEntry, SkillEligibilityContext
 
 logger = logging.getLogger(__name__)
@@ -46,53 +49,78 @@ def should_include_skill(
     Returns:
         True if skill should be included
     """
-    skill = entry.skill
-    skill_key = entry.skill_key
-    
-    # Rule 1: Check if explicitly disabled in config
-    if config:
-        skills_config = config.get('skills', {})
-        entries_config = skills_config.get('entries', {})
-        skill_entry_config = entries_config.get(skill_key, {})
+    return make_eligibility_predicate(config, eligibility)(entry)
+
+
+def make_eligibility_predicate(
+    config: dict | None,
+    eligibility: SkillEligibilityContext
+) -> Callable[[SkillEntry], bool]:
+    """
+    Build a should_include_skill predicate specialized for one config/context.
+    
+    Config-derived state (disabled skill keys, allowBundled) is read from a
+    config view built once here, so filtering entries with the predicate
+    does not traverse the config. Build a new predicate after editing the
+    config.
+    
+    Args:
+        config: OpenClaw configuration
+        eligibility: Runtime eligibility context
+        
+    Returns:
+        Callable taking a SkillEntry and returning True if it should be included
+    """
+    # Config-derived sets come precomputed on a fresh config view
+    view = get_skills_config_view(config)
+    disabled = view.disabled
+    allow_bundled = view.allow_bundled
+    platform_name = eligibility.platform
+    
+    def predicate(entry: SkillEntry) -> bool:
+        skill = entry.skill
+        skill_key = entry.skill_key
         
-        if skill_entry_config.get('enabled') is False:
+        # Rule 1: Check if explicitly disabled in config
+        if skill_key in disabled:
             logger.debug(f"Skill {skill.name} disabled in config")
             return False
-    
-    # Rule 2: Check bundled skill allowlist
-    if entry.source == "bundled" and config:
-        skills_config = config.get('skills', {})
-        allow_bundled = skills_config.get('allowBundled')
         
-        if allow_bundled is not None:
-            if isinstance(allow_bundled, bool):
-                if not allow_bundled:
-                    logger.debug(f"Bundled skill {skill.name} excluded (allowBundled=false)")
-                    return False
-            elif isinstance(allow_bundled, list):
+        # Rule 2: Check bundled skill allowlist
+        if allow_bundled is not None and entry.source == "bundled":
+            if allow_bundled is False:
+                logger.debug(f"Bundled skill {skill.name} excluded (allowBundled=false)")
+                return False
+            if allow_bundled is not True:
                 if skill.name not in allow_bundled and skill_key not in allow_bundled:
                     logger.debug(f"Bundled skill {skill.name} not in allowBundled list")
                     return False
-    
-    # Rule 3: Check OS requirement
-    if skill.metadata and skill.metadata.os:
-        if eligibility.platform not in skill.metadata.os:
-            logger.debug(f"Skill {skill.name} requires OS {skill.metadata.os}, got {eligibility.platform}")
+        
+        metadata = skill.metadata
+        if not metadata:
+            logger.debug(f"Skill {skill.name} eligible for inclusion")
+            return True
+        
+        # Rule 3: Check OS requirement
+        if metadata.os and platform_name not in metadata.os:
+            logger.debug(f"Skill {skill.name} requires OS {metadata.os}, got {platform_name}")
             return False
-    
-    # Rule 4: Always include if marked
-    if skill.metadata and skill.metadata.always:
-        logger.debug(f"Skill {skill.name} marked as always, including")
+        
+        # Rule 4: Always include if marked
+        if metadata.always:
+            logger.debug(f"Skill {skill.name} marked as always, including")
+            return True
+        
+        # Rule 5-8: Check requirements
+        if metadata.requires:
+            if not check_skill_requirements(metadata.requires, eligibility, config):
+                logger.debug(f"Skill {skill.name} requirements not met")
+                return False
+        
+        logger.debug(f"Skill {skill.name} eligible for inclusion")
         return True
     
-    # Rule 5-8: Check requirements
-    if skill.metadata and skill.metadata.requires:
-        if not check_skill_requirements(skill.metadata.requires, eligibility, config):
-            logger.debug(f"Skill {skill.name} requirements not met")
-            return False
-    
-    logger.debug(f"Skill {skill.name} eligible for inclusion")
-    return True
+    return predicate
 
 
 def check_skill_requirements(
@@ -139,27 +167,30 @@ def check_skill_requirements(
             return False
         
         for config_path in requires.config:
-            if not _check_config_path(config, config_path):
+            if not _check_config_path(config, _split_config_path(config_path)):
                 logger.debug(f"Required config path not truthy: {config_path}")
                 return False
     
     return True
 
 
-def _check_config_path(config: dict, path: str) -> bool:
+@functools.lru_cache(maxsize=256)
+def _split_config_path(path: str) -> tuple[str, ...]:
+    """Split a dot-notation config path once: "api.keys.openai" -> ("api", "keys", "openai")"""
+    return tuple(path.split('.'))
+
+
+def _check_config_path(config: dict, parts: tuple[str, ...]) -> bool:
     """
     Check if a config path is truthy.
     
-    Supports dot notation: "api.keys.openai"
-    
     Args:
         config: Configuration dict
-        path: Dot-separated path
+        parts: Pre-split path components (see _split_config_path)
         
     Returns:
         True if path exists and is truthy
     """
-    parts = path.split('.')
     current = config
     
     for part in parts:
@@ -175,17 +206,26 @@ def _check_config_path(config: dict, path: str) -> bool:
     return bool(current)
 
 
-def build_eligibility_context() -> SkillEligibilityContext:
+# Common bins to check
+_COMMON_BINS = (
+    'git', 'gh', 'docker', 'python', 'python3', 'node', 'npm',
+    'go', 'cargo', 'rustc', 'uv', 'brew', 'apt', 'curl', 'wget',
+    'jq', 'tmux', 'ssh', 'rsync', 'tar', 'gzip', 'zip', 'unzip'
+)
+
+
+@functools.lru_cache(maxsize=4)
+def _probe_runtime(path: str, system: str) -> tuple[str, frozenset[str]]:
     """
-    Build eligibility context from runtime environment.
+    Resolve platform name and available binaries.
+    
+    Cached per (PATH, platform.system()) since neither the platform nor
+    the tools on PATH change mid-process.
     
     Returns:
-        SkillEligibilityContext with current runtime info
+        (platform_name, available_bins)
     """
-    import os
-    
-    # Get platform
-    system = platform.system().lower()
+    system = system.lower()
     if system == 'darwin':
         platform_name = 'darwin'
     elif system == 'linux':
@@ -195,32 +235,64 @@ def build_eligibility_context() -> SkillEligibilityContext:
     else:
         platform_name = system
     
-    # Find available binaries
-    available_bins = set()
+    # Find available binaries with one listing per PATH directory, instead
+    # of re-walking PATH for every binary as shutil.which would
+    wanted = frozenset(_COMMON_BINS)
+    pathext: tuple[str, ...] = ()
+    if platform_name == 'win32':
+        pathext = tuple(
+            ext.lower() for ext in os.environ.get("PATHEXT", ".EXE;.BAT;.CMD").split(os.pathsep) if ext
+        )
     
-    # Common bins to check
-    common_bins = [
-        'git', 'gh', 'docker', 'python', 'python3', 'node', 'npm',
-        'go', 'cargo', 'rustc', 'uv', 'brew', 'apt', 'curl', 'wget',
-        'jq', 'tmux', 'ssh', 'rsync', 'tar', 'gzip', 'zip', 'unzip'
-    ]
+    available_bins: set[str] = set()
+    for directory in path.split(os.pathsep):
+        if not directory:
+            continue
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if pathext:
+                    stem, ext = os.path.splitext(name)
+                    if ext.lower() not in pathext:
+                        continue
+                    name = stem
+                if name in wanted and name not in available_bins:
+                    try:
+                        if entry.is_file() and os.access(entry.path, os.X_OK):
+                            available_bins.add(name)
+                    except OSError:
+                        continue
     
-    for bin_name in common_bins:
-        if shutil.which(bin_name):
-            available_bins.add(bin_name)
+    return platform_name, frozenset(available_bins)
+
+
+def build_eligibility_context() -> SkillEligibilityContext:
+    """
+    Build eligibility context from runtime environment.
     
-    # Get environment variables
-    env_vars = dict(os.environ)
+    Returns:
+        SkillEligibilityContext with current runtime info
+    """
+    platform_name, available_bins = _probe_runtime(
+        os.environ.get("PATH", os.defpath), platform.system()
+    )
     
     return SkillEligibilityContext(
         platform=platform_name,
-        available_bins=available_bins,
-        env_vars=env_vars
+        available_bins=set(available_bins),
+        # Live mapping; requirement checks only do membership tests, so
+        # copying the whole environment per call buys nothing
+        env_vars=os.environ
     )
 
 
 __all__ = [
     "should_include_skill",
+    "make_eligibility_predicate",
     "check_skill_requirements",
     "build_eligibility_context",
 ]
@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
 import platform
 import shutil
 import tempfile
@@ -14,12 +15,24 @@ import tarfile
 import zipfile
 from pathlib import Path
 from typing import Any
+
+import aiofiles
 import aiohttp
 
 from .types import Skill, SkillInstallSpec
 
 logger = logging.getLogger(__name__)
 
+DOWNLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+MAX_CONCURRENT_INSTALLS = 4
+
+# backend -> installed package names, filled by one bulk listing per process
+_installed_packages: dict[str, set[str]] = {}
+
+# Package managers that take global locks / share prefix state, so their
+# specs must not run concurrently with each other
+_SERIAL_KINDS = frozenset({"brew", "node", "go", "uv"})
+
 
 async def install_skill_dependencies(
     skill: Skill,
@@ -51,24 +64,65 @@ async def install_skill_dependencies(
     errors = []
     current_platform = _get_platform()
     
+    applicable = []
     for spec in install_specs:
         # Check OS requirement
         if spec.os and current_platform not in spec.os:
             logger.debug(f"Skipping install spec (wrong OS): {spec.id or spec.kind}")
             continue
-        
-        try:
-            await _install_spec(spec)
-            logger.info(f"Installed {spec.kind}: {spec.id or spec.formula or spec.package or spec.module or spec.url}")
-        except Exception as e:
-            error_msg = f"Failed to install {spec.kind} {spec.id or ''}: {e}"
+        applicable.append(spec)
+    
+    # Different backends run concurrently (bounded, to avoid hammering
+    # package mirrors); specs for one package manager run one at a time, in
+    # order, since brew/npm/... are not safe to run in parallel with
+    # themselves. Locks are per call so they bind to the running loop.
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_INSTALLS)
+    backend_locks = {
+        kind: asyncio.Lock()
+        for kind in {spec.kind for spec in applicable} & _SERIAL_KINDS
+    }
+    
+    # One HTTP session for all downloads so connections (DNS + TLS) to the
+    # same host are pooled across specs
+    session: aiohttp.ClientSession | None = None
+    if any(spec.kind == "download" for spec in applicable):
+        session = aiohttp.ClientSession()
+    
+    async def _run(spec: SkillInstallSpec) -> None:
+        lock = backend_locks.get(spec.kind)
+        if lock is None:
+            async with semaphore:
+                await _install_spec(spec, session)
+            return
+        async with lock, semaphore:
+            await _install_spec(spec, session)
+    
+    try:
+        results = await asyncio.gather(
+            *(_run(spec) for spec in applicable),
+            return_exceptions=True,
+        )
+    finally:
+        if session is not None:
+            await session.close()
+    
+    for spec, result in zip(applicable, results):
+        if isinstance(result, BaseException) and not isinstance(result, Exception):
+            raise result
+        if isinstance(result, Exception):
+            error_msg = f"Failed to install {spec.kind} {spec.id or ''}: {result}"
             logger.error(error_msg)
             errors.append(error_msg)
+        else:
+            logger.info(f"Installed {spec.kind}: {spec.id or spec.formula or spec.package or spec.module or spec.url}")
     
     return (len(errors) == 0, errors)
 
 
-async def _install_spec(spec: SkillInstallSpec) -> None:
+async def _install_spec(
+    spec: SkillInstallSpec,
+    session: aiohttp.ClientSession | None = None
+) -> None:
     """Install a single spec"""
     if spec.kind == "brew":
         await _install_brew(spec)
@@ -79,7 +133,7 @@ async def _install_spec(spec: SkillInstallSpec) -> None:
     elif spec.kind == "uv":
         await _install_uv(spec)
     elif spec.kind == "download":
-        await _install_download(spec)
+        await _install_download(spec, session)
     else:
         raise ValueError(f"Unknown install kind: {spec.kind}")
 
@@ -90,14 +144,8 @@ async def _install_brew(spec: SkillInstallSpec) -> None:
         raise ValueError("brew install requires 'formula'")
     
     # Check if already installed
-    check_proc = await asyncio.create_subprocess_exec(
-        "brew", "list", spec.formula,
-        stdout=asyncio.subprocess.PIPE,
-        stderr=asyncio.subprocess.PIPE
-    )
-    await check_proc.wait()
-    
-    if check_proc.returncode == 0:
+    formula_name = spec.formula.rsplit('/', 1)[-1]
+    if formula_name in await _get_installed_brew():
         logger.debug(f"Brew formula {spec.formula} already installed")
         return
     
@@ -112,6 +160,8 @@ async def _install_brew(spec: SkillInstallSpec) -> None:
     
     if proc.returncode != 0:
         raise RuntimeError(f"brew install failed: {stderr.decode()}")
+    
+    _installed_packages.setdefault("brew", set()).add(formula_name)
 
 
 async def _install_node(spec: SkillInstallSpec) -> None:
@@ -120,14 +170,8 @@ async def _install_node(spec: SkillInstallSpec) -> None:
         raise ValueError("node install requires 'package'")
     
     # Check if already installed
-    check_proc = await asyncio.create_subprocess_exec(
-        "npm", "list", "-g", spec.package,
-        stdout=asyncio.subprocess.PIPE,
-        stderr=asyncio.subprocess.PIPE
-    )
-    await check_proc.wait()
-    
-    if check_proc.returncode == 0:
+    package_name = _npm_package_name(spec.package)
+    if package_name in await _get_installed_npm():
         logger.debug(f"npm package {spec.package} already installed")
         return
     
@@ -142,6 +186,61 @@ async def _install_node(spec: SkillInstallSpec) -> None:
     
     if proc.returncode != 0:
         raise RuntimeError(f"npm install failed: {stderr.decode()}")
+    
+    _installed_packages.setdefault("npm", set()).add(package_name)
+
+
+async def _list_installed(backend: str, *args: str) -> set[str]:
+    """
+    List installed packages for a backend with a single subprocess.
+    
+    The result is cached for the process lifetime (updated as installs
+    succeed), so checking N specs costs one spawn instead of N. Callers
+    hold the backend's lock (see install_skill_dependencies), so a backend
+    is not listed twice at once within one install.
+    """
+    cached = _installed_packages.get(backend)
+    if cached is not None:
+        return cached
+    
+    # Only stdout is parsed; stderr goes to DEVNULL rather than an unread pipe
+    proc = await asyncio.create_subprocess_exec(
+        *args,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.DEVNULL
+    )
+    stdout, _ = await proc.communicate()
+    
+    lines = stdout.decode(errors="replace").splitlines() if proc.returncode == 0 else []
+    if backend == "npm":
+        # --parseable prints install paths; the first line is the prefix itself
+        paths = (line.replace("\\", "/") for line in lines)
+        names = {
+            path.split("node_modules/", 1)[1]
+            for path in paths
+            if "node_modules/" in path
+        }
+    else:
+        names = {line.strip() for line in lines if line.strip()}
+    
+    _installed_packages[backend] = names
+    return names
+
+
+async def _get_installed_brew() -> set[str]:
+    """Installed Homebrew formulae (one `brew list` per process)"""
+    return await _list_installed("brew", "brew", "list", "--formula", "-1")
+
+
+async def _get_installed_npm() -> set[str]:
+    """Globally installed npm packages (one `npm ls -g` per process)"""
+    return await _list_installed("npm", "npm", "ls", "-g", "--depth=0", "--parseable")
+
+
+def _npm_package_name(package: str) -> str:
+    """Strip a version/tag suffix: "@scope/pkg@1.2" -> "@scope/pkg" """
+    at = package.find("@", 1)
+    return package[:at] if at > 0 else package
 
 
 async def _install_go(spec: SkillInstallSpec) -> None:
@@ -178,8 +277,11 @@ async def _install_uv(spec: SkillInstallSpec) -> None:
         raise RuntimeError(f"uv pip install failed: {stderr.decode()}")
 
 
-async def _install_download(spec: SkillInstallSpec) -> None:
-    """Download and extract from URL"""
+async def _install_download(
+    spec: SkillInstallSpec,
+    session: aiohttp.ClientSession | None = None
+) -> None:
+    """Download and extract from URL (using the shared session if given)"""
     if not spec.url:
         raise ValueError("download install requires 'url'")
     
@@ -189,68 +291,139 @@ async def _install_download(spec: SkillInstallSpec) -> None:
     target_path = Path(spec.target_dir).expanduser()
     target_path.mkdir(parents=True, exist_ok=True)
     
-    # Download to temp file
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        filename = spec.url.split('/')[-1]
-        download_path = temp_path / filename
-        
-        # Download
-        async with aiohttp.ClientSession() as session:
-            async with session.get(spec.url) as response:
-                response.raise_for_status()
-                content = await response.read()
-                download_path.write_bytes(content)
+    filename = spec.url.split('/')[-1]
+    is_tar = filename.endswith('.tar.gz') or filename.endswith('.tgz')
+    is_zip = filename.endswith('.zip')
+    if spec.extract and not (is_tar or is_zip):
+        raise ValueError(f"Unsupported archive format: {filename}")
+    
+    if session is None:
+        async with aiohttp.ClientSession() as own_session:
+            await _download_to(own_session, spec, target_path, filename, is_tar)
+    else:
+        await _download_to(session, spec, target_path, filename, is_tar)
+    
+    logger.info(f"Downloaded and extracted to {target_path}")
+
+
+async def _download_to(
+    session: aiohttp.ClientSession,
+    spec: SkillInstallSpec,
+    target_path: Path,
+    filename: str,
+    is_tar: bool,
+) -> None:
+    """Fetch spec.url and extract or copy it into target_path"""
+    async with session.get(spec.url) as response:
+        response.raise_for_status()
         
-        # Extract if needed
-        if spec.extract:
-            if filename.endswith('.tar.gz') or filename.endswith('.tgz'):
-                with tarfile.open(download_path, 'r:gz') as tar:
-                    # Extract with strip_components
-                    _extract_tar_strip(tar, target_path, spec.strip_components)
-            elif filename.endswith('.zip'):
-                with zipfile.ZipFile(download_path, 'r') as zip_ref:
-                    # Extract with strip_components
-                    _extract_zip_strip(zip_ref, target_path, spec.strip_components)
-            else:
-                raise ValueError(f"Unsupported archive format: {filename}")
+        if spec.extract and is_tar:
+            # Tarballs extract as they arrive: no temp file, and the
+            # download overlaps with decompression
+            await _stream_extract_tar(response, target_path, spec.strip_components)
         else:
-            # Just copy the file
-            shutil.copy(download_path, target_path / filename)
+            # Zip needs seeking, so it still goes through a temp file
+            with tempfile.TemporaryDirectory() as temp_dir:
+                download_path = Path(temp_dir) / filename
+                
+                # Download, streaming to disk so memory stays bounded by one chunk
+                async with aiofiles.open(download_path, 'wb') as f:
+                    async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                        await f.write(chunk)
+                
+                if spec.extract:
+                    await asyncio.to_thread(
+                        _extract_zip_file, download_path, target_path, spec.strip_components
+                    )
+                else:
+                    # Just copy the file
+                    await asyncio.to_thread(shutil.copy, download_path, target_path / filename)
+
+
+async def _stream_extract_tar(
+    response: aiohttp.ClientResponse,
+    target: Path,
+    strip: int,
+) -> None:
+    """
+    Pipe a .tar.gz response into a streaming ('r|gz') extractor thread.
     
-    logger.info(f"Downloaded and extracted to {target_path}")
+    Extraction runs off the event loop and consumes chunks while the
+    download is still in progress.
+    """
+    read_fd, write_fd = os.pipe()
+    
+    def _extract() -> None:
+        with os.fdopen(read_fd, 'rb') as reader:
+            with tarfile.open(fileobj=reader, mode='r|gz') as tar:
+                _extract_tar_strip(tar, target, strip)
+    
+    extract_task = asyncio.ensure_future(asyncio.to_thread(_extract))
+    try:
+        async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+            await asyncio.to_thread(_write_all, write_fd, chunk)
+    except BrokenPipeError:
+        # Extractor stopped reading early; its own error is raised below
+        pass
+    except BaseException:
+        os.close(write_fd)
+        write_fd = -1
+        await asyncio.gather(extract_task, return_exceptions=True)
+        raise
+    finally:
+        if write_fd >= 0:
+            os.close(write_fd)
+    
+    await extract_task
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """Write all of data to a (blocking) file descriptor"""
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+def _strip_tar_members(members: Any, strip: int) -> Any:
+    """Yield tar members with `strip` leading path components removed"""
+    for member in members:
+        parts = member.name.split('/', strip)
+        if len(parts) <= strip or not parts[strip]:
+            continue
+        member.name = parts[strip]
+        yield member
 
 
 def _extract_tar_strip(tar: tarfile.TarFile, target: Path, strip: int) -> None:
     """Extract tar with strip components"""
-    for member in tar.getmembers():
-        # Strip leading components
-        parts = member.name.split('/')
-        if len(parts) <= strip:
-            continue
-        
-        new_name = '/'.join(parts[strip:])
-        member.name = new_name
-        tar.extract(member, target)
+    # Lazily iterate the archive (not getmembers()) so streaming mode works,
+    # and let extractall drive the loop
+    members = _strip_tar_members(tar, strip)
+    if hasattr(tarfile, "data_filter"):
+        tar.extractall(target, members=members, filter="data")
+    else:
+        tar.extractall(target, members=members)
+
+
+def _extract_zip_file(zip_path: Path, target: Path, strip: int) -> None:
+    """Open a downloaded zip and extract it with strip components"""
+    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+        _extract_zip_strip(zip_ref, target, strip)
 
 
 def _extract_zip_strip(zip_ref: zipfile.ZipFile, target: Path, strip: int) -> None:
     """Extract zip with strip components"""
-    for member in zip_ref.namelist():
+    members = []
+    for info in zip_ref.infolist():
         # Strip leading components
-        parts = member.split('/')
-        if len(parts) <= strip:
+        parts = info.filename.split('/', strip)
+        if len(parts) <= strip or not parts[strip]:
             continue
-        
-        new_name = '/'.join(parts[strip:])
-        target_path = target / new_name
-        
-        if member.endswith('/'):
-            target_path.mkdir(parents=True, exist_ok=True)
-        else:
-            target_path.parent.mkdir(parents=True, exist_ok=True)
-            with zip_ref.open(member) as source:
-                target_path.write_bytes(source.read())
+        info.filename = parts[strip]
+        members.append(info)
+    
+    zip_ref.extractall(target, members)
 
 
 def _get_platform() -> str:
@@ -12,6 +12,15 @@ from .types import SkillEntry
 
 logger = logging.getLogger(__name__)
 
+# Single-pass escape table for _escape_xml
+_XML_ESCAPE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&apos;",
+})
+
 
 def format_skills_for_prompt(
     skill_entries: list[SkillEntry],
@@ -41,30 +50,28 @@ def format_skills_for_prompt(
     if not skill_entries:
         return ""
     
-    # Build skill entries
-    skill_items = []
-    for entry in skill_entries:
-        skill = entry.skill
-        
-        # Skip skills that are disabled for model invocation
-        if skill.disable_model_invocation:
-            continue
-        
-        skill_item = f"""  <skill>
-    <name>{_escape_xml(skill.name)}</name>
-    <description>{_escape_xml(skill.description)}</description>
-    <location>{_escape_xml(skill.file_path)}</location>
-  </skill>"""
-        skill_items.append(skill_item)
-    
-    if not skill_items:
+    # Skip skills that are disabled for model invocation before any escaping
+    entries = [e for e in skill_entries if not e.skill.disable_model_invocation]
+    if not entries:
         return ""
     
-    skills_xml = "\n".join(skill_items)
+    # Append fragments and join once, rather than per-skill f-strings
+    # joined and then wrapped in another f-string
+    esc = _escape_xml
+    out = ["<available_skills>\n"]
+    append = out.append
+    for entry in entries:
+        skill = entry.skill
+        append("  <skill>\n    <name>")
+        append(esc(skill.name))
+        append("</name>\n    <description>")
+        append(esc(skill.description))
+        append("</description>\n    <location>")
+        append(esc(skill.file_path))
+        append("</location>\n  </skill>\n")
+    append("</available_skills>")
     
-    return f"""<available_skills>
-{skills_xml}
-</available_skills>"""
+    return "".join(out)
 
 
 def build_skills_section_instructions(read_tool_name: str = "read") -> str:
@@ -98,15 +105,7 @@ def _escape_xml(text: str) -> str:
     Returns:
         XML-escaped text
     """
-    if not text:
-        return ""
-    
-    return (text
-        .replace("&", "&amp;")
-        .replace("<", "&lt;")
-        .replace(">", "&gt;")
-        .replace('"', "&quot;")
-        .replace("'", "&apos;"))
+    return text.translate(_XML_ESCAPE) if text else ""
 
 
 __all__ = [
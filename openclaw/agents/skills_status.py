@@ -6,11 +6,17 @@ Aligned with openclaw/src/agents/skills-status.ts
 from __future__ import annotations
 
 import logging
+import os
 from pathlib import Path
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# skills_dir -> (st_mtime_ns, ((subdir path, st_mtime_ns), ...), skill names, name set)
+_skill_names_cache: dict[
+    Path, tuple[int, tuple[tuple[str, int], ...], list[str], frozenset[str]]
+] = {}
+
 
 def build_workspace_skill_status(
     workspace_dir: Path,
@@ -37,11 +43,10 @@ def build_workspace_skill_status(
             
             # Parse basic skill metadata from SKILL.md
             try:
+                # Only the first line is used as description; don't read the rest
                 with open(skill_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    # Extract first line as description
-                    first_line = content.split('\n')[0] if content else ""
-                    description = first_line.strip('# ').strip()
+                    first_line = f.readline().rstrip('\r\n')
+                description = first_line.strip('# ').strip()
             except Exception as e:
                 logger.warning(f"Failed to parse skill {skill_name}: {e}")
                 description = ""
@@ -85,20 +90,64 @@ def build_workspace_skill_status(
     }
 
 
+def _load_skill_names(skills_dir: Path) -> tuple[list[str], frozenset[str]]:
+    """
+    List skill directories (those containing SKILL.md), cached per skills dir
+    
+    The cache is keyed on the mtime of the skills dir (skill directories
+    added or removed) and of each subdirectory (SKILL.md added or removed
+    inside one), so revalidating costs a stat per subdirectory rather
+    than a listing plus a SKILL.md probe each.
+    """
+    try:
+        mtime = skills_dir.stat().st_mtime_ns
+    except (FileNotFoundError, NotADirectoryError):
+        _skill_names_cache.pop(skills_dir, None)
+        return [], frozenset()
+    
+    cached = _skill_names_cache.get(skills_dir)
+    if cached is not None and cached[0] == mtime and _subdirs_unchanged(cached[1]):
+        return cached[2], cached[3]
+    
+    subdirs = []
+    names = []
+    with os.scandir(skills_dir) as it:
+        for entry in it:
+            if not entry.is_dir():
+                continue
+            try:
+                subdirs.append((entry.path, entry.stat().st_mtime_ns))
+            except OSError:
+                continue
+            if os.path.isfile(os.path.join(entry.path, "SKILL.md")):
+                names.append(entry.name)
+    
+    name_set = frozenset(names)
+    _skill_names_cache[skills_dir] = (mtime, tuple(subdirs), names, name_set)
+    return names, name_set
+
+
+def _subdirs_unchanged(subdirs: tuple[tuple[str, int], ...]) -> bool:
+    try:
+        return all(os.stat(path).st_mtime_ns == mtime for path, mtime in subdirs)
+    except OSError:
+        return False
+
+
 def list_skill_names(workspace_dir: Path) -> list[str]:
     """List all skill names in workspace"""
-    skills_dir = workspace_dir / ".openclaw" / "skills"
-    if not skills_dir.exists():
-        return []
-    
-    return [p.parent.name for p in skills_dir.glob("*/SKILL.md")]
+    names, _ = _load_skill_names(workspace_dir / ".openclaw" / "skills")
+    return list(names)
 
 
 def get_skill_path(workspace_dir: Path, skill_name: str) -> Path | None:
     """Get skill path by name"""
     skills_dir = workspace_dir / ".openclaw" / "skills"
-    skill_path = skills_dir / skill_name / "SKILL.md"
+    _, name_set = _load_skill_names(skills_dir)
     
-    if skill_path.exists():
-        return skill_path
+    if skill_name in name_set:
+        # Checked live too: the file may have gone within the mtime granularity
+        skill_path = skills_dir / skill_name / "SKILL.md"
+        if skill_path.is_file():
+            return skill_path
     return None
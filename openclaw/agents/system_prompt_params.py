@@ -7,16 +7,45 @@ for use in system prompt construction.
 
 from __future__ import annotations
 
+import functools
 import logging
 import os
 import platform
 import socket
+import stat
 import sys
+from datetime import datetime
 from pathlib import Path
 
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:  # zoneinfo or its tzdata unavailable
+    ZoneInfo = None  # type: ignore
+
 logger = logging.getLogger(__name__)
 
 
+def _probe_host() -> str:
+    try:
+        return socket.gethostname()
+    except Exception:
+        return "unknown"
+
+
+def _probe_platform(probe) -> str:
+    try:
+        return probe().lower()
+    except Exception:
+        return "unknown"
+
+
+# Process-invariant runtime facts, probed once at import
+_HOST = _probe_host()
+_OS = _probe_platform(platform.system)
+_ARCH = _probe_platform(platform.machine)
+_PY_VERSION = f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
+
+
 def build_system_prompt_params(
     config: dict | None = None,
     workspace_dir: Path | None = None,
@@ -67,17 +96,17 @@ def build_system_prompt_params(
     )
     
     # Find repo root
-    repo_root = None
+    repo_root_str = None
     if workspace_dir:
         repo_root = resolve_repo_root(workspace_dir)
-    
-    if repo_root:
-        runtime_info["repo_root"] = str(repo_root)
+        if repo_root:
+            repo_root_str = str(repo_root)
+            runtime_info["repo_root"] = repo_root_str
     
     return {
         "user_timezone": user_timezone,
         "runtime_info": runtime_info,
-        "repo_root": str(repo_root) if repo_root else None
+        "repo_root": repo_root_str
     }
 
 
@@ -110,25 +139,12 @@ def get_runtime_info(
         - channel: str | None
         - capabilities: list[str] | None
     """
-    # Get hostname
-    try:
-        host = socket.gethostname()
-    except Exception:
-        host = "unknown"
-    
-    # Get OS and architecture
-    os_name = platform.system().lower()
-    arch = platform.machine().lower()
-    
-    # Get Python version
-    python_version = f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
-    
     result = {
         "agent_id": agent_id,
-        "host": host,
-        "os": os_name,
-        "arch": arch,
-        "python_version": python_version,
+        "host": _HOST,
+        "os": _OS,
+        "arch": _ARCH,
+        "python_version": _PY_VERSION,
         "model": model,
         "channel": channel,
     }
@@ -146,36 +162,84 @@ def resolve_repo_root(start_dir: Path) -> Path | None:
     """
     Find git repository root by walking up directories
     
+    Found roots are memoized per absolute start directory, since agent
+    turns keep asking for the root of the same workspace. Misses are not
+    cached, so a workspace that is git-init'ed later is picked up.
+    
     Args:
         start_dir: Directory to start searching from
     
     Returns:
         Path to git root, or None if not found
     """
-    current = start_dir.resolve()
+    start_str = os.path.abspath(start_dir)
+    root = _repo_root_cache.get(start_str)
+    if root is None:
+        root = _find_repo_root(start_str)
+        if root is not None:
+            if len(_repo_root_cache) >= _REPO_ROOT_CACHE_MAX:
+                _repo_root_cache.pop(next(iter(_repo_root_cache)))
+            _repo_root_cache[start_str] = root
+    return root
+
+
+# Absolute start directory -> git root, positive results only
+_REPO_ROOT_CACHE_MAX = 64
+_repo_root_cache: dict[str, Path] = {}
+
+
+def _find_repo_root(start_str: str) -> Path | None:
+    """Uncached body of resolve_repo_root, on plain path strings"""
+    current = os.path.realpath(start_str)
+    
+    # Like git (without GIT_DISCOVERY_ACROSS_FILESYSTEM), don't walk past
+    # a mount point: a .git beyond it is not this workspace's repo
+    try:
+        start_dev = os.stat(current).st_dev
+    except OSError:
+        start_dev = None
     
     # Walk up to 12 levels
     for _ in range(12):
-        git_path = current / ".git"
-        
         try:
-            if git_path.exists() and (git_path.is_dir() or git_path.is_file()):
+            if _probe_git(os.path.join(current, ".git")):
                 logger.debug(f"Found git root: {current}")
-                return current
+                return Path(current)
         except Exception as e:
             logger.debug(f"Error checking .git at {current}: {e}")
         
         # Move to parent
-        parent = current.parent
+        parent = os.path.dirname(current)
         if parent == current:
             # Reached filesystem root
             break
+        if start_dev is not None:
+            try:
+                if os.stat(parent).st_dev != start_dev:
+                    # current is a mount point
+                    break
+            except OSError:
+                break
         current = parent
     
-    logger.debug(f"No git root found starting from {start_dir}")
+    logger.debug(f"No git root found starting from {start_str}")
     return None
 
 
+def _probe_git(path: str) -> bool:
+    """
+    Check for a .git directory (repo) or file (worktree/submodule).
+    
+    One stat whose mode answers both questions, instead of pathlib's
+    exists() + is_dir() + is_file() sequence.
+    """
+    try:
+        mode = os.stat(path).st_mode
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+    return stat.S_ISDIR(mode) or stat.S_ISREG(mode)
+
+
 def resolve_user_timezone(timezone_config: str | None = None) -> str:
     """
     Resolve user timezone from config or system
@@ -184,27 +248,50 @@ def resolve_user_timezone(timezone_config: str | None = None) -> str:
     Returns IANA timezone identifier (e.g., 'America/New_York')
     Falls back to system timezone, then UTC if detection fails
     
+    The result is memoized per (trimmed) config value, since the system
+    timezone does not change during the process lifetime.
+    
     Args:
         timezone_config: Timezone string from config (e.g., "America/New_York")
     
     Returns:
         Resolved IANA timezone string (never None, defaults to "UTC")
     """
+    trimmed = timezone_config.strip() if timezone_config else ""
+    return _resolve_user_timezone_cached(trimmed)
+
+
+def _reset_tz_cache() -> None:
+    """Clear memoized timezone resolution (for tests)"""
+    _resolve_user_timezone_cached.cache_clear()
+    _is_valid_timezone.cache_clear()
+
+
+@functools.lru_cache(maxsize=64)
+def _is_valid_timezone(key: str) -> bool:
+    """Check whether key names a zone known to zoneinfo"""
+    if ZoneInfo is None:
+        return False
+    try:
+        ZoneInfo(key)
+        return True
+    except Exception:
+        return False
+
+
+@functools.lru_cache(maxsize=16)
+def _resolve_user_timezone_cached(trimmed: str) -> str:
+    """Uncached body of resolve_user_timezone; trimmed is "" when unset"""
     # If configured timezone is provided, validate it
-    trimmed = timezone_config.strip() if timezone_config else None
     if trimmed:
-        try:
-            # Try to validate with zoneinfo (Python 3.9+)
-            try:
-                from zoneinfo import ZoneInfo
-                ZoneInfo(trimmed)
+        if ZoneInfo is None:
+            # Fallback if zoneinfo not available
+            # Just basic validation
+            if "/" in trimmed or trimmed == "UTC":
                 return trimmed
-            except ImportError:
-                # Fallback for Python < 3.9 or if zoneinfo not available
-                # Just basic validation
-                if "/" in trimmed or trimmed == "UTC":
-                    return trimmed
-        except Exception:
+        elif _is_valid_timezone(trimmed):
+            return trimmed
+        else:
             # Invalid timezone, fall through to auto-detection
             logger.debug(f"Invalid timezone: {trimmed}, falling back to auto-detection")
     
@@ -213,75 +300,53 @@ def resolve_user_timezone(timezone_config: str | None = None) -> str:
         # Try to get IANA timezone from system
         # On Unix-like systems, check TZ environment variable first
         tz_env = os.environ.get('TZ', '').strip()
-        if tz_env and "/" in tz_env:
-            try:
-                from zoneinfo import ZoneInfo
-                ZoneInfo(tz_env)
-                return tz_env
-            except Exception:
-                pass
+        if tz_env and "/" in tz_env and _is_valid_timezone(tz_env):
+            return tz_env
         
-        # Try to detect from system configuration
-        # This is a best-effort approach
+        # tzlocal, when installed, knows every platform's configuration
         try:
-            import time
-            # Try tzname first
-            if hasattr(time, 'tzname') and time.tzname and time.tzname[0]:
-                # Convert abbreviation to IANA if possible
-                # This is imperfect but better than nothing
-                tz_abbr = time.tzname[0]
-                # Some common mappings
-                abbr_map = {
-                    'EST': 'America/New_York',
-                    'EDT': 'America/New_York',
-                    'CST': 'America/Chicago',
-                    'CDT': 'America/Chicago',
-                    'MST': 'America/Denver',
-                    'MDT': 'America/Denver',
-                    'PST': 'America/Los_Angeles',
-                    'PDT': 'America/Los_Angeles',
-                }
-                if tz_abbr in abbr_map:
-                    return abbr_map[tz_abbr]
+            import tzlocal
+            tz = tzlocal.get_localzone_name()
+            if tz:
+                return tz
         except Exception:
             pass
         
-        # Try platform-specific detection
-        if platform.system() == 'Darwin':  # macOS
-            try:
-                import subprocess
-                result = subprocess.check_output(
-                    ['defaults', 'read', '/Library/Preferences/.GlobalPreferences.plist', 'com.apple.TimeZone'],
-                    stderr=subprocess.DEVNULL,
-                    timeout=1
-                ).decode('utf-8').strip()
-                if result and "/" in result:
-                    return result
-            except Exception:
-                pass
-        elif platform.system() == 'Linux':
-            # Try to read /etc/timezone
-            try:
-                with open('/etc/timezone', 'r') as f:
-                    tz = f.read().strip()
-                    if tz and "/" in tz:
-                        return tz
-            except Exception:
-                pass
-            
-            # Try to resolve /etc/localtime symlink
-            try:
-                localtime = Path('/etc/localtime')
-                if localtime.is_symlink():
-                    target = localtime.resolve()
-                    # Extract timezone from path like /usr/share/zoneinfo/America/New_York
-                    target_str = str(target)
-                    if 'zoneinfo/' in target_str:
-                        tz = target_str.split('zoneinfo/')[-1]
-                        if "/" in tz:
-                            return tz
-            except Exception:
-                pass
+        # Linux: /etc/timezone names the zone directly
+        try:
+            with open('/etc/timezone', 'r') as f:
+                tz = f.read().strip()
+                if tz and "/" in tz:
+                    return tz
+        except Exception:
+            pass
+        
+        # Linux and macOS: /etc/localtime links into a zoneinfo tree,
+        # e.g. /usr/share/zoneinfo/America/New_York (no subprocess needed)
+        try:
+            target = os.path.realpath('/etc/localtime')
+            if 'zoneinfo/' in target:
+                tz = target.split('zoneinfo/')[-1]
+                if "/" in tz:
+                    return tz
+        except Exception:
+            pass
+        
+        # Last resort: map the abbreviation of the local UTC offset.
+        # Ambiguous, so only consulted after the exact sources above.
+        tz_abbr = datetime.now().astimezone().tzname()
+        abbr_map = {
+            'EST': 'America/New_York',
+            'EDT': 'America/New_York',
+            'CST': 'America/Chicago',
+            'CDT': 'America/Chicago',
+            'MST': 'America/Denver',
+            'MDT': 'America/Denver',
+            'PST': 'America/Los_Angeles',
+            'PDT': 'America/Los_Angeles',
+        }
+        if tz_abbr in abbr_map:
+            return abbr_map[tz_abbr]
     except Exception as e:
         logger.debug(f"Failed to auto-detect timezone: {e}")
     
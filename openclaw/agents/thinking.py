@@ -14,6 +14,7 @@ Matches pi-mono's thinking support but adapted for Python.
 from __future__ import annotations
 
 import re
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -34,7 +35,7 @@ class ThinkingLevel(str, Enum):
     XHIGH = "xhigh"  # Maximum thinking budget (slowest, most thorough)
 
 
-@dataclass
+@dataclass(slots=True)
 class ThinkingState:
     """
     State for streaming thinking extraction.
@@ -42,17 +43,44 @@ class ThinkingState:
     Tracks:
     - Whether we're currently inside a thinking block
     - Accumulated thinking text
-    - Buffer for incomplete tags
+    - Buffer for incomplete tags (unconsumed text starts at tag_offset)
+    - Closing tag of the currently open block
+    
+    High-throughput callers can reuse states via acquire()/release()
+    instead of allocating one per stream; release a state only after its
+    stream has ended and its thinking_buffer is no longer needed.
     """
     in_thinking: bool = False
     thinking_buffer: list[str] = field(default_factory=list)
     tag_buffer: str = ""
+    tag_offset: int = 0
+    end_tag: str | None = None
     
     def reset(self) -> None:
         """Reset state"""
         self.in_thinking = False
         self.thinking_buffer.clear()
         self.tag_buffer = ""
+        self.tag_offset = 0
+        self.end_tag = None
+    
+    @classmethod
+    def acquire(cls) -> ThinkingState:
+        """Take a clean state from the pool, or create one"""
+        try:
+            return _STATE_POOL.pop()
+        except IndexError:
+            return cls()
+    
+    def release(self) -> None:
+        """Reset this state and return it to the pool"""
+        self.reset()
+        _STATE_POOL.append(self)
+
+
+# Drained ThinkingStates kept for reuse. deque append/pop are atomic, so
+# no lock is needed; maxlen bounds how many idle states are retained.
+_STATE_POOL: deque[ThinkingState] = deque(maxlen=64)
 
 
 class ThinkingExtractor:
@@ -106,9 +134,41 @@ class ThinkingExtractor:
         if custom_tags:
             self.start_tag = custom_tags[0]
             self.end_tag = custom_tags[1]
+            tag_pairs = [(self.start_tag, self.end_tag)]
         else:
             self.start_tag = self.THINKING_START_TAG
             self.end_tag = self.THINKING_END_TAG
+            tag_pairs = [
+                (self.start_tag, self.end_tag),
+                *zip(self.ALT_TAGS["start"], self.ALT_TAGS["end"]),
+            ]
+        
+        # Every recognised start tag, mapped to its closing tag, and one
+        # alternation that finds whichever comes first in a single scan
+        self._end_tags = dict(tag_pairs)
+        self._start_re = re.compile("|".join(map(re.escape, self._end_tags)))
+        
+        # Every prefix of every start/end tag, so _could_be_tag_start is a
+        # single set lookup
+        start_tags = (self.start_tag, *self.ALT_TAGS["start"])
+        end_tags = (self.end_tag, *self.ALT_TAGS["end"])
+        self._start_prefixes = frozenset(
+            tag[:i] for tag in start_tags for i in range(len(tag) + 1)
+        )
+        self._end_prefixes = frozenset(
+            tag[:i] for tag in end_tags for i in range(len(tag) + 1)
+        )
+        self._max_tag_len = max(map(len, start_tags + end_tags))
+        
+        # Block pattern for extract_complete, compiled once per extractor;
+        # one capture group per tag pair
+        self._pattern = re.compile(
+            "|".join(
+                re.escape(start) + r"(.*?)" + re.escape(end)
+                for start, end in tag_pairs
+            ),
+            re.DOTALL,
+        )
     
     def extract_streaming(
         self,
@@ -147,65 +207,80 @@ class ThinkingExtractor:
             # Returns: (" analyze", "The answer is") - exited thinking, content starts
             ```
         """
-        # Add delta to buffer
-        state.tag_buffer += delta
+        # Add delta to buffer. Consumed text is skipped by advancing pos
+        # rather than re-slicing the buffer after every tag.
+        buffer = state.tag_buffer + delta
+        pos = state.tag_offset
+        start_re = self._start_re
         
         thinking_delta: str | None = None
         content_delta: str | None = None
         
         # Process buffer
-        while state.tag_buffer:
+        while pos < len(buffer):
             if not state.in_thinking:
                 # Look for start tag
-                start_pos = state.tag_buffer.find(self.start_tag)
+                match = start_re.search(buffer, pos)
                 
-                if start_pos == -1:
+                if match is None:
                     # No start tag found
                     # Check if buffer could be start of tag
-                    if self._could_be_tag_start(state.tag_buffer):
+                    if self._could_be_tag_start(buffer, start=pos):
                         # Keep buffer as is, wait for more
                         break
                     else:
                         # Not a tag, emit as content
-                        content_delta = state.tag_buffer
-                        state.tag_buffer = ""
+                        content_delta = buffer[pos:]
+                        buffer, pos = "", 0
                         break
                 else:
                     # Found start tag
                     # Everything before it is content
-                    if start_pos > 0:
-                        content_delta = state.tag_buffer[:start_pos]
+                    start_pos = match.start()
+                    if start_pos > pos:
+                        content_delta = buffer[pos:start_pos]
                     
-                    # Enter thinking mode
+                    # Enter thinking mode, closed by the matching end tag
                     state.in_thinking = True
-                    state.tag_buffer = state.tag_buffer[start_pos + len(self.start_tag):]
+                    state.end_tag = self._end_tags[match.group()]
+                    pos = match.end()
             
             else:
                 # Inside thinking block, look for end tag
-                end_pos = state.tag_buffer.find(self.end_tag)
+                end_tag = state.end_tag or self.end_tag
+                end_pos = buffer.find(end_tag, pos)
                 
                 if end_pos == -1:
                     # No end tag found
                     # Check if buffer could be start of end tag
-                    if self._could_be_tag_start(state.tag_buffer, is_end=True):
+                    if self._could_be_tag_start(buffer, is_end=True, start=pos):
                         # Keep buffer, wait for more
                         break
                     else:
                         # Not an end tag, emit as thinking
-                        thinking_delta = state.tag_buffer
-                        state.thinking_buffer.append(state.tag_buffer)
-                        state.tag_buffer = ""
+                        thinking_delta = buffer[pos:]
+                        state.thinking_buffer.append(thinking_delta)
+                        buffer, pos = "", 0
                         break
                 else:
                     # Found end tag
                     # Everything before it is thinking
-                    if end_pos > 0:
-                        thinking_delta = state.tag_buffer[:end_pos]
+                    if end_pos > pos:
+                        thinking_delta = buffer[pos:end_pos]
                         state.thinking_buffer.append(thinking_delta)
                     
                     # Exit thinking mode
                     state.in_thinking = False
-                    state.tag_buffer = state.tag_buffer[end_pos + len(self.end_tag):]
+                    state.end_tag = None
+                    pos = end_pos + len(end_tag)
+        
+        # Compact only once the consumed prefix dominates the buffer
+        if pos >= len(buffer):
+            buffer, pos = "", 0
+        elif pos > len(buffer) // 2:
+            buffer, pos = buffer[pos:], 0
+        state.tag_buffer = buffer
+        state.tag_offset = pos
         
         return thinking_delta, content_delta
     
@@ -229,14 +304,13 @@ class ThinkingExtractor:
             ```
         """
         # Use regex to find all thinking blocks
-        pattern = re.escape(self.start_tag) + r"(.*?)" + re.escape(self.end_tag)
-        matches = re.findall(pattern, text, re.DOTALL)
+        matches = [m.group(m.lastindex) for m in self._pattern.finditer(text)]
         
         # Combine all thinking blocks
         thinking = "\n".join(matches) if matches else ""
         
         # Remove thinking blocks from text to get content
-        content = re.sub(pattern, "", text, flags=re.DOTALL)
+        content = self._pattern.sub("", text)
         
         # Clean up extra whitespace
         thinking = thinking.strip()
@@ -244,7 +318,7 @@ class ThinkingExtractor:
         
         return thinking, content
     
-    def _could_be_tag_start(self, buffer: str, is_end: bool = False) -> bool:
+    def _could_be_tag_start(self, buffer: str, is_end: bool = False, start: int = 0) -> bool:
         """
         Check if buffer could be the start of a tag.
         
@@ -254,23 +328,19 @@ class ThinkingExtractor:
         Args:
             buffer: Current buffer
             is_end: Whether checking for end tag
+            start: Offset of the unconsumed text in buffer
             
         Returns:
             True if buffer could be start of tag
         """
-        tag = self.end_tag if is_end else self.start_tag
-        
-        # Check if tag starts with buffer
-        if tag.startswith(buffer):
-            return True
-        
-        # Check alternative tags
-        alt_tags = self.ALT_TAGS["end"] if is_end else self.ALT_TAGS["start"]
-        for alt_tag in alt_tags:
-            if alt_tag.startswith(buffer):
-                return True
+        # Anything longer than the longest tag cannot be a tag prefix;
+        # check before slicing so a large buffer is never copied
+        if len(buffer) - start > self._max_tag_len:
+            return False
+        if start:
+            buffer = buffer[start:]
         
-        return False
+        return buffer in (self._end_prefixes if is_end else self._start_prefixes)
 
 
 class ThinkingMode(str, Enum):
@@ -285,6 +355,17 @@ class ThinkingMode(str, Enum):
     STREAM = "stream"  # Stream thinking separately from content
 
 
+# Approximate token budget per thinking level
+_THINKING_BUDGETS: dict[ThinkingLevel, int] = {
+    ThinkingLevel.OFF: 0,
+    ThinkingLevel.MINIMAL: 1000,
+    ThinkingLevel.LOW: 2000,
+    ThinkingLevel.MEDIUM: 4000,
+    ThinkingLevel.HIGH: 8000,
+    ThinkingLevel.XHIGH: 16000,
+}
+
+
 def get_thinking_budget(level: ThinkingLevel) -> int | None:
     """
     Get thinking token budget for level.
@@ -298,15 +379,7 @@ def get_thinking_budget(level: ThinkingLevel) -> int | None:
     Returns:
         Token budget or None for default
     """
-    budgets = {
-        ThinkingLevel.OFF: 0,
-        ThinkingLevel.MINIMAL: 1000,
-        ThinkingLevel.LOW: 2000,
-        ThinkingLevel.MEDIUM: 4000,
-        ThinkingLevel.HIGH: 8000,
-        ThinkingLevel.XHIGH: 16000,
-    }
-    return budgets.get(level, 0)
+    return _THINKING_BUDGETS.get(level, 0)
 
 
 __all__ = [
@@ -5,11 +5,19 @@ Aligned with openclaw/src/agents/pi-tool-definition-adapter.ts
 """
 from __future__ import annotations
 
+import inspect
 import logging
 from typing import Any, Callable, Awaitable
 
 logger = logging.getLogger(__name__)
 
+# Tool names handled natively by the SDK (see split_sdk_tools)
+_BUILTIN_TOOL_NAMES: frozenset[str] = frozenset({
+    "read", "write", "edit", "search",
+    "exec", "bash", "shell",
+    "list_files", "glob",
+})
+
 
 class ToolDefinitionAdapter:
     """
@@ -66,30 +74,33 @@ class ToolDefinitionAdapter:
         Returns:
             Wrapped execute function
         """
-        async def wrapped(**kwargs):
-            try:
-                # Handle both sync and async execute functions
-                result = execute_fn(**kwargs)
-                
-                # Await if coroutine
-                if hasattr(result, '__await__'):
-                    result = await result
-                
-                # Ensure result is in standard format
-                if not isinstance(result, dict):
-                    result = {"content": str(result), "success": True}
-                elif "success" not in result:
-                    result["success"] = True
-                
-                return result
-                
-            except Exception as e:
-                logger.error(f"Tool {tool_name} execution failed: {e}", exc_info=True)
-                return {
-                    "error": str(e),
-                    "success": False,
-                    "content": f"Error executing {tool_name}: {str(e)}"
-                }
+        def failure(e: Exception) -> dict[str, Any]:
+            logger.error(f"Tool {tool_name} execution failed: {e}", exc_info=True)
+            return {
+                "error": str(e),
+                "success": False,
+                "content": f"Error executing {tool_name}: {str(e)}"
+            }
+        
+        # Decide sync vs async once at wrap time rather than probing every result
+        if inspect.iscoroutinefunction(execute_fn):
+            async def wrapped(**kwargs):
+                try:
+                    return _normalize_result(await execute_fn(**kwargs))
+                except Exception as e:
+                    return failure(e)
+        else:
+            async def wrapped(**kwargs):
+                try:
+                    result = execute_fn(**kwargs)
+                    
+                    # Sync callables may still hand back an awaitable
+                    if inspect.isawaitable(result):
+                        result = await result
+                    
+                    return _normalize_result(result)
+                except Exception as e:
+                    return failure(e)
         
         return wrapped
     
@@ -104,22 +115,27 @@ class ToolDefinitionAdapter:
         Returns:
             (is_valid, error_message)
         """
-        # Check required fields
-        if "name" not in tool:
-            return False, "Tool missing 'name' field"
-        
-        if not isinstance(tool["name"], str):
+        # Check required fields (one lookup each; membership is only
+        # re-checked to tell a missing key from an explicit None)
+        name = tool.get("name")
+        if not isinstance(name, str):
+            if name is None and "name" not in tool:
+                return False, "Tool missing 'name' field"
             return False, "Tool 'name' must be string"
         
         # Check parameters structure if present
-        if "parameters" in tool:
-            params = tool["parameters"]
-            if not isinstance(params, dict):
+        params = tool.get("parameters")
+        if params is None:
+            if "parameters" in tool:
                 return False, "Tool 'parameters' must be dict"
-            
-            # Validate JSON Schema structure
-            if "type" in params and params["type"] != "object":
-                return False, "Tool parameters 'type' must be 'object'"
+            return True, None
+        
+        if not isinstance(params, dict):
+            return False, "Tool 'parameters' must be dict"
+        
+        # Validate JSON Schema structure
+        if params.get("type", "object") != "object":
+            return False, "Tool parameters 'type' must be 'object'"
         
         return True, None
     
@@ -140,15 +156,26 @@ class ToolDefinitionAdapter:
         Returns:
             Filtered tools
         """
-        filtered = tools
+        if allowed_names is None and blocked_names is None:
+            return tools
         
-        if allowed_names is not None:
-            filtered = [t for t in filtered if t["name"] in allowed_names]
+        # Set lookups, and a single pass applying both filters
+        allowed = frozenset(allowed_names) if allowed_names is not None else None
+        blocked = frozenset(blocked_names) if blocked_names is not None else frozenset()
         
-        if blocked_names is not None:
-            filtered = [t for t in filtered if t["name"] not in blocked_names]
-        
-        return filtered
+        return [
+            t for t in tools
+            if (allowed is None or t["name"] in allowed) and t["name"] not in blocked
+        ]
+
+
+def _normalize_result(result: Any) -> dict[str, Any]:
+    """Ensure a tool result is in standard format"""
+    if not isinstance(result, dict):
+        return {"content": str(result), "success": True}
+    if "success" not in result:
+        result["success"] = True
+    return result
 
 
 def sanitize_tools_for_provider(
@@ -167,20 +194,23 @@ def sanitize_tools_for_provider(
     Returns:
         Sanitized tools
     """
-    if provider.lower() in ["gemini", "google"]:
+    provider_lower = provider.lower()
+    
+    if provider_lower in ("gemini", "google"):
         # Gemini schema cleaning is handled in gemini_provider.py
         # using clean_schema_for_gemini() to remove unsupported keywords
         return tools
     
-    elif provider.lower() in ["anthropic", "claude"]:
+    elif provider_lower in ("anthropic", "claude"):
         # Anthropic requires input_schema instead of parameters
-        sanitized = []
-        for tool in tools:
-            sanitized_tool = tool.copy()
-            if "parameters" in sanitized_tool:
-                sanitized_tool["input_schema"] = sanitized_tool.pop("parameters")
-            sanitized.append(sanitized_tool)
-        return sanitized
+        if not any("parameters" in tool for tool in tools):
+            return tools
+        # Rename in one pass per tool rather than copy() + pop() + assign
+        return [
+            {("input_schema" if key == "parameters" else key): value for key, value in tool.items()}
+            if "parameters" in tool else tool.copy()
+            for tool in tools
+        ]
     
     # Default: return as-is
     return tools
@@ -200,21 +230,11 @@ def split_sdk_tools(
     Returns:
         Dict with "builtInTools" and "customTools" keys
     """
-    built_in_names = {
-        "read", "write", "edit", "search",
-        "exec", "bash", "shell",
-        "list_files", "glob",
-    }
-    
     built_in = []
     custom = []
     
     for tool in tools:
-        name = tool.get("name", "")
-        if name in built_in_names:
-            built_in.append(tool)
-        else:
-            custom.append(tool)
+        (built_in if tool.get("name", "") in _BUILTIN_TOOL_NAMES else custom).append(tool)
     
     return {
         "builtInTools": built_in,
@@ -7,8 +7,10 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import operator
 from collections.abc import AsyncIterator
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
+from functools import partial
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -17,7 +19,7 @@ if TYPE_CHECKING:
     from openclaw.agents.tools.base import SimpleTool
 
 from openclaw.agents.events import AgentEvent
-from openclaw.agents.history_utils import limit_history_turns, sanitize_session_history
+from openclaw.agents.history_utils import resolve_max_history_turns, sanitize_session_history
 from openclaw.agents.providers.base import LLMMessage
 from openclaw.events import Event, EventType
 
@@ -26,8 +28,27 @@ logger = logging.getLogger(__name__)
 # Maximum tool call iterations to prevent infinite loops
 MAX_TOOL_ITERATIONS = 5
 
+_EVENT_SOURCE = "tool-loop-orchestrator"
 
-@dataclass
+# Streamed text deltas arriving within this window are forwarded as one event
+DEFAULT_TEXT_COALESCE_MS = 20.0
+
+_TEXT_EVENT_TYPES = frozenset({EventType.AGENT_TEXT, EventType.TEXT, "text_delta"})
+
+# Assistant replies used when the loop stops early without any model text
+_FALLBACK_TEXTS = {
+    "stopped_by_loop_detection": "I've executed the requested tools. The results are ready.",
+    "stopped_by_max_iterations": (
+        "I've executed multiple tools but encountered difficulty generating a final response. "
+        "The tool results have been processed."
+    ),
+}
+
+# Prepared-history entries kept per orchestrator (one per session/provider/max_turns)
+_PREP_CACHE_MAX = 32
+
+
+@dataclass(slots=True, frozen=True)
 class ToolResult:
     """Result from a single tool execution"""
     
@@ -38,7 +59,7 @@ class ToolResult:
     error: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TurnResult:
     """Result from a complete turn (initial + follow-ups)"""
     
@@ -49,6 +70,56 @@ class TurnResult:
     stopped_by_loop_detection: bool = False
 
 
+def _is_text_delta(event: Any) -> bool:
+    """Whether event is an Event carrying {"delta": {"text": str}}"""
+    if not isinstance(event, Event):
+        return False
+    delta = event.data.get("delta") if isinstance(event.data, dict) else None
+    return isinstance(delta, dict) and isinstance(delta.get("text"), str)
+
+
+def _merge_text_events(events: list[Event]) -> Event:
+    """Merge consecutive text delta events into the first one's shape"""
+    if len(events) == 1:
+        return events[0]
+    first = events[0]
+    text = "".join(e.data["delta"]["text"] for e in events)
+    return replace(first, data={**first.data, "delta": {**first.data["delta"], "text": text}})
+
+
+@dataclass
+class _TurnState:
+    """What one LLM call of the tool loop produced"""
+    
+    text_parts: list[str] = field(default_factory=list)  # joined once per call
+    tool_calls: list[ToolResult] = field(default_factory=list)
+
+
+@dataclass
+class _PreparedHistory:
+    """Incrementally maintained result of _prepare_messages for one session
+    
+    Sanitizing is per message, so new session messages are sanitized and
+    converted on their own and appended. The history window is recomputed
+    from the user positions on every call, so the result always matches a
+    fresh build.
+    """
+    
+    source: list[Any] = field(default_factory=list)  # session messages converted so far
+    llm_messages: list[LLMMessage] = field(default_factory=list)
+    user_indices: list[int] = field(default_factory=list)  # user positions in llm_messages
+    start: int = 0  # first index of the history window
+    
+    def extends(self, all_messages: list[Any]) -> bool:
+        """Whether all_messages is this entry's source with messages appended
+        
+        Every message of the source must be the very same object, so a
+        replaced or removed message forces a rebuild.
+        """
+        source = self.source
+        return len(all_messages) >= len(source) and all(map(operator.is_, source, all_messages))
+
+
 class ToolLoopOrchestrator:
     """Orchestrates automatic tool loop execution pi-ai style
     
@@ -60,29 +131,108 @@ class ToolLoopOrchestrator:
     - Event streaming to subscribers
     """
     
-    def __init__(self, max_iterations: int = MAX_TOOL_ITERATIONS):
+    def __init__(
+        self,
+        max_iterations: int = MAX_TOOL_ITERATIONS,
+        text_coalesce_ms: float = DEFAULT_TEXT_COALESCE_MS,
+    ):
+        """
+        Args:
+            max_iterations: Max LLM calls per turn
+            text_coalesce_ms: Window for merging consecutive streamed text
+                deltas into one forwarded event (0 forwards every delta)
+        """
         self.max_iterations = max_iterations
-        self._observers: list[Any] = []
+        self.text_coalesce_ms = text_coalesce_ms
+        # Insertion-ordered dicts keyed by the observer itself: O(1) add and
+        # remove, and bound methods (equal but not identical per access)
+        # still match on removal
+        self._observers: dict[Any, bool] = {}  # observer -> is_async
+        self._sync_observers: dict[Any, None] = {}
+        self._async_observers: dict[Any, None] = {}
+        self._prep_cache: dict[tuple, _PreparedHistory] = {}
+        # Event type -> tracker, so each streamed event costs one dict lookup
+        self._event_handlers = {
+            EventType.AGENT_TEXT: self._on_text,
+            EventType.TEXT: self._on_text,
+            "text_delta": self._on_text,
+            EventType.TOOL_EXECUTION_END: self._on_tool_end,
+        }
     
     def add_observer(self, observer: Any) -> None:
         """Add an event observer"""
-        self._observers.append(observer)
+        # Classify once here rather than per notified event
+        is_async = asyncio.iscoroutinefunction(observer)
+        self._observers[observer] = is_async
+        (self._async_observers if is_async else self._sync_observers)[observer] = None
     
     def remove_observer(self, observer: Any) -> None:
         """Remove an event observer"""
-        if observer in self._observers:
-            self._observers.remove(observer)
+        is_async = self._observers.pop(observer, None)
+        if is_async is not None:
+            del (self._async_observers if is_async else self._sync_observers)[observer]
     
     async def _notify_observers(self, event: Event | AgentEvent) -> None:
-        """Notify all observers of an event"""
-        for observer in self._observers:
+        """Notify all observers of an event
+        
+        Sync observers are called in order; async observers then run
+        concurrently, so one slow observer does not serialize the rest.
+        """
+        for observer in self._sync_observers:
+            try:
+                observer(event)
+            except Exception as e:
+                logger.error(f"Error notifying observer: {e}", exc_info=True)
+        
+        async_observers = self._async_observers
+        if not async_observers:
+            return
+        if len(async_observers) == 1:
             try:
-                if asyncio.iscoroutinefunction(observer):
-                    await observer(event)
-                else:
-                    observer(event)
+                await next(iter(async_observers))(event)
             except Exception as e:
                 logger.error(f"Error notifying observer: {e}", exc_info=True)
+            return
+        
+        results = await asyncio.gather(
+            *(observer(event) for observer in async_observers),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Error notifying observer: {result}", exc_info=result)
+            elif isinstance(result, BaseException):
+                raise result
+    
+    @staticmethod
+    def _on_text(event: Event | AgentEvent, turn: _TurnState) -> None:
+        """Accumulate streamed text"""
+        try:
+            data = event.data
+        except AttributeError:
+            return
+        if isinstance(data, dict):
+            delta_data = data.get('delta', {})
+            if isinstance(delta_data, dict):
+                turn.text_parts.append(delta_data.get('text', ''))
+            else:
+                turn.text_parts.append(str(delta_data))
+    
+    @staticmethod
+    def _on_tool_end(event: Event | AgentEvent, turn: _TurnState) -> None:
+        """Track tool result"""
+        try:
+            data = event.data
+        except AttributeError:
+            return
+        if isinstance(data, dict):
+            turn.tool_calls.append(ToolResult(
+                tool_call_id=data.get('tool_call_id', ''),
+                tool_name=data.get('tool_name', ''),
+                success=data.get('success', False),
+                result=str(data.get('result', '')),
+                error=data.get('error')
+            ))
     
     async def execute_with_tools(
         self,
@@ -122,6 +272,12 @@ class ToolLoopOrchestrator:
         needs_followup = False
         accumulated_text = ""
         all_tool_results: list[ToolResult] = []
+        mk_complete = partial(
+            Event,
+            type=EventType.AGENT_TURN_COMPLETE,
+            source=_EVENT_SOURCE,
+            session_id=session.session_id,
+        )
         
         # Add user message to session
         if images:
@@ -136,54 +292,102 @@ class ToolLoopOrchestrator:
             iteration += 1
             logger.info(f"🔄 Tool loop iteration {iteration}/{self.max_iterations}")
             
-            # Prepare messages for this iteration
-            if iteration == 1:
-                # Initial call - use session messages
-                messages = self._prepare_messages(session, max_turns, runtime.provider_name)
-            else:
-                # Follow-up call - session already has tool results added
-                messages = self._prepare_messages(session, max_turns, runtime.provider_name)
+            # Prepare messages for this iteration. On follow-ups the session
+            # already has the tool results, and only those new messages are
+            # converted (see _PreparedHistory).
+            messages = self._prepare_messages(session, max_turns, runtime.provider_name)
             
             # Make LLM call
-            turn_text = ""
-            turn_tool_calls = []
+            turn = _TurnState()
+            handlers = self._event_handlers
+            coalesce = self.text_coalesce_ms / 1000
+            loop = asyncio.get_running_loop()
+            pending_text: list[Event] = []
+            last_flush = float("-inf")  # never hold back the first delta
             
             # Stream from runtime's single-turn execution
-            async for event in runtime._stream_single_turn(
+            stream = runtime._stream_single_turn(
                 session=session,
                 messages=messages,
                 tools=tools,
                 max_tokens=max_tokens,
                 is_followup=(iteration > 1)
-            ):
-                # Forward event to subscribers
-                await self._notify_observers(event)
-                yield event
-                
-                # Track what happened
-                if hasattr(event, 'type'):
-                    if event.type in (EventType.AGENT_TEXT, EventType.TEXT, "text_delta"):
-                        # Accumulate text
-                        if hasattr(event, 'data') and isinstance(event.data, dict):
-                            delta_data = event.data.get('delta', {})
-                            if isinstance(delta_data, dict):
-                                delta_text = delta_data.get('text', '')
-                            else:
-                                delta_text = str(delta_data)
-                            turn_text += delta_text
+            ).__aiter__()
+            # While text is buffered, the next event is awaited as a task
+            # raced against the end of the window, so a pause in the stream
+            # never holds buffered text back longer than the window
+            next_event: asyncio.Future | None = None
+            try:
+                while True:
+                    if pending_text:
+                        if next_event is None:
+                            next_event = asyncio.ensure_future(anext(stream))
+                        remaining = last_flush + coalesce - loop.time()
+                        if remaining > 0:
+                            await asyncio.wait({next_event}, timeout=remaining)
+                        if not next_event.done():
+                            merged = _merge_text_events(pending_text)
+                            pending_text.clear()
+                            last_flush = loop.time()
+                            await self._notify_observers(merged)
+                            yield merged
+                            continue
+                    
+                    try:
+                        if next_event is not None:
+                            waiting, next_event = next_event, None
+                            event = await waiting
+                        else:
+                            event = await anext(stream)
+                    except StopAsyncIteration:
+                        break
+                    
+                    # Track what happened
+                    event_type = getattr(event, 'type', None)
+                    handler = handlers.get(event_type)
+                    if handler is not None:
+                        handler(event, turn)
+                    
+                    # Buffer text deltas; forward them merged once the window
+                    # has elapsed or before any other event
+                    if coalesce and event_type in _TEXT_EVENT_TYPES and _is_text_delta(event):
+                        pending_text.append(event)
+                        now = loop.time()
+                        if now - last_flush < coalesce:
+                            continue
+                        event = _merge_text_events(pending_text)
+                        pending_text.clear()
+                        last_flush = now
+                    elif pending_text:
+                        merged = _merge_text_events(pending_text)
+                        pending_text.clear()
+                        last_flush = loop.time()
+                        await self._notify_observers(merged)
+                        yield merged
                     
-                    elif event.type == EventType.TOOL_EXECUTION_END:
-                        # Track tool result
-                        if hasattr(event, 'data') and isinstance(event.data, dict):
-                            tool_result = ToolResult(
-                                tool_call_id=event.data.get('tool_call_id', ''),
-                                tool_name=event.data.get('tool_name', ''),
-                                success=event.data.get('success', False),
-                                result=str(event.data.get('result', '')),
-                                error=event.data.get('error')
-                            )
-                            all_tool_results.append(tool_result)
-                            turn_tool_calls.append(tool_result)
+                    # Forward event to subscribers
+                    await self._notify_observers(event)
+                    yield event
+            finally:
+                # Settle the read-ahead task before closing the stream, so it
+                # is never left pending and the generator is not running
+                if next_event is not None:
+                    next_event.cancel()
+                    await asyncio.wait({next_event})
+                    if not next_event.cancelled():
+                        next_event.exception()  # mark retrieved
+                aclose = getattr(stream, "aclose", None)
+                if aclose is not None:
+                    await aclose()
+            
+            if pending_text:
+                merged = _merge_text_events(pending_text)
+                await self._notify_observers(merged)
+                yield merged
+            
+            turn_text = "".join(turn.text_parts)
+            turn_tool_calls = turn.tool_calls
+            all_tool_results.extend(turn_tool_calls)
             
             # Check if we need follow-up
             if turn_tool_calls:
@@ -194,33 +398,10 @@ class ToolLoopOrchestrator:
                     logger.warning(f"🔴 Tool call loop detected in iteration {iteration}")
                     logger.warning(f"🛑 Stopping to prevent infinite loop")
                     
-                    # Provide fallback response
-                    if not turn_text:
-                        fallback_text = "I've executed the requested tools. The results are ready."
-                        session.add_assistant_message(content=fallback_text)
-                        
-                        # Send fallback text event
-                        fallback_event = Event(
-                            type=EventType.TEXT,
-                            source="tool-loop-orchestrator",
-                            session_id=session.session_id,
-                            data={"delta": {"text": fallback_text}},
-                        )
-                        await self._notify_observers(fallback_event)
-                        yield fallback_event
-                    
-                    # Send turn complete
-                    complete_event = Event(
-                        type=EventType.AGENT_TURN_COMPLETE,
-                        source="tool-loop-orchestrator",
-                        session_id=session.session_id,
-                        data={
-                            "iterations": iteration,
-                            "stopped_by_loop_detection": True
-                        },
-                    )
-                    await self._notify_observers(complete_event)
-                    yield complete_event
+                    async for event in self._emit_termination(
+                        session, iteration, "stopped_by_loop_detection", turn_text
+                    ):
+                        yield event
                     return
                 
                 # Continue to next iteration (follow-up)
@@ -237,45 +418,50 @@ class ToolLoopOrchestrator:
         if iteration >= self.max_iterations and needs_followup:
             logger.error(f"🔴 Maximum tool iterations ({self.max_iterations}) reached")
             
-            # Provide fallback response if no text accumulated
-            if not accumulated_text:
-                fallback_text = "I've executed multiple tools but encountered difficulty generating a final response. The tool results have been processed."
-                session.add_assistant_message(content=fallback_text)
-                
-                # Send fallback text event
-                fallback_event = Event(
-                    type=EventType.TEXT,
-                    source="tool-loop-orchestrator",
-                    session_id=session.session_id,
-                    data={"delta": {"text": fallback_text}},
-                )
-                await self._notify_observers(fallback_event)
-                yield fallback_event
-            
-            # Send turn complete
-            complete_event = Event(
-                type=EventType.AGENT_TURN_COMPLETE,
-                source="tool-loop-orchestrator",
-                session_id=session.session_id,
-                data={
-                    "iterations": iteration,
-                    "stopped_by_max_iterations": True
-                },
-            )
-            await self._notify_observers(complete_event)
-            yield complete_event
+            async for event in self._emit_termination(
+                session, iteration, "stopped_by_max_iterations", accumulated_text
+            ):
+                yield event
             return
         
         # Send final turn complete event
-        complete_event = Event(
+        complete_event = mk_complete(data={
+            "iterations": iteration,
+            "stopped_by_max_iterations": False,
+            "stopped_by_loop_detection": False
+        })
+        await self._notify_observers(complete_event)
+        yield complete_event
+    
+    async def _emit_termination(
+        self,
+        session: Session,
+        iteration: int,
+        reason: str,
+        text: str,
+    ) -> AsyncIterator[Event]:
+        """Emit the events for an early stop (loop detected / max iterations)
+        
+        Adds a fallback assistant reply when the model produced no text,
+        then the turn-complete event flagged with reason.
+        """
+        mk_event = partial(Event, source=_EVENT_SOURCE, session_id=session.session_id)
+        
+        if not text:
+            fallback_text = _FALLBACK_TEXTS[reason]
+            session.add_assistant_message(content=fallback_text)
+            
+            # Send fallback text event
+            fallback_event = mk_event(
+                type=EventType.TEXT, data={"delta": {"text": fallback_text}}
+            )
+            await self._notify_observers(fallback_event)
+            yield fallback_event
+        
+        # Send turn complete
+        complete_event = mk_event(
             type=EventType.AGENT_TURN_COMPLETE,
-            source="tool-loop-orchestrator",
-            session_id=session.session_id,
-            data={
-                "iterations": iteration,
-                "stopped_by_max_iterations": False,
-                "stopped_by_loop_detection": False
-            },
+            data={"iterations": iteration, reason: True},
         )
         await self._notify_observers(complete_event)
         yield complete_event
@@ -299,40 +485,82 @@ class ToolLoopOrchestrator:
         # Get all messages
         all_messages = session.get_messages()
         
-        # Convert to dict format
-        messages_dict = [
-            {
-                "role": m.role,
-                "content": m.content,
-                "tool_calls": getattr(m, 'tool_calls', None),
-                "tool_call_id": getattr(m, 'tool_call_id', None),
-                "name": getattr(m, 'name', None),
-            }
-            for m in all_messages
-        ]
+        key = (session.session_id, provider_name, max_turns)
+        prepared = self._prep_cache.get(key)
+        if prepared is None or not prepared.extends(all_messages):
+            if prepared is None and len(self._prep_cache) >= _PREP_CACHE_MAX:
+                self._prep_cache.pop(next(iter(self._prep_cache)))
+            prepared = self._prep_cache[key] = _PreparedHistory()
         
-        # Sanitize history
-        sanitized = sanitize_session_history(messages_dict)
+        # Convert, sanitize and append only the messages added since last call
+        new_messages = all_messages[len(prepared.source):]
+        if new_messages:
+            # Only carry optional fields a message actually has; the
+            # LLMMessage build below reads them back with .get()
+            messages_dict = []
+            for m in new_messages:
+                d = {"role": m.role, "content": m.content}
+                tool_calls = getattr(m, 'tool_calls', None)
+                if tool_calls is not None:
+                    d["tool_calls"] = tool_calls
+                tool_call_id = getattr(m, 'tool_call_id', None)
+                if tool_call_id is not None:
+                    d["tool_call_id"] = tool_call_id
+                name = getattr(m, 'name', None)
+                if name is not None:
+                    d["name"] = name
+                messages_dict.append(d)
+            sanitized = sanitize_session_history(messages_dict)
+            
+            llm_messages = prepared.llm_messages
+            base = len(llm_messages)
+            prepared.user_indices.extend(
+                base + i for i, m in enumerate(sanitized) if m["role"] == "user"
+            )
+            llm_messages.extend([
+                LLMMessage(
+                    role=m["role"],
+                    content=m["content"],
+                    images=None,  # Images handled separately
+                    tool_calls=m.get("tool_calls"),
+                    tool_call_id=m.get("tool_call_id"),
+                    name=m.get("name")
+                )
+                for m in sanitized
+            ])
+            
+            prepared.source.extend(new_messages)
         
-        # Limit history
-        limited = limit_history_turns(
-            sanitized,
-            max_turns=max_turns,
-            provider=provider_name
+        # Limit history (same window as limit_history_turns)
+        self._advance_history_window(
+            prepared, resolve_max_history_turns(max_turns, provider_name)
         )
         
+        limited = prepared.llm_messages[prepared.start:]
         logger.info(f"📝 Prepared messages: {len(all_messages)} -> {len(limited)} (after sanitization and limiting)")
         
-        # Convert to LLMMessage
-        llm_messages = []
-        for m in limited:
-            llm_messages.append(LLMMessage(
-                role=m["role"],
-                content=m["content"],
-                images=None,  # Images handled separately
-                tool_calls=m.get("tool_calls"),
-                tool_call_id=m.get("tool_call_id"),
-                name=m.get("name")
-            ))
+        return limited
+    
+    @staticmethod
+    def _advance_history_window(
+        prepared: _PreparedHistory,
+        max_turns: int | None
+    ) -> None:
+        """Set the history window start to respect max_turns
         
-        return llm_messages
+        The window starts at the Nth user message from the end (or the
+        first user message when there are fewer), exactly as
+        limit_history_turns cuts it.
+        """
+        if max_turns is None or max_turns <= 0:
+            return
+        
+        user_indices = prepared.user_indices
+        if not user_indices:
+            return
+        
+        if len(user_indices) > max_turns:
+            prepared.start = user_indices[-max_turns]
+        else:
+            # Like limit_history_turns, drop anything before the first user message
+            prepared.start = user_indices[0]
@@ -6,13 +6,18 @@ Multi-layer tool policy resolution with profile-based configurations.
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping
 from dataclasses import dataclass, field
-from typing import Literal, Dict, List, Set
+from types import MappingProxyType
+from typing import Literal, Dict, FrozenSet, List, Set
 
 logger = logging.getLogger(__name__)
 
+# Resolved tool lists memoized per resolver
+_RESOLVE_CACHE_MAX = 128
 
-@dataclass
+
+@dataclass(frozen=True)
 class ToolPolicy:
     """
     Tool policy configuration - aligned with openclaw-ts ToolPolicy
@@ -22,22 +27,47 @@ class ToolPolicy:
     - allow: Explicit allowlist
     - deny: Explicit denylist
     - by_provider: Provider-specific overrides
+    
+    Immutable and hashable so resolved tool lists can be memoized per
+    policy. Lists and a provider dict are accepted and stored as tuples.
     """
     profile: Literal["default", "strict", "permissive", "coding"] | None = None
-    allow: List[str] | None = None  # Allowlist
-    deny: List[str] | None = None   # Denylist
-    by_provider: Dict[str, "ToolPolicy"] | None = None  # Provider-level policies
+    allow: tuple[str, ...] | None = None  # Allowlist
+    deny: tuple[str, ...] | None = None   # Denylist
+    by_provider: tuple[tuple[str, "ToolPolicy"], ...] | None = None  # Provider-level policies
+    
+    def __post_init__(self):
+        if self.allow is not None and not isinstance(self.allow, tuple):
+            object.__setattr__(self, "allow", tuple(self.allow))
+        if self.deny is not None and not isinstance(self.deny, tuple):
+            object.__setattr__(self, "deny", tuple(self.deny))
+        if isinstance(self.by_provider, dict):
+            object.__setattr__(self, "by_provider", tuple(self.by_provider.items()))
+    
+    def provider_policy(self, provider: str) -> "ToolPolicy | None":
+        """Get the provider-level policy for provider, if any"""
+        for name, policy in self.by_provider or ():
+            if name == provider:
+                return policy
+        return None
 
 
-@dataclass
+@dataclass(frozen=True)
 class PluginGroup:
     """
     Plugin tool group - aligned with openclaw-ts
     
     Groups related tools for easier policy configuration
+    
+    Immutable (tools are stored as a tuple) so a registered group cannot
+    change behind the resolver's memoized results.
     """
     name: str
-    tools: List[str]
+    tools: tuple[str, ...]
+    
+    def __post_init__(self):
+        if not isinstance(self.tools, tuple):
+            object.__setattr__(self, "tools", tuple(self.tools))
 
 
 class ToolPolicyResolver:
@@ -121,7 +151,7 @@ class ToolPolicyResolver:
     }
     
     # Owner-only tools - aligned with openclaw-ts
-    OWNER_ONLY_TOOLS: Set[str] = {
+    OWNER_ONLY_TOOLS: FrozenSet[str] = frozenset({
         "bash",  # Shell access
         "python_repl",  # Code execution
         "eval",  # Arbitrary evaluation
@@ -129,7 +159,7 @@ class ToolPolicyResolver:
         "delete_file",  # Destructive operations
         "move_file",
         "send_message",  # Communication
-    }
+    })
     
     def __init__(
         self, 
@@ -143,9 +173,29 @@ class ToolPolicyResolver:
             core_tools: List of available core tool names
             plugin_groups: Optional plugin groups for group: references
         """
-        self.core_tools = set(core_tools)
+        self._resolve_cache: Dict[tuple, List[str]] = {}
+        self.core_tools = core_tools
         self.plugin_groups = plugin_groups or {}
     
+    # Read-only views; assigning either one drops memoized resolutions
+    @property
+    def core_tools(self) -> FrozenSet[str]:
+        return self._core_tools
+    
+    @core_tools.setter
+    def core_tools(self, tools) -> None:
+        self._core_tools = frozenset(tools)
+        self._resolve_cache.clear()
+    
+    @property
+    def plugin_groups(self) -> Mapping[str, PluginGroup]:
+        return MappingProxyType(self._plugin_groups)
+    
+    @plugin_groups.setter
+    def plugin_groups(self, groups: Dict[str, PluginGroup]) -> None:
+        self._plugin_groups = dict(groups)
+        self._resolve_cache.clear()
+    
     def resolve(
         self,
         policy: ToolPolicy,
@@ -163,37 +213,49 @@ class ToolPolicyResolver:
         Returns:
             List of allowed tool names
         """
+        key = (policy, provider, sender_is_owner)
+        cached = self._resolve_cache.get(key)
+        if cached is None:
+            cached = self._resolve_uncached(policy, provider, sender_is_owner)
+            if len(self._resolve_cache) >= _RESOLVE_CACHE_MAX:
+                self._resolve_cache.pop(next(iter(self._resolve_cache)))
+            self._resolve_cache[key] = cached
+        return list(cached)
+    
+    def _resolve_uncached(
+        self,
+        policy: ToolPolicy,
+        provider: str,
+        sender_is_owner: bool,
+    ) -> List[str]:
+        """Run the resolution pipeline (see resolve)"""
         # 1. Expand plugin group references (e.g., "group:plugins")
         expanded_policy = self._expand_plugin_groups(policy)
         
         # 2. Apply base profile
         allowed = self._apply_profile(expanded_policy.profile or "default")
         
+        provider_policy = expanded_policy.provider_policy(provider)
+        
         # 3. Apply provider-level profile (overrides base)
-        if expanded_policy.by_provider and provider in expanded_policy.by_provider:
-            provider_policy = expanded_policy.by_provider[provider]
-            if provider_policy.profile:
-                allowed = self._apply_profile(provider_policy.profile)
+        if provider_policy is not None and provider_policy.profile:
+            allowed = self._apply_profile(provider_policy.profile)
         
         # 4. Apply global allowlist (intersection)
         if expanded_policy.allow is not None:
-            allowed &= set(expanded_policy.allow)
+            allowed.intersection_update(expanded_policy.allow)
         
         # 5. Apply provider-level allowlist (intersection)
-        if expanded_policy.by_provider and provider in expanded_policy.by_provider:
-            provider_policy = expanded_policy.by_provider[provider]
-            if provider_policy.allow is not None:
-                allowed &= set(provider_policy.allow)
+        if provider_policy is not None and provider_policy.allow is not None:
+            allowed.intersection_update(provider_policy.allow)
         
         # 6. Apply global denylist (subtraction)
         if expanded_policy.deny:
-            allowed -= set(expanded_policy.deny)
+            allowed.difference_update(expanded_policy.deny)
         
         # 7. Apply provider-level denylist (subtraction)
-        if expanded_policy.by_provider and provider in expanded_policy.by_provider:
-            provider_policy = expanded_policy.by_provider[provider]
-            if provider_policy.deny:
-                allowed -= set(provider_policy.deny)
+        if provider_policy is not None and provider_policy.deny:
+            allowed.difference_update(provider_policy.deny)
         
         # 8. Filter owner-only tools if not owner
         if not sender_is_owner:
@@ -208,7 +270,7 @@ class ToolPolicyResolver:
             f"{len(allowed)} tools allowed"
         )
         
-        return sorted(list(allowed))
+        return sorted(allowed)
     
     def _apply_profile(self, profile: str) -> Set[str]:
         """
@@ -220,15 +282,15 @@ class ToolPolicyResolver:
         Returns:
             Set of allowed tools
         """
-        if profile not in self.PROFILES:
+        if profile not in _PROFILE_SETS:
             logger.warning(f"Unknown profile '{profile}', using 'default'")
             profile = "default"
         
-        profile_tools = self.PROFILES[profile]
+        profile_tools = _PROFILE_SETS[profile]
         
         # Handle wildcard profile (permissive)
-        if "*" in profile_tools:
-            return self.core_tools.copy()
+        if profile_tools is None:
+            return set(self.core_tools)
         
         return set(profile_tools)
     
@@ -244,7 +306,8 @@ class ToolPolicyResolver:
         Returns:
             Policy with expanded tool lists
         """
-        if not policy.allow:
+        # Common case: nothing to expand, so keep the policy as is
+        if not policy.allow or not any(item.startswith("group:") for item in policy.allow):
             return policy
         
         expanded_allow = []
@@ -275,7 +338,8 @@ class ToolPolicyResolver:
         Args:
             group: Plugin group to register
         """
-        self.plugin_groups[group.name] = group
+        self._plugin_groups[group.name] = group
+        self._resolve_cache.clear()
         logger.debug(f"Registered plugin group: {group.name} ({len(group.tools)} tools)")
     
     def is_owner_only(self, tool_name: str) -> bool:
@@ -291,6 +355,13 @@ class ToolPolicyResolver:
         return tool_name in self.OWNER_ONLY_TOOLS
 
 
+# Profile tool sets, frozen once at import (None marks the "*" wildcard profile)
+_PROFILE_SETS: Dict[str, FrozenSet[str] | None] = {
+    name: None if "*" in tools else frozenset(tools)
+    for name, tools in ToolPolicyResolver.PROFILES.items()
+}
+
+
 def create_default_policy() -> ToolPolicy:
     """
     Create default tool policy - aligned with openclaw-ts
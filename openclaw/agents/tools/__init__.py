@@ -1,36 +1,55 @@
 """Agent tools"""
 
+import importlib
+
 from .base import AgentTool, AgentToolBase, ToolResult
-from .memory import MemoryGetTool, MemorySearchTool
 
-# Import unified browser tool from new location
-from openclaw.browser.tools.browser_tool import UnifiedBrowserTool
+# Everything else is imported on first access (PEP 562), so using one tool
+# does not pull in the browser, memory and file tool modules.
+# name -> (module, attribute); relative modules resolve against this package
+_LAZY_ATTRS = {
+    # Legacy tools
+    "MemorySearchTool": (".memory", "MemorySearchTool"),
+    "MemoryGetTool": (".memory", "MemoryGetTool"),
+    # Unified browser tool from new location
+    "UnifiedBrowserTool": ("openclaw.browser.tools.browser_tool", "UnifiedBrowserTool"),
+    # Factory functions
+    "create_bash_tool": (".bash", "create_bash_tool"),
+    "create_read_tool": (".read", "create_read_tool"),
+    "create_write_tool": (".write", "create_write_tool"),
+    "create_edit_tool": (".edit", "create_edit_tool"),
+    # Utilities
+    "truncate_head": (".truncate", "truncate_head"),
+    "truncate_tail": (".truncate", "truncate_tail"),
+    "DEFAULT_MAX_BYTES": (".truncate", "DEFAULT_MAX_BYTES"),
+    "DEFAULT_MAX_LINES": (".truncate", "DEFAULT_MAX_LINES"),
+    "TruncationResult": (".truncate", "TruncationResult"),
+    "format_size": (".truncate", "format_size"),
+    # Operations interfaces
+    "BashOperations": (".operations", "BashOperations"),
+    "ReadOperations": (".operations", "ReadOperations"),
+    "WriteOperations": (".operations", "WriteOperations"),
+    "EditOperations": (".operations", "EditOperations"),
+    "DefaultBashOperations": (".default_operations", "DefaultBashOperations"),
+    "DefaultReadOperations": (".default_operations", "DefaultReadOperations"),
+    "DefaultWriteOperations": (".default_operations", "DefaultWriteOperations"),
+    "DefaultEditOperations": (".default_operations", "DefaultEditOperations"),
+    "PersistentPtyBashOperations": (".default_operations", "PersistentPtyBashOperations"),
+}
+
+
+def __getattr__(name: str):
+    target = _LAZY_ATTRS.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attr = target
+    value = getattr(importlib.import_module(module_name, __name__), attr)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
 
-# Import new factory functions and utilities
-from .bash import create_bash_tool
-from .read import create_read_tool
-from .write import create_write_tool
-from .edit import create_edit_tool
-from .truncate import (
-    truncate_head,
-    truncate_tail,
-    DEFAULT_MAX_BYTES,
-    DEFAULT_MAX_LINES,
-    TruncationResult,
-    format_size,
-)
-from .operations import (
-    BashOperations,
-    ReadOperations,
-    WriteOperations,
-    EditOperations,
-)
-from .default_operations import (
-    DefaultBashOperations,
-    DefaultReadOperations,
-    DefaultWriteOperations,
-    DefaultEditOperations,
-)
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
 
 
 def create_coding_tools(cwd: str, operations: dict | None = None) -> list[AgentToolBase]:
@@ -44,6 +63,11 @@ def create_coding_tools(cwd: str, operations: dict | None = None) -> list[AgentT
     Returns:
         List of configured tools
     """
+    from .bash import create_bash_tool
+    from .edit import create_edit_tool
+    from .read import create_read_tool
+    from .write import create_write_tool
+    
     ops = operations or {}
     return [
         create_read_tool(cwd, ops.get("read")),
@@ -64,6 +88,8 @@ def create_readonly_tools(cwd: str, operations: dict | None = None) -> list[Agen
     Returns:
         List of configured tools
     """
+    from .read import create_read_tool
+    
     ops = operations or {}
     return [
         create_read_tool(cwd, ops.get("read")),
@@ -102,6 +128,7 @@ __all__ = [
     "DefaultReadOperations",
     "DefaultWriteOperations",
     "DefaultEditOperations",
+    "PersistentPtyBashOperations",
 ]
 
 # Note: browser.py and browser_control.py are deprecated in favor of UnifiedBrowserTool
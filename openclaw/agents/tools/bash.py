@@ -12,8 +12,10 @@ Matches pi-mono/packages/coding-agent/src/core/tools/bash.ts
 from __future__ import annotations
 
 import asyncio
+import codecs
 import logging
-import tempfile
+import os
+from collections import deque
 from typing import Any, Callable
 
 from ..types import AgentToolResult, TextContent
@@ -23,12 +25,133 @@ from .operations import BashOperations
 from .truncate import (
     DEFAULT_MAX_BYTES,
     DEFAULT_MAX_LINES,
+    TruncationResult,
     format_size,
     truncate_tail,
 )
 
 logger = logging.getLogger(__name__)
 
+# Streaming updates fire at most this often, unless this much new output
+# has arrived since the last one
+UPDATE_INTERVAL_SECONDS = 0.05
+UPDATE_MIN_BYTES = 16 * 1024
+
+# Full-output temp file writes are batched into syscalls of at least this size
+TEMP_FILE_WRITE_BYTES = 64 * 1024
+
+
+def _write_all(fd: int, data: bytes | bytearray) -> None:
+    """os.write until all of data is written (os.write may write less)"""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+# Truncation notices appended to the final output
+_NOTICE_PARTIAL_LINE = (
+    "[Showing last {shown} of line {end} (line is {line_size}). Full output: {path}]"
+)
+_NOTICE_BY_LINES = "[Showing lines {start}-{end} of {total}. Full output: {path}]"
+_NOTICE_BY_BYTES = (
+    "[Showing lines {start}-{end} of {total} ({limit} limit). Full output: {path}]"
+)
+
+
+def _untruncated(content: str, total_lines: int, total_bytes: int) -> TruncationResult:
+    """The TruncationResult truncate_tail returns for output within both limits"""
+    return TruncationResult(
+        content=content,
+        truncated=False,
+        truncated_by=None,
+        total_lines=total_lines,
+        total_bytes=total_bytes,
+        output_lines=total_lines,
+        output_bytes=total_bytes,
+        last_line_partial=False,
+        first_line_exceeds_limit=False,
+        max_lines=DEFAULT_MAX_LINES,
+        max_bytes=DEFAULT_MAX_BYTES,
+    )
+
+
+class _TailBuffer:
+    """
+    Fixed-capacity byte ring holding the most recent output.
+    
+    Writes copy only the incoming bytes (split around the wrap point);
+    the contiguous window is rebuilt only when it is actually read.
+    """
+    
+    __slots__ = ("_buf", "_capacity", "_pos", "_filled", "_overflowed")
+    
+    def __init__(self, capacity: int):
+        self._buf = bytearray(capacity)
+        self._capacity = capacity
+        self._pos = 0  # next write offset
+        self._filled = 0
+        self._overflowed = False  # whether older bytes have been dropped
+    
+    def __len__(self) -> int:
+        return self._filled
+    
+    def write(self, data: bytes) -> None:
+        """Append data, overwriting the oldest bytes once full"""
+        size = len(data)
+        capacity = self._capacity
+        view = memoryview(data)
+        
+        if size >= capacity:
+            self._buf[:] = view[size - capacity:]
+            self._pos = 0
+            self._overflowed = self._overflowed or self._filled + size > capacity
+            self._filled = capacity
+            return
+        
+        pos = self._pos
+        end = pos + size
+        if end <= capacity:
+            self._buf[pos:end] = view
+        else:
+            split = capacity - pos
+            self._buf[pos:] = view[:split]
+            self._buf[:end - capacity] = view[split:]
+        self._pos = end % capacity
+        filled = self._filled + size
+        if filled > capacity:
+            self._overflowed = True
+            filled = capacity
+        self._filled = filled
+    
+    def segments(self) -> list[memoryview]:
+        """Zero-copy views of the buffered bytes, oldest first (two once wrapped)"""
+        view = memoryview(self._buf)
+        if self._filled < self._capacity:
+            return [view[:self._filled]]
+        pos = self._pos
+        return [view[pos:], view[:pos]] if pos else [view]
+    
+    def decode(self) -> str:
+        """Decode the buffered bytes as UTF-8 (replacing invalid sequences)
+        
+        Decodes straight from the ring's memory, with no intermediate
+        bytes copy. Once older output has been dropped the window may
+        start inside a multi-byte character; those leading continuation
+        bytes are skipped.
+        """
+        segments = self.segments()
+        if self._overflowed:
+            skip = 0
+            first = segments[0]
+            while skip < min(3, len(first)) and first[skip] & 0xC0 == 0x80:
+                skip += 1
+            segments[0] = first[skip:]
+        if len(segments) == 1:
+            return str(segments[0], 'utf-8', 'replace')
+        # Wrapped: the incremental decoder joins a character split at the seam
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        return decoder.decode(segments[0]) + decoder.decode(segments[1], final=True)
+
 
 def create_bash_tool(
     cwd: str,
@@ -102,59 +225,160 @@ def create_bash_tool(
             resolved_command = f"{command_prefix}\n{command}" if command_prefix else command
             
             # Streaming output management
-            # Keep a rolling buffer of the last chunk for tail truncation
-            chunks: list[bytes] = []
-            chunks_bytes = 0
-            max_chunks_bytes = DEFAULT_MAX_BYTES * 2  # Keep more than we need
+            # Keep a rolling buffer of recent output for tail truncation
+            tail = _TailBuffer(DEFAULT_MAX_BYTES * 2)  # Keep more than we need
+            
+            # Decoded view of the same output, kept only while streaming:
+            # each chunk is decoded once as it arrives (multi-byte characters
+            # split across chunks are carried over by the decoder), and whole
+            # fragments are dropped from the front once the rest still covers
+            # the window
+            decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+            text_parts: deque[str] = deque()
+            text_chars = 0
+            max_text_chars = DEFAULT_MAX_BYTES * 2
             
-            # Temp file for full output
+            def append_text(piece: str):
+                nonlocal text_chars
+                if not piece:
+                    return
+                text_parts.append(piece)
+                text_chars += len(piece)
+                while text_chars - len(text_parts[0]) >= max_text_chars:
+                    text_chars -= len(text_parts.popleft())
+            
+            final_text: str | None = None
+            
+            def buffered_output() -> str:
+                """
+                Full buffered output once the command has finished.
+                
+                Materialized on first call and reused afterwards, so the
+                final update, the error paths and the result share one
+                join/decode.
+                """
+                nonlocal final_text
+                if final_text is None:
+                    if on_update is None:
+                        # Nothing was decoded while streaming; decode the window once
+                        final_text = tail.decode()
+                    else:
+                        append_text(decoder.decode(b'', final=True))
+                        final_text = ''.join(text_parts)
+                return final_text
+            
+            # Temp file for full output, written through the raw fd
             temp_file_path: str | None = None
-            temp_file: Any | None = None
+            temp_fd: int | None = None
+            temp_pending = bytearray()
             total_bytes = 0
+            newline_count = 0
+            
+            def truncate_output(text: str, text_bytes: int) -> TruncationResult:
+                """
+                truncate_tail, skipped when the output is known to fit.
+                
+                Byte and newline counts are kept as data arrives, so short
+                output (the common case) needs no encode/split pass. Text
+                with replacement characters may encode larger than the raw
+                bytes, so it always takes the full path.
+                """
+                if (
+                    total_bytes <= DEFAULT_MAX_BYTES
+                    and newline_count < DEFAULT_MAX_LINES
+                    and '\ufffd' not in text
+                ):
+                    return _untruncated(text, newline_count + 1, text_bytes)
+                return truncate_tail(text)
+            
+            # Update throttling: snapshots are coalesced, with a trailing
+            # update scheduled so the latest output is never held back.
+            # Snapshots are never built inside handle_data itself: a due
+            # update is queued with call_soon and runs once the reader
+            # yields, so chunks already waiting in the pipe drain first.
+            loop = asyncio.get_running_loop()
+            last_update = float("-inf")
+            bytes_since_update = 0
+            pending_update: asyncio.Handle | None = None
+            update_due = False  # pending_update is a call_soon, not a timer
+            
+            def emit_update(text: str | None = None):
+                """Send the current (or given final) truncated rolling buffer to on_update"""
+                nonlocal last_update, bytes_since_update, pending_update, update_due
+                if pending_update is not None:
+                    pending_update.cancel()
+                    pending_update = None
+                update_due = False
+                last_update = loop.time()
+                bytes_since_update = 0
+                
+                if text is None:
+                    text = ''.join(text_parts)
+                # Bytes of a character split across chunks are still in the decoder
+                truncation = truncate_output(text, total_bytes - len(decoder.getstate()[0]))
+                on_update(AgentToolResult(
+                    content=[TextContent(text=truncation.content or "")],
+                    details={
+                        "truncation": truncation.as_details_dict(),
+                        "full_output_path": temp_file_path,
+                    }
+                ))
             
             def handle_data(data: bytes):
                 """Handle incoming data from subprocess"""
-                nonlocal chunks_bytes, total_bytes, temp_file_path, temp_file
+                nonlocal total_bytes, newline_count, temp_file_path, temp_fd
+                nonlocal bytes_since_update, pending_update, update_due
                 
                 total_bytes += len(data)
+                newline_count += data.count(b'\n')
                 
                 # Start writing to temp file once we exceed threshold
                 if total_bytes > DEFAULT_MAX_BYTES and not temp_file_path:
+                    # Only large outputs need a temp file, so tempfile (and the
+                    # random/shutil modules it pulls in) is imported on demand
+                    import tempfile
+                    
                     # Create temp file
-                    fd, temp_file_path = tempfile.mkstemp(
+                    temp_fd, temp_file_path = tempfile.mkstemp(
                         prefix=f"openclaw-bash-{tool_call_id}-",
                         suffix=".log"
                     )
-                    temp_file = open(fd, 'wb')
-                    # Write all buffered chunks to the file
-                    for chunk in chunks:
-                        temp_file.write(chunk)
+                    # Write all buffered output to the file
+                    for segment in tail.segments():
+                        temp_pending.extend(segment)
                 
                 # Write to temp file if we have one
-                if temp_file:
-                    temp_file.write(data)
+                if temp_fd is not None:
+                    temp_pending.extend(data)
+                    if len(temp_pending) >= TEMP_FILE_WRITE_BYTES:
+                        _write_all(temp_fd, temp_pending)
+                        temp_pending.clear()
                 
                 # Keep rolling buffer of recent data
-                chunks.append(data)
-                chunks_bytes += len(data)
+                tail.write(data)
                 
-                # Trim old chunks if buffer is too large
-                while chunks_bytes > max_chunks_bytes and len(chunks) > 1:
-                    removed = chunks.pop(0)
-                    chunks_bytes -= len(removed)
+                # Without a listener, the final output is all that matters
+                if on_update is None:
+                    return
                 
                 # Stream partial output to callback (truncated rolling buffer)
-                if on_update:
-                    full_buffer = b''.join(chunks)
-                    full_text = full_buffer.decode('utf-8', errors='replace')
-                    truncation = truncate_tail(full_text)
-                    on_update(AgentToolResult(
-                        content=[TextContent(text=truncation.content or "")],
-                        details={
-                            "truncation": truncation.__dict__ if truncation.truncated else None,
-                            "full_output_path": temp_file_path,
-                        }
-                    ))
+                append_text(decoder.decode(data))
+                bytes_since_update += len(data)
+                if update_due:
+                    return
+                if (
+                    loop.time() - last_update < UPDATE_INTERVAL_SECONDS
+                    and bytes_since_update < UPDATE_MIN_BYTES
+                ):
+                    if pending_update is None:
+                        pending_update = loop.call_at(
+                            last_update + UPDATE_INTERVAL_SECONDS, emit_update
+                        )
+                    return
+                if pending_update is not None:
+                    pending_update.cancel()
+                pending_update = loop.call_soon(emit_update)
+                update_due = True
             
             # Check if already cancelled
             if signal and signal.is_set():
@@ -170,83 +394,81 @@ def create_bash_tool(
                     timeout=timeout,
                 )
             except asyncio.CancelledError:
-                # Close temp file on cancellation
-                if temp_file:
-                    temp_file.close()
-                
-                # Combine all buffered chunks for output
-                full_buffer = b''.join(chunks)
-                output = full_buffer.decode('utf-8', errors='replace')
+                # Combine all buffered output
+                output = buffered_output()
                 
                 if output:
                     output += "\n\n"
                 output += "Command aborted"
                 raise Exception(output)
             except asyncio.TimeoutError:
-                # Close temp file on timeout
-                if temp_file:
-                    temp_file.close()
-                
-                # Combine all buffered chunks for output
-                full_buffer = b''.join(chunks)
-                output = full_buffer.decode('utf-8', errors='replace')
+                # Combine all buffered output
+                output = buffered_output()
                 
                 if output:
                     output += "\n\n"
                 output += f"Command timed out after {timeout} seconds"
                 raise Exception(output)
             finally:
-                # Always close temp file
-                if temp_file:
-                    temp_file.close()
+                # Deliver any output still waiting on a throttled update
+                if pending_update is not None:
+                    emit_update(buffered_output())
+                
+                # Always flush and close temp file
+                if temp_fd is not None:
+                    try:
+                        if temp_pending:
+                            _write_all(temp_fd, temp_pending)
+                            temp_pending.clear()
+                    finally:
+                        os.close(temp_fd)
+                        temp_fd = None
             
             # Process final output
-            full_buffer = b''.join(chunks)
-            full_output = full_buffer.decode('utf-8', errors='replace')
+            full_output = buffered_output()
             
             # Apply tail truncation
-            truncation = truncate_tail(full_output)
-            output_text = truncation.content or "(no output)"
+            truncation = truncate_output(full_output, total_bytes)
+            # Output, notice and exit status are joined once at the end
+            parts = [truncation.content or "(no output)"]
             
             # Build details with truncation info
             details: dict[str, Any] | None = None
             
             if truncation.truncated:
                 details = {
-                    "truncation": truncation.__dict__,
+                    "truncation": truncation.as_details_dict(),
                     "full_output_path": temp_file_path,
                 }
                 
                 # Build actionable notice
-                start_line = truncation.total_lines - truncation.output_lines + 1
                 end_line = truncation.total_lines
-                
                 if truncation.last_line_partial:
                     # Edge case: last line alone > 50KB
-                    last_line = full_output.split('\n')[-1]
-                    last_line_size = format_size(len(last_line.encode('utf-8')))
-                    output_text += (
-                        f"\n\n[Showing last {format_size(truncation.output_bytes)} "
-                        f"of line {end_line} (line is {last_line_size}). "
-                        f"Full output: {temp_file_path}]"
-                    )
-                elif truncation.truncated_by == "lines":
-                    output_text += (
-                        f"\n\n[Showing lines {start_line}-{end_line} of "
-                        f"{truncation.total_lines}. Full output: {temp_file_path}]"
-                    )
+                    last_line = full_output.rpartition('\n')[2]
+                    parts.append(_NOTICE_PARTIAL_LINE.format(
+                        shown=format_size(truncation.output_bytes),
+                        end=end_line,
+                        line_size=format_size(len(last_line.encode('utf-8'))),
+                        path=temp_file_path,
+                    ))
                 else:
-                    output_text += (
-                        f"\n\n[Showing lines {start_line}-{end_line} of "
-                        f"{truncation.total_lines} ({format_size(DEFAULT_MAX_BYTES)} limit). "
-                        f"Full output: {temp_file_path}]"
+                    parts.append(
+                        (_NOTICE_BY_LINES if truncation.truncated_by == "lines" else _NOTICE_BY_BYTES).format(
+                            start=end_line - truncation.output_lines + 1,
+                            end=end_line,
+                            total=truncation.total_lines,
+                            limit=format_size(DEFAULT_MAX_BYTES),
+                            path=temp_file_path,
+                        )
                     )
             
             exit_code = result["exit_code"]
             if exit_code != 0 and exit_code is not None:
-                output_text += f"\n\nCommand exited with code {exit_code}"
-                raise Exception(output_text)
+                parts.append(f"Command exited with code {exit_code}")
+                raise Exception("\n\n".join(parts))
             
+            output_text = "\n\n".join(parts)
             return AgentToolResult(
                 content=[TextContent(text=output_text)],
                 details=details
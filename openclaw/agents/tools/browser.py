@@ -7,30 +7,51 @@ Please use: from openclaw.browser import UnifiedBrowserTool
 import asyncio
 import logging
 import warnings
+import weakref
 from typing import Any
 
 from .base import AgentTool, ToolResult
 
 logger = logging.getLogger(__name__)
 
-warnings.warn(
-    "openclaw.agents.tools.browser is deprecated. "
-    "Use openclaw.browser.tools.UnifiedBrowserTool instead.",
-    DeprecationWarning,
-    stacklevel=2
-)
+# The deprecation warning fires on first construction, not on import
+_deprecation_warned = False
 
 
 class BrowserTool(AgentTool):
     """Browser control and automation using Playwright"""
 
     def __init__(self):
+        global _deprecation_warned
+        if not _deprecation_warned:
+            _deprecation_warned = True
+            warnings.warn(
+                "openclaw.agents.tools.browser is deprecated. "
+                "Use openclaw.browser.tools.UnifiedBrowserTool instead.",
+                DeprecationWarning,
+                stacklevel=2
+            )
         super().__init__()
         self.name = "browser"
         self.description = "Control a headless browser for web automation, screenshots, and testing"
         self._browser = None
         self._context = None
-        self._pages: dict[str, Any] = {}
+        # Pages are held strongly by their browser context while open; once
+        # closed (by us or by the page itself) their entries drop out here
+        self._pages: weakref.WeakValueDictionary[str, Any] = weakref.WeakValueDictionary()
+        # Action -> handler, so execute dispatches with one dict lookup
+        self._actions = {
+            "start": lambda params: self._start_browser(),
+            "stop": lambda params: self._stop_browser(),
+            "open": self._open_page,
+            "navigate": self._navigate,
+            "screenshot": self._screenshot,
+            "click": self._click,
+            "type": self._type_text,
+            "eval": self._eval,
+            "pdf": self._generate_pdf,
+            "close": self._close_page,
+        }
 
     def get_schema(self) -> dict[str, Any]:
         return {
@@ -84,28 +105,10 @@ class BrowserTool(AgentTool):
             return ToolResult(success=False, content="", error="action required")
 
         try:
-            if action == "start":
-                return await self._start_browser()
-            elif action == "stop":
-                return await self._stop_browser()
-            elif action == "open":
-                return await self._open_page(params)
-            elif action == "navigate":
-                return await self._navigate(params)
-            elif action == "screenshot":
-                return await self._screenshot(params)
-            elif action == "click":
-                return await self._click(params)
-            elif action == "type":
-                return await self._type_text(params)
-            elif action == "eval":
-                return await self._eval(params)
-            elif action == "pdf":
-                return await self._generate_pdf(params)
-            elif action == "close":
-                return await self._close_page(params)
-            else:
+            handler = self._actions.get(action)
+            if handler is None:
                 return ToolResult(success=False, content="", error=f"Unknown action: {action}")
+            return await handler(params)
 
         except Exception as e:
             logger.error(f"Browser tool error: {e}", exc_info=True)
@@ -269,6 +272,6 @@ class BrowserTool(AgentTool):
             return ToolResult(success=False, content="", error=f"Page '{page_id}' not found")
 
         await page.close()
-        del self._pages[page_id]
+        self._pages.pop(page_id, None)
 
         return ToolResult(success=True, content=f"Closed page '{page_id}'")
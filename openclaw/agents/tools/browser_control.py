@@ -161,16 +161,16 @@ class BrowserTool(AgentTool):
             
             elif action == "extract_text":
                 selector = params.get("selector", "body")
-                element = await self._page.query_selector(selector)
+                from openclaw.browser.controller import query_inner_text
                 
-                if not element:
+                text = await query_inner_text(self._page, selector)
+                
+                if text is None:
                     return ToolResult(
                         success=False,
                         error=f"Element not found: {selector}",
                     )
                 
-                text = await element.inner_text()
-                
                 return ToolResult(
                     success=True,
                     content=text,
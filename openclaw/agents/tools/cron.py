@@ -1,14 +1,28 @@
 """
 Cron tool for scheduling tasks - aligned with TypeScript openclaw/src/agents/tools/cron-tool.ts
 
-Actions: status, list, add, update, remove, run, runs, wake
+Actions: status, list, add, update, remove, run, runs, wake, bulk
 """
+import asyncio
+import functools
+import json
 import logging
-import uuid
-from datetime import UTC, datetime
+import secrets
+from collections.abc import Callable
 from typing import Any
 
 from openclaw.agents.tools.base import AgentTool, ToolResult
+from openclaw.cron.schedule import format_next_run
+from openclaw.cron.store import CronRunLog
+from openclaw.cron.types import (
+    AgentTurnPayload,
+    AtSchedule,
+    CronDelivery,
+    CronJob,
+    CronSchedule,
+    EverySchedule,
+    SystemEventPayload,
+)
 
 # ToolResult uses 'content' field (not 'output'). Helper to create results cleanly.
 def _ok(text: str) -> ToolResult:
@@ -17,8 +31,120 @@ def _ok(text: str) -> ToolResult:
 def _err(msg: str) -> ToolResult:
     return ToolResult(success=False, content="", error=msg)
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None  # type: ignore
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+# Schedule types, payload kinds and session targets, as they appear in job dicts
+_AT = "at"
+_EVERY = "every"
+_CRON = "cron"
+_SYSTEM_EVENT = "systemEvent"
+_AGENT_TURN = "agentTurn"
+_ISOLATED = "isolated"
+
+# Tool argument schema, built once and shared by every get_schema() call
+_CRON_ARGS_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "action": {
+            "type": "string",
+            "enum": ["status", "list", "add", "update", "remove", "run", "runs", "wake", "bulk"],
+            "description": "Action to perform",
+        },
+        "includeDisabled": {
+            "type": "boolean",
+            "description": "Include disabled jobs in list (default: false)",
+        },
+        "job": {
+            "type": "object",
+            "description": "Job configuration for 'add' action",
+            "properties": {
+                "name": {"type": "string"},
+                "description": {"type": "string"},
+                "enabled": {"type": "boolean", "default": True},
+                "schedule": {
+                    "type": "object",
+                    "properties": {
+                        "type": {"type": "string", "enum": ["at", "every", "cron"]},
+                        "timestamp": {"type": "string"},
+                        "interval_ms": {"type": "number"},
+                        "anchor": {"type": "string"},
+                        "expression": {"type": "string"},
+                        "timezone": {"type": "string"},
+                    },
+                    "required": ["type"],
+                },
+                "sessionTarget": {
+                    "type": "string",
+                    "enum": ["main", "isolated"],
+                    "default": "main",
+                },
+                "wakeMode": {
+                    "type": "string",
+                    "enum": ["now", "next-heartbeat"],
+                    "default": "next-heartbeat",
+                },
+                "payload": {
+                    "type": "object",
+                    "properties": {
+                        "kind": {"type": "string", "enum": ["systemEvent", "agentTurn"]},
+                        "text": {"type": "string"},
+                        "prompt": {"type": "string"},
+                        "model": {"type": "string"},
+                    },
+                    "required": ["kind"],
+                },
+                "delivery": {
+                    "type": "object",
+                    "properties": {
+                        "channel": {"type": "string"},
+                        "target": {"type": "string"},
+                        "best_effort": {"type": "boolean"},
+                    },
+                },
+            },
+            "required": ["name", "schedule", "payload"],
+        },
+        "jobId": {
+            "type": "string",
+            "description": "Job ID for update/remove/run/runs actions",
+        },
+        "patch": {
+            "type": "object",
+            "description": "Patch object for 'update' action (name, enabled, schedule, payload, delivery, sessionTarget, wakeMode, etc.)",
+        },
+        "mode": {
+            "type": "string",
+            "enum": ["due", "force", "now", "next-heartbeat"],
+            "description": "Mode for 'run' (due|force) or 'wake' (now|next-heartbeat)",
+        },
+        "text": {
+            "type": "string",
+            "description": "Text for 'wake' action",
+        },
+        "limit": {
+            "type": "integer",
+            "description": "Limit for 'runs' action (default: 20)",
+        },
+        "actions": {
+            "type": "array",
+            "items": {"type": "object"},
+            "description": "For 'bulk': independent action objects (same shape as these args) run concurrently",
+        },
+    },
+    "required": ["action"],
+}
+
+# One job in the list action's output
+_JOB_LIST_ENTRY = "[{status}] {name}\n  ID: {id}\n  Schedule: {schedule}\n  Type: {type}\n{delivery}\n"
+
 
 class CronTool(AgentTool):
     """
@@ -33,6 +159,7 @@ class CronTool(AgentTool):
     - run:    Trigger job immediately (due|force mode)
     - runs:   Get job run history
     - wake:   Send a wake event to the main session
+    - bulk:   Run several independent actions concurrently
     """
 
     name = "cron"
@@ -47,6 +174,7 @@ Actions:
 - run: Trigger job immediately (requires jobId, optional mode: "due"|"force")
 - runs: Get job run history (requires jobId, optional limit)
 - wake: Send wake event to main session (requires text, optional mode: "now"|"next-heartbeat")
+- bulk: Run several independent actions at once (requires actions, a list of action objects)
     """
 
     def __init__(self, cron_service=None, channel_registry=None, session_manager=None):
@@ -94,92 +222,7 @@ Actions:
     # Schema
     # ------------------------------------------------------------------
     def get_schema(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "action": {
-                    "type": "string",
-                    "enum": ["status", "list", "add", "update", "remove", "run", "runs", "wake"],
-                    "description": "Action to perform",
-                },
-                "includeDisabled": {
-                    "type": "boolean",
-                    "description": "Include disabled jobs in list (default: false)",
-                },
-                "job": {
-                    "type": "object",
-                    "description": "Job configuration for 'add' action",
-                    "properties": {
-                        "name": {"type": "string"},
-                        "description": {"type": "string"},
-                        "enabled": {"type": "boolean", "default": True},
-                        "schedule": {
-                            "type": "object",
-                            "properties": {
-                                "type": {"type": "string", "enum": ["at", "every", "cron"]},
-                                "timestamp": {"type": "string"},
-                                "interval_ms": {"type": "number"},
-                                "anchor": {"type": "string"},
-                                "expression": {"type": "string"},
-                                "timezone": {"type": "string"},
-                            },
-                            "required": ["type"],
-                        },
-                        "sessionTarget": {
-                            "type": "string",
-                            "enum": ["main", "isolated"],
-                            "default": "main",
-                        },
-                        "wakeMode": {
-                            "type": "string",
-                            "enum": ["now", "next-heartbeat"],
-                            "default": "next-heartbeat",
-                        },
-                        "payload": {
-                            "type": "object",
-                            "properties": {
-                                "kind": {"type": "string", "enum": ["systemEvent", "agentTurn"]},
-                                "text": {"type": "string"},
-                                "prompt": {"type": "string"},
-                                "model": {"type": "string"},
-                            },
-                            "required": ["kind"],
-                        },
-                        "delivery": {
-                            "type": "object",
-                            "properties": {
-                                "channel": {"type": "string"},
-                                "target": {"type": "string"},
-                                "best_effort": {"type": "boolean"},
-                            },
-                        },
-                    },
-                    "required": ["name", "schedule", "payload"],
-                },
-                "jobId": {
-                    "type": "string",
-                    "description": "Job ID for update/remove/run/runs actions",
-                },
-                "patch": {
-                    "type": "object",
-                    "description": "Patch object for 'update' action (name, enabled, schedule, payload, delivery, sessionTarget, wakeMode, etc.)",
-                },
-                "mode": {
-                    "type": "string",
-                    "enum": ["due", "force", "now", "next-heartbeat"],
-                    "description": "Mode for 'run' (due|force) or 'wake' (now|next-heartbeat)",
-                },
-                "text": {
-                    "type": "string",
-                    "description": "Text for 'wake' action",
-                },
-                "limit": {
-                    "type": "integer",
-                    "description": "Limit for 'runs' action (default: 20)",
-                },
-            },
-            "required": ["action"],
-        }
+        return _CRON_ARGS_SCHEMA
 
     # ------------------------------------------------------------------
     # Execute dispatcher
@@ -190,28 +233,39 @@ Actions:
 
         action = args.get("action")
         try:
-            if action == "status":
-                return await self._action_status()
-            elif action == "list":
-                return await self._action_list(args.get("includeDisabled", False))
-            elif action == "add":
-                return await self._action_add(args.get("job", {}))
-            elif action == "update":
-                return await self._action_update(args.get("jobId"), args.get("patch", {}))
-            elif action == "remove":
-                return await self._action_remove(args.get("jobId"))
-            elif action == "run":
-                return await self._action_run(args.get("jobId"), args.get("mode", "force"))
-            elif action == "runs":
-                return await self._action_runs(args.get("jobId"), args.get("limit", 20))
-            elif action == "wake":
-                return await self._action_wake(args.get("text", ""), args.get("mode", "now"))
-            else:
+            entry = self._ACTIONS.get(action)
+            if entry is None:
                 return _err(f"Unknown action: {action}")
+            name, arg_defaults = entry
+            return await getattr(self, name)(*[args.get(key, default) for key, default in arg_defaults])
         except Exception as e:
             logger.error(f"Cron tool error: {e}", exc_info=True)
             return _err(str(e))
 
+    async def execute_raw(self, raw: bytes | str) -> ToolResult:
+        """
+        Execute from the raw JSON arguments of a tool call.
+
+        For callers still holding the provider's JSON payload: it is decoded
+        in a single pass (orjson when installed) and dispatched like execute.
+        """
+        try:
+            args = _json_loads(raw)
+        except ValueError as e:
+            return _err(f"Invalid arguments JSON: {e}")
+        if not isinstance(args, dict):
+            return _err("Arguments must be a JSON object")
+        return await self.execute(args)
+
+    async def bulk_execute(self, actions: list[dict[str, Any]]) -> list[ToolResult]:
+        """
+        Execute independent actions concurrently.
+
+        Results are returned in input order; each action fails or succeeds
+        on its own, as with separate execute calls.
+        """
+        return list(await asyncio.gather(*(self.execute(args) for args in actions)))
+
     # ------------------------------------------------------------------
     # Actions
     # ------------------------------------------------------------------
@@ -227,7 +281,6 @@ Actions:
         lines.append(f"Cron service: {'enabled' if enabled else 'disabled'}")
         lines.append(f"Jobs: {job_count}")
         if nxt:
-            from openclaw.cron.schedule import format_next_run
             lines.append(f"Next wake: {format_next_run(nxt)}")
 
         return _ok("\n".join(lines))
@@ -240,46 +293,34 @@ Actions:
             suffix = " (excluding disabled)" if not include_disabled else ""
             return _ok(f"No scheduled jobs{suffix}")
 
-        text = f"Scheduled Jobs ({len(jobs)}):\n\n"
+        # One template fill and one append per job, joined once at the end
+        parts = [f"Scheduled Jobs ({len(jobs)}):\n\n"]
+        append = parts.append
         for job in jobs:
-            jid = job.get("id", "?")
-            name = job.get("name", "Unnamed")
-            enabled = job.get("enabled", True)
-            schedule = job.get("schedule", {})
-            st = job.get("session_target", "main")
-
-            status_icon = "ON" if enabled else "OFF"
-            text += f"[{status_icon}] {name}\n"
-            text += f"  ID: {jid}\n"
-            text += f"  Schedule: {self._format_schedule(schedule)}\n"
-            text += f"  Type: {'Isolated Agent' if st == 'isolated' else 'System Event'}\n"
-
+            delivery_line = ""
             delivery = job.get("delivery")
             if delivery:
                 ch = delivery.get("channel", "")
                 tgt = delivery.get("target", "")
                 if ch:
-                    text += f"  Delivery: {ch}"
-                    if tgt:
-                        text += f" -> {tgt}"
-                    text += "\n"
-            text += "\n"
+                    delivery_line = f"  Delivery: {ch} -> {tgt}\n" if tgt else f"  Delivery: {ch}\n"
 
-        return _ok(text.strip())
+            append(_JOB_LIST_ENTRY.format_map({
+                "status": "ON" if job.get("enabled", True) else "OFF",
+                "name": job.get("name", "Unnamed"),
+                "id": job.get("id", "?"),
+                "schedule": self._format_schedule(job.get("schedule", {})),
+                "type": _job_type_label(job.get("session_target", "main")),
+                "delivery": delivery_line,
+            }))
 
-    async def _action_add(self, job_config: dict[str, Any]) -> ToolResult:
-        """Add new cron job (matches TypeScript add with normalization)."""
-        from openclaw.cron.types import (
-            AgentTurnPayload,
-            AtSchedule,
-            CronDelivery,
-            CronJob,
-            CronSchedule,
-            EverySchedule,
-            SystemEventPayload,
-        )
+        return _ok("".join(parts).strip())
 
-        job_id = f"cron-{uuid.uuid4().hex[:8]}"
+    async def _action_add(self, job_config: dict[str, Any] | None) -> ToolResult:
+        """Add new cron job (matches TypeScript add with normalization)."""
+        if job_config is None:
+            job_config = {}
+        job_id = f"cron-{secrets.token_hex(4)}"
 
         # --- Normalize schedule ---
         schedule_config = job_config.get("schedule", {})
@@ -300,7 +341,7 @@ Actions:
         delivery = None
         delivery_config = job_config.get("delivery")
 
-        if session_target == "isolated" and isinstance(payload, AgentTurnPayload):
+        if session_target == _ISOLATED and isinstance(payload, AgentTurnPayload):
             if delivery_config is None:
                 delivery_config = {}
             channel = delivery_config.get("channel", "")
@@ -347,18 +388,20 @@ Actions:
 
         added_job = await self._cron_service.add_job(job)
 
-        text = f"Created cron job: {added_job.name}\n"
-        text += f"  ID: {job_id}\n"
-        text += f"  Schedule: {self._format_schedule(job_config.get('schedule', {}))}\n"
-        text += f"  Type: {'Isolated Agent' if session_target == 'isolated' else 'System Event'}"
+        parts = [
+            f"Created cron job: {added_job.name}\n",
+            f"  ID: {job_id}\n",
+            f"  Schedule: {self._format_schedule(job_config.get('schedule', {}))}\n",
+            f"  Type: {_job_type_label(session_target)}",
+        ]
         if delivery:
-            text += f"\n  Delivery: {delivery.channel}"
+            parts.append(f"\n  Delivery: {delivery.channel}")
             if delivery.target:
-                text += f" -> {delivery.target}"
+                parts.append(f" -> {delivery.target}")
 
-        return _ok(text)
+        return _ok("".join(parts))
 
-    async def _action_update(self, job_id: str | None, patch: dict[str, Any]) -> ToolResult:
+    async def _action_update(self, job_id: str | None, patch: dict[str, Any] | None) -> ToolResult:
         """Update existing job (full patch support matching TypeScript)."""
         if not job_id:
             return _err("jobId is required for update action")
@@ -408,7 +451,6 @@ Actions:
         if not job_id:
             return _err("jobId is required for runs action")
 
-        from openclaw.cron.store import CronRunLog
         log_dir = self._cron_service.log_dir
         if not log_dir:
             return _ok("No run logs configured")
@@ -419,7 +461,8 @@ Actions:
         if not entries:
             return _ok(f"No run history for job {job_id}")
 
-        text = f"Run history for {job_id} (last {len(entries)}):\n\n"
+        parts = [f"Run history for {job_id} (last {len(entries)}):\n\n"]
+        append = parts.append
         for entry in reversed(entries):
             ts = entry.get("timestamp", "?")
             status = entry.get("status", "?")
@@ -427,14 +470,14 @@ Actions:
             error = entry.get("error")
             summary = entry.get("summary")
 
-            text += f"  [{status}] {ts} ({duration}ms)"
+            append(f"  [{status}] {ts} ({duration}ms)")
             if error:
-                text += f" - {error}"
+                append(f" - {error}")
             if summary:
-                text += f"\n    {summary[:100]}"
-            text += "\n"
+                append(f"\n    {summary[:100]}")
+            append("\n")
 
-        return _ok(text.strip())
+        return _ok("".join(parts).strip())
 
     async def _action_wake(self, text: str, mode: str = "now") -> ToolResult:
         """Send wake event (matches TypeScript wake action)."""
@@ -450,63 +493,128 @@ Actions:
         else:
             return _err("Failed to send wake event")
 
+    async def _action_bulk(self, actions: list[dict[str, Any]] | None) -> ToolResult:
+        """Run several independent actions concurrently."""
+        if not actions:
+            return _err("actions list is required for bulk action")
+        for args in actions:
+            if not isinstance(args, dict) or args.get("action") == "bulk":
+                return _err("bulk actions must be action objects other than 'bulk'")
+
+        results = await self.bulk_execute(actions)
+
+        parts = []
+        failed = 0
+        for i, (args, result) in enumerate(zip(actions, results), 1):
+            if result.success:
+                parts.append(f"[{i}] {args.get('action')}: {result.content}")
+            else:
+                failed += 1
+                parts.append(f"[{i}] {args.get('action')}: Error: {result.error}")
+
+        text = "\n\n".join(parts)
+        if failed:
+            return ToolResult(
+                success=False,
+                content=text,
+                error=f"{failed} of {len(results)} actions failed",
+            )
+        return _ok(text)
+
+    # Action -> (method name, ((arg key, default), ...)); execute looks the
+    # method up on self (so subclass overrides apply) and passes the args
+    # positionally in this order. Defaults are immutable: container args
+    # default to None, so no call can leak state into the next one
+    _ACTIONS: dict[str, tuple[str, tuple[tuple[str, Any], ...]]] = {
+        "status": ("_action_status", ()),
+        "list": ("_action_list", (("includeDisabled", False),)),
+        "add": ("_action_add", (("job", None),)),
+        "update": ("_action_update", (("jobId", None), ("patch", None))),
+        "remove": ("_action_remove", (("jobId", None),)),
+        "run": ("_action_run", (("jobId", None), ("mode", "force"))),
+        "runs": ("_action_runs", (("jobId", None), ("limit", 20))),
+        "wake": ("_action_wake", (("text", ""), ("mode", "now"))),
+        "bulk": ("_action_bulk", (("actions", None),)),
+    }
+
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
     @staticmethod
     def _format_schedule(schedule: dict[str, Any]) -> str:
         stype = schedule.get("type", "")
-        if stype == "at":
-            return f"One-time at {schedule.get('timestamp', '?')}"
-        elif stype == "every":
-            interval_ms = schedule.get("interval_ms", schedule.get("intervalMs", 0))
-            if interval_ms >= 3_600_000:
-                return f"Every {interval_ms / 3_600_000:.1f}h"
-            elif interval_ms >= 60_000:
-                return f"Every {interval_ms / 60_000:.0f}m"
-            else:
-                return f"Every {interval_ms / 1000:.0f}s"
-        elif stype == "cron":
-            expr = schedule.get("expression", "?")
-            tz = schedule.get("timezone", "UTC")
-            return f"Cron: {expr} ({tz})"
-        return "Unknown schedule"
+        if stype == _AT:
+            key = (stype, schedule.get("timestamp", "?"), None)
+        elif stype == _EVERY:
+            key = (stype, schedule.get("interval_ms", schedule.get("intervalMs", 0)), None)
+        elif stype == _CRON:
+            key = (stype, schedule.get("expression", "?"), schedule.get("timezone", "UTC"))
+        else:
+            return "Unknown schedule"
+        try:
+            return _format_schedule_fields(*key)
+        except TypeError:
+            # Unhashable field values (malformed job data) skip the cache
+            return _format_schedule_fields.__wrapped__(*key)
+
+
+def _job_type_label(session_target: str) -> str:
+    return "Isolated Agent" if session_target == _ISOLATED else "System Event"
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_schedule_fields(stype: str, value: Any, timezone: Any) -> str:
+    """
+    Format a schedule from its key fields.
+    
+    Cached since list output re-formats the same schedules on every call;
+    bounded because schedules are user data.
+    """
+    if stype == _AT:
+        return f"One-time at {value}"
+    if stype == _EVERY:
+        if value >= 3_600_000:
+            return f"Every {value / 3_600_000:.1f}h"
+        elif value >= 60_000:
+            return f"Every {value / 60_000:.0f}m"
+        else:
+            return f"Every {value / 1000:.0f}s"
+    return f"Cron: {value} ({timezone})"
 
 
 # ---------------------------------------------------------------------------
 # Normalization helpers (matches TypeScript normalizeCronJobCreate)
 # ---------------------------------------------------------------------------
 
+# Schedule type / payload kind -> builder from the raw config dict
+_SCHEDULE_BUILDERS: dict[str, Callable[[dict[str, Any]], Any]] = {
+    _AT: lambda c: AtSchedule(timestamp=c.get("timestamp", c.get("at", ""))),
+    _EVERY: lambda c: EverySchedule(
+        interval_ms=c.get("interval_ms", c.get("intervalMs", 0)),
+        anchor=c.get("anchor"),
+    ),
+    _CRON: lambda c: CronSchedule(
+        expression=c.get("expression", ""),
+        timezone=c.get("timezone", "UTC"),
+    ),
+}
+
+_PAYLOAD_BUILDERS: dict[str, Callable[[dict[str, Any]], Any]] = {
+    _SYSTEM_EVENT: lambda c: SystemEventPayload(text=c.get("text", "")),
+    _AGENT_TURN: lambda c: AgentTurnPayload(
+        prompt=c.get("prompt", c.get("message", "")),
+        model=c.get("model"),
+    ),
+}
+
+
 def _normalize_schedule(config: dict[str, Any]):
     """Normalize schedule config to a schedule type."""
-    from openclaw.cron.types import AtSchedule, EverySchedule, CronSchedule
-
-    stype = config.get("type", config.get("kind", ""))
-    if stype == "at":
-        return AtSchedule(timestamp=config.get("timestamp", config.get("at", "")))
-    elif stype == "every":
-        return EverySchedule(
-            interval_ms=config.get("interval_ms", config.get("intervalMs", 0)),
-            anchor=config.get("anchor"),
-        )
-    elif stype == "cron":
-        return CronSchedule(
-            expression=config.get("expression", ""),
-            timezone=config.get("timezone", "UTC"),
-        )
-    return None
+    builder = _SCHEDULE_BUILDERS.get(config.get("type", config.get("kind", "")))
+    return builder(config) if builder is not None else None
 
 
 def _normalize_payload(config: dict[str, Any]):
     """Normalize payload config to a payload type."""
-    from openclaw.cron.types import SystemEventPayload, AgentTurnPayload
-
-    kind = config.get("kind", "")
-    if kind == "systemEvent":
-        return SystemEventPayload(text=config.get("text", ""))
-    elif kind == "agentTurn":
-        return AgentTurnPayload(
-            prompt=config.get("prompt", config.get("message", "")),
-            model=config.get("model"),
-        )
-    return None
+    builder = _PAYLOAD_BUILDERS.get(config.get("kind", ""))
+    return builder(config) if builder is not None else None
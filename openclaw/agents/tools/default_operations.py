@@ -8,11 +8,20 @@ from __future__ import annotations
 
 import asyncio
 import os
+import shlex
 import signal as signal_module
+import sys
+import uuid
 from pathlib import Path
 from typing import Callable
 
-import aiofiles
+try:
+    import ptyprocess
+
+    PTYPROCESS_AVAILABLE = True
+except ImportError:
+    ptyprocess = None  # type: ignore
+    PTYPROCESS_AVAILABLE = False
 
 from .operations import BashOperations, EditOperations, ReadOperations, WriteOperations
 
@@ -21,7 +30,9 @@ class DefaultBashOperations(BashOperations):
     """
     Default bash operations using asyncio subprocess.
     
-    Executes commands locally using asyncio.create_subprocess_shell.
+    Executes commands locally using asyncio.create_subprocess_shell, with
+    output read from the pipe by an event loop reader (StreamReader on
+    Windows, whose default loop has no add_reader).
     """
     
     async def exec(
@@ -40,6 +51,103 @@ class DefaultBashOperations(BashOperations):
         if env:
             merged_env.update(env)
         
+        if sys.platform == "win32":
+            # Proactor loops have no add_reader (and pipes cannot be
+            # selected), so read through StreamReaders there
+            return await self._exec_streams(command, cwd, on_data, signal, timeout, merged_env)
+        
+        # Output goes to a plain pipe read straight off the event loop with
+        # os.read, rather than through a StreamReader's own buffer
+        read_fd, write_fd = os.pipe()
+        try:
+            process = await asyncio.create_subprocess_shell(
+                command,
+                stdout=write_fd,
+                stderr=asyncio.subprocess.STDOUT,  # Combine stderr with stdout
+                cwd=cwd,
+                env=merged_env,
+            )
+        except BaseException:
+            os.close(read_fd)
+            raise
+        finally:
+            # The child holds its own copy; EOF arrives once it exits
+            os.close(write_fd)
+        
+        os.set_blocking(read_fd, False)
+        loop = asyncio.get_running_loop()
+        eof: asyncio.Future[None] = loop.create_future()
+        
+        def kill():
+            if process.returncode is None:
+                try:
+                    process.kill()
+                except ProcessLookupError:
+                    pass
+        
+        def finish(error: BaseException | None = None):
+            loop.remove_reader(read_fd)
+            if not eof.done():
+                if error is None:
+                    eof.set_result(None)
+                else:
+                    eof.set_exception(error)
+        
+        def on_readable():
+            """Read available output and call on_data"""
+            # Check cancellation
+            if signal and signal.is_set():
+                kill()
+                finish()
+                return
+            
+            try:
+                chunk = os.read(read_fd, 65536)
+            except BlockingIOError:
+                return
+            except OSError:
+                chunk = b""
+            if not chunk:
+                finish()
+                return
+            
+            # Call callback
+            try:
+                on_data(chunk)
+            except BaseException as e:
+                kill()
+                finish(e)
+        
+        loop.add_reader(read_fd, on_readable)
+        
+        # Run with timeout
+        try:
+            if timeout:
+                await asyncio.wait_for(eof, timeout=timeout)
+                await asyncio.wait_for(process.wait(), timeout=1.0)
+            else:
+                await eof
+                await process.wait()
+        except (asyncio.TimeoutError, asyncio.CancelledError):
+            # Kill process on timeout or cancellation
+            kill()
+            raise
+        finally:
+            loop.remove_reader(read_fd)
+            os.close(read_fd)
+        
+        return {"exit_code": process.returncode}
+    
+    async def _exec_streams(
+        self,
+        command: str,
+        cwd: str,
+        on_data: Callable[[bytes], None],
+        signal: asyncio.Event | None,
+        timeout: int | None,
+        merged_env: dict[str, str],
+    ) -> dict[str, int | None]:
+        """Execute command reading output through a StreamReader (see exec)"""
         # Create subprocess
         process = await asyncio.create_subprocess_shell(
             command,
@@ -117,6 +225,228 @@ class DefaultBashOperations(BashOperations):
         return {"exit_code": process.returncode}
 
 
+# Bytes passed through as-is when feeding a script to the PTY shell; all
+# others (quotes, "!", control and non-ASCII bytes) are sent as \xHH escapes
+_PTY_SAFE_BYTES = frozenset(
+    b"abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 _./,:=+-"
+)
+# Source bytes per input line; escaped, a line stays under the terminal's
+# 4096-byte canonical line limit
+_PTY_LINE_BYTES = 900
+
+
+def _encode_pty_script(script: str, token: bytes) -> bytes:
+    """
+    Render script as terminal input for the persistent shell.
+    
+    The script is rebuilt from $'...' pieces into a variable and eval'd,
+    so the tty only ever sees short lines of plain ASCII: no tabs for
+    completion, no control characters for the line discipline, and
+    nothing for history expansion. A final printf reports its exit status
+    after the token.
+    """
+    raw = script.encode()
+    lines = []
+    op = "="
+    for i in range(0, len(raw), _PTY_LINE_BYTES):
+        piece = "".join(
+            chr(b) if b in _PTY_SAFE_BYTES else f"\\x{b:02x}"
+            for b in raw[i:i + _PTY_LINE_BYTES]
+        )
+        lines.append(f"__openclaw_cmd{op}$'{piece}'")
+        op = "+="
+    if not lines:
+        lines.append("__openclaw_cmd=")
+    lines.append('eval "$__openclaw_cmd"')
+    lines.append(f"printf '\\n%s%d\\n' {token.decode()} \"$?\"")
+    return ("\n".join(lines) + "\n").encode()
+
+
+def _terminate_pty(process) -> None:
+    """Kill a PtyProcess (blocking: ptyprocess sleeps between signals)"""
+    if process.isalive():
+        try:
+            process.terminate(force=True)
+        except OSError:
+            pass
+
+
+class PersistentPtyBashOperations(BashOperations):
+    """
+    Bash operations backed by one long-lived bash on a pseudo-terminal.
+    
+    Commands are written to the same shell instead of spawning a fresh
+    /bin/sh per call, so there is no fork/exec/startup cost per command
+    and shell state (exported variables, functions, aliases) carries over
+    between calls. Each command runs in the requested cwd with stdin from
+    /dev/null; its end is detected by a per-shell sentinel line carrying
+    the exit status. Commands run one at a time.
+    
+    On timeout or cancellation the shell is killed and a new one is
+    started on the next call. Requires the optional ptyprocess package.
+    """
+    
+    def __init__(self, shell: str = "bash"):
+        if not PTYPROCESS_AVAILABLE:
+            raise ImportError(
+                "ptyprocess is required for PersistentPtyBashOperations. "
+                "Install with: pip install ptyprocess"
+            )
+        self._shell = shell
+        self._process = None
+        self._lock = asyncio.Lock()
+        # Marks the end of each command's output: "\n<token><exit code>\n"
+        self._token = f"__openclaw_done_{uuid.uuid4().hex}__".encode()
+    
+    async def exec(
+        self,
+        command: str,
+        cwd: str,
+        on_data: Callable[[bytes], None],
+        signal: asyncio.Event | None = None,
+        timeout: int | None = None,
+        env: dict[str, str] | None = None,
+    ) -> dict[str, int | None]:
+        """Execute command in the persistent shell"""
+        async with self._lock:
+            if self._process is None or not self._process.isalive():
+                await self._spawn()
+            
+            if env:
+                # Scope the extra variables to this command with a subshell
+                exports = "".join(
+                    f"export {name}={shlex.quote(value)}\n" for name, value in env.items()
+                )
+                command = f"(\n{exports}{command}\n)"
+            
+            script = f"cd -- {shlex.quote(cwd)} && {{\n{command}\n}} < /dev/null"
+            return await self._run(script, on_data, signal, timeout)
+    
+    def close(self) -> None:
+        """Terminate the shell
+        
+        ptyprocess escalates SIGHUP -> SIGKILL with time.sleep between
+        signals, so inside an event loop that runs in the default executor
+        and close() returns immediately.
+        """
+        process, self._process = self._process, None
+        if process is None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            _terminate_pty(process)
+        else:
+            loop.run_in_executor(None, _terminate_pty, process)
+    
+    async def _spawn(self) -> None:
+        env = os.environ.copy()
+        env.update({"TERM": "dumb", "PS1": "", "PS2": ""})
+        # --noediting: readline would echo input and act on what it reads
+        self._process = ptyprocess.PtyProcess.spawn(
+            [self._shell, "--noprofile", "--norc", "--noediting"], env=env, echo=False
+        )
+        # No CRLF translation, no prompts, no history
+        await self._run(
+            "stty -onlcr 2>/dev/null; PS1=; PS2=; unset PROMPT_COMMAND; set +o history +H",
+            lambda data: None,
+            None,
+            10,
+        )
+    
+    async def _run(
+        self,
+        script: str,
+        on_data: Callable[[bytes], None],
+        signal: asyncio.Event | None,
+        timeout: int | None,
+    ) -> dict[str, int | None]:
+        process = self._process
+        fd = process.fd
+        token = self._token
+        marker = b"\n" + token
+        loop = asyncio.get_running_loop()
+        done: asyncio.Future[int | None] = loop.create_future()
+        pending = bytearray()
+        
+        def on_readable():
+            try:
+                read_output()
+            except BaseException as e:
+                # e.g. on_data failing: end the command rather than leave
+                # the reader registered and exec waiting forever
+                loop.remove_reader(fd)
+                if not done.done():
+                    done.set_exception(e)
+        
+        def read_output():
+            try:
+                data = os.read(fd, 65536)
+            except OSError:  # EIO once the shell has exited
+                data = b""
+            if not data:
+                loop.remove_reader(fd)
+                if not done.done():
+                    done.set_result(None)
+                return
+            
+            pending.extend(data)
+            end = pending.find(marker)
+            if end == -1:
+                # Hold back only what could be the start of the marker
+                keep = len(marker) - 1
+                if len(pending) > keep:
+                    on_data(bytes(pending[:-keep]))
+                    del pending[:-keep]
+                return
+            
+            line_end = pending.find(b"\n", end + len(marker))
+            if line_end == -1:
+                return
+            if end:
+                on_data(bytes(pending[:end]))
+            status = pending[end + len(marker):line_end]
+            loop.remove_reader(fd)
+            if not done.done():
+                done.set_result(int(status) if status.strip().isdigit() else None)
+        
+        loop.add_reader(fd, on_readable)
+        process.write(_encode_pty_script(script, token))
+        
+        waiters: set[asyncio.Future] = {done}
+        signal_task = asyncio.ensure_future(signal.wait()) if signal else None
+        if signal_task is not None:
+            waiters.add(signal_task)
+        
+        try:
+            await asyncio.wait(waiters, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        except asyncio.CancelledError:
+            self.close()
+            raise
+        finally:
+            loop.remove_reader(fd)
+            if signal_task is not None:
+                signal_task.cancel()
+        
+        if done.done():
+            if done.exception() is not None:
+                # The shell is mid-command, start over next time
+                self.close()
+            exit_code = done.result()
+            if exit_code is None:
+                # The command ended the shell itself (e.g. "exit 3"): report
+                # the shell's own status and start a new one next time
+                self._process = None
+                exit_code = await loop.run_in_executor(None, process.wait)
+            return {"exit_code": exit_code}
+        
+        # Timed out or cancelled: the shell is mid-command, start over next time
+        self.close()
+        if signal is not None and signal.is_set():
+            raise asyncio.CancelledError("Operation aborted")
+        raise asyncio.TimeoutError()
+
+
 class DefaultReadOperations(ReadOperations):
     """
     Default read operations using aiofiles.
@@ -139,6 +469,8 @@ class DefaultReadOperations(ReadOperations):
     
     async def read_file(self, path: str) -> bytes:
         """Read file contents"""
+        import aiofiles  # deferred: bash-only tool sets never need it
+        
         async with aiofiles.open(path, 'rb') as f:
             return await f.read()
     
@@ -174,6 +506,8 @@ class DefaultWriteOperations(WriteOperations):
     
     async def write_file(self, path: str, content: str) -> None:
         """Write file contents"""
+        import aiofiles  # deferred: bash-only tool sets never need it
+        
         async with aiofiles.open(path, 'w', encoding='utf-8') as f:
             await f.write(content)
 
@@ -189,6 +523,7 @@ class DefaultEditOperations(DefaultReadOperations, DefaultWriteOperations, EditO
 
 __all__ = [
     "DefaultBashOperations",
+    "PersistentPtyBashOperations",
     "DefaultReadOperations",
     "DefaultWriteOperations",
     "DefaultEditOperations",
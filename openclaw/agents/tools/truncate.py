@@ -12,7 +12,7 @@ Matches pi-mono/packages/coding-agent/src/core/tools/truncate.ts
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Literal
+from typing import Any, Literal
 
 # Default limits matching pi-mono
 DEFAULT_MAX_LINES = 2000
@@ -56,6 +56,15 @@ class TruncationResult:
     
     max_bytes: int
     """Maximum bytes limit used"""
+    
+    def as_details_dict(self) -> dict[str, Any] | None:
+        """
+        Truncation info for a tool result's details, or None if not truncated.
+        
+        Returns the instance's own field dict rather than a copy, so building
+        details per streamed update allocates nothing extra.
+        """
+        return self.__dict__ if self.truncated else None
 
 
 @dataclass
@@ -199,9 +208,11 @@ def truncate_tail(
     max_lines = options.max_lines if options.max_lines is not None else DEFAULT_MAX_LINES
     max_bytes = options.max_bytes if options.max_bytes is not None else DEFAULT_MAX_BYTES
     
-    total_bytes = len(content.encode('utf-8'))
-    lines = content.split('\n')
-    total_lines = len(lines)
+    # Counting needs no list of lines, and ASCII text (the common case for
+    # command output) needs no encode to size
+    is_ascii = content.isascii()
+    total_bytes = len(content) if is_ascii else len(content.encode('utf-8'))
+    total_lines = content.count('\n') + 1
     
     # Check if no truncation needed
     if total_lines <= max_lines and total_bytes <= max_bytes:
@@ -219,41 +230,51 @@ def truncate_tail(
             max_bytes=max_bytes,
         )
     
-    # Work backwards from the end
-    output_lines_arr: list[str] = []
+    # Work backwards from the end, finding line starts with rfind so only
+    # the kept tail is ever scanned; kept lines are contiguous, so the
+    # output is a single slice of content
+    output_lines = 0
     output_bytes_count = 0
     truncated_by: Literal["lines", "bytes"] = "lines"
     last_line_partial = False
+    output_start = len(content)  # start of the kept lines
+    line_end = len(content)
     
-    for i in range(len(lines) - 1, -1, -1):
-        if len(output_lines_arr) >= max_lines:
+    while line_end >= 0:
+        if output_lines >= max_lines:
             truncated_by = "lines"
             break
         
-        line = lines[i]
+        line_start = content.rfind('\n', 0, line_end) + 1
+        line = content[line_start:line_end]
         # +1 for newline (except for lines we've already added)
-        line_bytes = len(line.encode('utf-8')) + (1 if output_lines_arr else 0)
+        line_bytes = (len(line) if is_ascii else len(line.encode('utf-8'))) + (1 if output_lines else 0)
         
         if output_bytes_count + line_bytes > max_bytes:
             truncated_by = "bytes"
             # Edge case: if we haven't added ANY lines yet and this line exceeds maxBytes,
             # take the end of the line (partial)
-            if not output_lines_arr:
-                truncated_line = truncate_string_to_bytes_from_end(line, max_bytes)
-                output_lines_arr.insert(0, truncated_line)
-                output_bytes_count = len(truncated_line.encode('utf-8'))
+            if not output_lines:
+                output_content = truncate_string_to_bytes_from_end(line, max_bytes)
+                output_lines = 1
+                output_bytes_count = len(output_content.encode('utf-8'))
                 last_line_partial = True
             break
         
-        output_lines_arr.insert(0, line)
+        output_lines += 1
         output_bytes_count += line_bytes
+        output_start = line_start
+        line_end = line_start - 1
     
     # If we exited due to line limit
-    if len(output_lines_arr) >= max_lines and output_bytes_count <= max_bytes:
+    if output_lines >= max_lines and output_bytes_count <= max_bytes:
         truncated_by = "lines"
     
-    output_content = '\n'.join(output_lines_arr)
-    final_output_bytes = len(output_content.encode('utf-8'))
+    if not last_line_partial:
+        output_content = content[output_start:] if output_lines else ""
+        final_output_bytes = output_bytes_count
+    else:
+        final_output_bytes = len(output_content.encode('utf-8'))
     
     return TruncationResult(
         content=output_content,
@@ -261,7 +282,7 @@ def truncate_tail(
         truncated_by=truncated_by,
         total_lines=total_lines,
         total_bytes=total_bytes,
-        output_lines=len(output_lines_arr),
+        output_lines=output_lines,
         output_bytes=final_output_bytes,
         last_line_partial=last_line_partial,
         first_line_exceeds_limit=False,
@@ -9,6 +9,20 @@ from typing import Any
 logger = logging.getLogger(__name__)
 
 
+async def query_inner_text(page: Any, selector: str) -> str | None:
+    """
+    innerText of the first element matching selector, or None if none does.
+    
+    Goes through Playwright's selector engine (so shadow-root piercing and
+    text=/xpath=/>> selectors behave as in click/fill); a missing element
+    is reported by query_selector returning None, not by an error.
+    """
+    element = await page.query_selector(selector)
+    if element is None:
+        return None
+    return await element.inner_text()
+
+
 class BrowserController:
     """
     Unified browser controller using Playwright
@@ -267,11 +281,7 @@ class BrowserController:
         page = self._get_page(page_id)
         
         if selector:
-            element = await page.query_selector(selector)
-            if element:
-                text = await element.inner_text()
-            else:
-                text = ""
+            text = await query_inner_text(page, selector) or ""
         else:
             text = await page.inner_text("body")
         
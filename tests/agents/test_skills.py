@@ -165,3 +165,107 @@ class TestSkillMetadata:
         assert metadata.primary_env == "OPENAI_API_KEY"
         assert "bins" in metadata.requires
         assert "jq" in metadata.requires["bins"]
+
+
+class TestSkillsStatus:
+    """Tests for cached skill name listing."""
+    
+    def test_skill_md_added_and_removed_in_existing_dir(self, tmp_path):
+        """SKILL.md changes inside an existing skill dir are picked up."""
+        from openclaw.agents.skills_status import get_skill_path, list_skill_names
+        
+        skills_dir = tmp_path / ".openclaw" / "skills"
+        (skills_dir / "foo").mkdir(parents=True)
+        assert list_skill_names(tmp_path) == []
+        assert get_skill_path(tmp_path, "foo") is None
+        
+        skill_md = skills_dir / "foo" / "SKILL.md"
+        skill_md.write_text("# Foo")
+        assert list_skill_names(tmp_path) == ["foo"]
+        assert get_skill_path(tmp_path, "foo") == skill_md
+        
+        skill_md.unlink()
+        assert list_skill_names(tmp_path) == []
+        assert get_skill_path(tmp_path, "foo") is None
+
+
+class TestSkillEligibilityConfig:
+    """Tests for config-driven skill eligibility."""
+    
+    def test_disabled_entries_excluded(self):
+        from types import SimpleNamespace
+        
+        from openclaw.agents.skills.config import get_skills_config_view
+        from openclaw.agents.skills.eligibility import should_include_skill
+        
+        config = {"skills": {"entries": {"off": {"enabled": False}, "on": {"enabled": True}}}}
+        assert get_skills_config_view(config).disabled == frozenset({"off"})
+        
+        eligibility = SimpleNamespace(platform="linux")
+        
+        def entry(key):
+            skill = SimpleNamespace(name=key, metadata=None)
+            return SimpleNamespace(skill=skill, skill_key=key, source="workspace")
+        
+        assert not should_include_skill(entry("off"), config, eligibility)
+        assert should_include_skill(entry("on"), config, eligibility)
+        assert should_include_skill(entry("off"), None, eligibility)
+    
+    def test_in_place_config_edits_are_seen(self):
+        from types import SimpleNamespace
+        
+        from openclaw.agents.skills.config import get_skills_config_view, is_skill_enabled
+        from openclaw.agents.skills.eligibility import should_include_skill
+        
+        config = {"skills": {"allowBundled": False, "entries": {"foo": {"enabled": True}}}}
+        eligibility = SimpleNamespace(platform="linux")
+        skill = SimpleNamespace(name="foo", metadata=None)
+        entry = SimpleNamespace(skill=skill, skill_key="foo", source="bundled")
+        assert get_skills_config_view(config).allow_bundled is False
+        assert not should_include_skill(entry, config, eligibility)
+        
+        config["skills"]["allowBundled"] = True
+        assert get_skills_config_view(config).allow_bundled is True
+        assert should_include_skill(entry, config, eligibility)
+        
+        config["skills"]["entries"]["foo"]["enabled"] = False
+        assert not is_skill_enabled(config, "foo")
+        assert not should_include_skill(entry, config, eligibility)
+
+
+class TestSkillInstaller:
+    """Tests for skill dependency installation scheduling."""
+    
+    @pytest.mark.asyncio
+    async def test_one_install_per_backend_at_a_time(self, monkeypatch):
+        import asyncio
+        
+        from openclaw.agents.skills import installer
+        from openclaw.agents.skills.types import SkillInstallSpec
+        
+        running: dict[str, int] = {}
+        peak: dict[str, int] = {}
+        order: list[str] = []
+        
+        async def fake_install(spec, session=None):
+            running[spec.kind] = running.get(spec.kind, 0) + 1
+            peak[spec.kind] = max(peak.get(spec.kind, 0), running[spec.kind])
+            order.append(spec.formula or spec.package)
+            await asyncio.sleep(0.01)
+            running[spec.kind] -= 1
+        
+        monkeypatch.setattr(installer, "_install_spec", fake_install)
+        specs = [
+            SkillInstallSpec(kind="brew", formula="a"),
+            SkillInstallSpec(kind="node", package="x"),
+            SkillInstallSpec(kind="brew", formula="b"),
+            SkillInstallSpec(kind="node", package="y"),
+        ]
+        
+        ok, errors = await installer.install_skill_dependencies(None, specs)
+        assert ok and errors == []
+        assert peak == {"brew": 1, "node": 1}
+        assert order.index("a") < order.index("b")
+        assert order.index("x") < order.index("y")
+        # Different backends still overlap
+        assert order[:2] == ["a", "x"]
@@ -7,7 +7,7 @@ import pytest
 
 from openclaw.agents.agent_loop import AgentMessage, default_convert_to_llm
 from openclaw.agents.events import AgentEventType
-from openclaw.agents.tool_policy import ToolPolicyResolver, ToolPolicy
+from openclaw.agents.tool_policy import PluginGroup, ToolPolicyResolver, ToolPolicy
 
 
 def test_event_types_complete():
@@ -160,6 +160,49 @@ def test_tool_policy_provider_override():
     assert "bash" in tools_anthropic  # In default
 
 
+def test_tool_policy_reassigning_tools_invalidates_cache():
+    """Verify resolved lists follow reassigned core tools and plugin groups"""
+    
+    resolver = ToolPolicyResolver(["bash", "read_file"])
+    policy = ToolPolicy(profile="permissive")
+    assert resolver.resolve(policy, provider="anthropic") == ["bash", "read_file"]
+    
+    resolver.core_tools = ["read_file"]
+    assert resolver.resolve(policy, provider="anthropic") == ["read_file"]
+    
+    grouped = ToolPolicy(profile="permissive", allow=["group:fs"])
+    assert resolver.resolve(grouped, provider="anthropic") == []
+    resolver.plugin_groups = {"fs": PluginGroup(name="fs", tools=["read_file"])}
+    assert resolver.resolve(grouped, provider="anthropic") == ["read_file"]
+    
+    with pytest.raises(TypeError):
+        resolver.plugin_groups["other"] = PluginGroup(name="other", tools=[])
+    
+    # Group tools are frozen too, so they cannot change under the cache
+    with pytest.raises(AttributeError):
+        resolver.plugin_groups["fs"].tools.append("bash")
+
+
+def test_tool_policy_resolution_is_memoized():
+    """Verify equal policies share a cached resolution until groups change"""
+    
+    resolver = ToolPolicyResolver(["bash", "read_file", "my_plugin"])
+    
+    tools = resolver.resolve(ToolPolicy(allow=["read_file", "group:plugins"]), provider="anthropic")
+    assert tools == ["read_file"]
+    
+    # An equal policy built from fresh lists hits the same cache entry
+    resolver.resolve(ToolPolicy(allow=["read_file", "group:plugins"]), provider="anthropic")
+    assert len(resolver._resolve_cache) == 1
+    
+    # Registering a group invalidates cached resolutions
+    resolver.add_plugin_group(PluginGroup(name="plugins", tools=["my_plugin"]))
+    tools = resolver.resolve(
+        ToolPolicy(profile="permissive", allow=["read_file", "group:plugins"]), provider="anthropic"
+    )
+    assert tools == ["my_plugin", "read_file"]
+
+
 def test_agent_message_metadata():
     """Verify AgentMessage supports metadata"""
     
@@ -2,6 +2,7 @@
 Tests for skill eligibility checking.
 """
 import platform
+from collections.abc import Mapping
 
 import pytest
 
@@ -25,7 +26,7 @@ def test_build_eligibility_context():
     
     assert ctx.platform in ["darwin", "linux", "win32"]
     assert isinstance(ctx.available_bins, set)
-    assert isinstance(ctx.env_vars, dict)
+    assert isinstance(ctx.env_vars, Mapping)
 
 
 def test_skill_always_included():
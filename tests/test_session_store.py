@@ -218,6 +218,16 @@ def test_delete_session(session_store):
     assert len(loaded) == 0
 
 
+def test_load_transcript_rejects_malformed_lines(session_store):
+    """Test that transcript lines missing required fields are not loaded"""
+    entry, _ = session_store.get_or_create_session(session_key="agent:main:bad")
+    session_store.save_transcript(entry.session_id, [TranscriptMessage(role="user", content="Hi")])
+    with open(session_store._get_transcript_file(entry.session_id), "a") as f:
+        f.write('{"content": "no role"}\n')
+
+    assert session_store.load_transcript(entry.session_id) == []
+
+
 def test_tool_calls_in_transcript(session_store):
     """Test that tool_calls are correctly saved in transcript"""
     entry, _ = session_store.get_or_create_session(
@@ -269,5 +279,54 @@ def test_tool_result_message(session_store):
     assert loaded[0].name == "web_search"
 
 
+def test_mutations_are_journaled_and_replayed(temp_workspace):
+    """Test that mutations append to sessions.log and survive a reload"""
+    store = SessionStore(temp_workspace)
+    keep, _ = store.get_or_create_session(session_key="agent:main:keep")
+    gone, _ = store.get_or_create_session(session_key="agent:main:gone")
+    store.update_session(keep.session_id, model="anthropic/claude")
+    store.delete_session(gone.session_id)
+
+    assert (store.sessions_dir / "sessions.log").exists()
+    assert not (store.sessions_dir / "sessions.json").exists()
+
+    reloaded = SessionStore(temp_workspace)
+    assert reloaded.get_session(keep.session_id).model == "anthropic/claude"
+    assert reloaded.get_session(gone.session_id) is None
+
+    # Startup folds the journal into a fresh snapshot
+    assert (reloaded.sessions_dir / "sessions.json").exists()
+    assert not (reloaded.sessions_dir / "sessions.log").exists()
+
+
+def test_journal_compacts_past_threshold(temp_workspace):
+    """Test that the journal is compacted into sessions.json past its threshold"""
+    store = SessionStore(temp_workspace)
+    store.JOURNAL_MAX_ENTRIES = 3
+    entry, _ = store.get_or_create_session(session_key="agent:main:compact")
+    store.update_session(entry.session_id, model="a")
+    assert (store.sessions_dir / "sessions.log").exists()
+
+    store.update_session(entry.session_id, model="b")
+    assert not (store.sessions_dir / "sessions.log").exists()
+
+    reloaded = SessionStore(temp_workspace)
+    assert reloaded.get_session(entry.session_id).model == "b"
+
+
+def test_torn_journal_tail_is_discarded(temp_workspace):
+    """Test that a crash mid-append does not swallow the next journal record"""
+    store = SessionStore(temp_workspace)
+    journal = store.sessions_dir / "sessions.log"
+    journal.write_bytes(b'{"op": "upsert", "se')
+
+    reloaded = SessionStore(temp_workspace)
+    assert journal.read_bytes() == b""
+    entry, _ = reloaded.get_or_create_session(session_key="agent:main:torn")
+
+    again = SessionStore(temp_workspace)
+    assert again.get_session(entry.session_id) is not None
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
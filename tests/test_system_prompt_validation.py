@@ -254,6 +254,32 @@ def test_timezone_resolution():
     assert any(c.isalpha() for c in timezone)
 
 
+def test_timezone_resolution_is_memoized():
+    """Test that timezone resolution is cached per config value"""
+    from openclaw.agents import system_prompt_params as spp
+    
+    spp._reset_tz_cache()
+    assert spp.resolve_user_timezone(" Europe/Paris ") == "Europe/Paris"
+    assert spp.resolve_user_timezone("Europe/Paris") == "Europe/Paris"
+    
+    info = spp._resolve_user_timezone_cached.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+    spp._reset_tz_cache()
+
+
+def test_repo_root_found_after_git_init(tmp_path):
+    """Test that a missed repo root lookup is retried, not cached"""
+    from openclaw.agents.system_prompt_params import resolve_repo_root
+    
+    workspace = tmp_path / "ws"
+    workspace.mkdir()
+    assert resolve_repo_root(workspace) is None
+    
+    (workspace / ".git").mkdir()
+    assert resolve_repo_root(workspace) == workspace.resolve()
+
+
 def test_workspace_dir_in_prompt():
     """Test that workspace directory info is present"""
     workspace = Path.cwd()
@@ -251,6 +251,59 @@ async def test_orchestrator_observer_notification(mock_session, mock_runtime, mo
     assert len(received_events) > 0
 
 
+def test_prepare_messages_is_incremental():
+    """Test that prepared history is extended, not rebuilt, as the session grows"""
+    from openclaw.agents.session import Message
+    
+    messages = [Message(role="user", content="hi"), Message(role="assistant", content="hello")]
+    session = Mock()
+    session.session_id = "test-session-123"
+    session.get_messages = Mock(return_value=messages)
+    
+    orchestrator = ToolLoopOrchestrator()
+    first = orchestrator._prepare_messages(session, None, "anthropic")
+    assert [m.content for m in first] == ["hi", "hello"]
+    
+    messages.append(Message(role="tool", content="42", tool_call_id="call_1", name="calc"))
+    second = orchestrator._prepare_messages(session, None, "anthropic")
+    assert second[:2] == first
+    assert second[2].tool_call_id == "call_1"
+    
+    # Replacing the message list (e.g. session.clear()) rebuilds from scratch
+    session.get_messages = Mock(return_value=[Message(role="user", content="again")])
+    third = orchestrator._prepare_messages(session, None, "anthropic")
+    assert [m.content for m in third] == ["again"]
+    
+    # Replacing an earlier message in place also rebuilds
+    messages = session.get_messages.return_value
+    messages.append(Message(role="assistant", content="ok"))
+    orchestrator._prepare_messages(session, None, "anthropic")
+    messages[0] = Message(role="user", content="edited")
+    fourth = orchestrator._prepare_messages(session, None, "anthropic")
+    assert [m.content for m in fourth] == ["edited", "ok"]
+
+
+def test_prepare_messages_window_matches_limit_history_turns():
+    """Test that the cached history window always equals limit_history_turns"""
+    from openclaw.agents.history_utils import limit_history_turns
+    from openclaw.agents.session import Message
+    
+    messages = []
+    session = Mock()
+    session.session_id = "test-session-123"
+    session.get_messages = Mock(return_value=messages)
+    
+    orchestrator = ToolLoopOrchestrator()
+    for i in range(12):
+        messages.append(Message(role="user", content=f"u{i}"))
+        messages.append(Message(role="assistant", content=f"a{i}"))
+        prepared = orchestrator._prepare_messages(session, 4, "anthropic")
+        expected = limit_history_turns(
+            [{"role": m.role, "content": m.content} for m in messages], 4, "anthropic"
+        )
+        assert [m.content for m in prepared] == [m["content"] for m in expected]
+
+
 def test_orchestrator_max_iterations_constant():
     """Test that MAX_TOOL_ITERATIONS constant is defined"""
     assert MAX_TOOL_ITERATIONS == 5
@@ -260,4 +313,85 @@ def test_orchestrator_initialization():
     """Test orchestrator initialization"""
     orchestrator = ToolLoopOrchestrator(max_iterations=10)
     assert orchestrator.max_iterations == 10
-    assert orchestrator._observers == []
+    assert orchestrator._observers == {}
+
+
+def test_remove_observer_matches_bound_methods():
+    """Test that a bound method observer can be removed via a fresh attribute access"""
+    class Listener:
+        def on_event(self, event):
+            pass
+    
+    listener = Listener()
+    orchestrator = ToolLoopOrchestrator()
+    orchestrator.add_observer(listener.on_event)
+    orchestrator.remove_observer(listener.on_event)
+    assert orchestrator._observers == {}
+    assert not orchestrator._sync_observers
+    
+    # Removing an unknown observer is a no-op
+    orchestrator.remove_observer(listener.on_event)
+
+
+@pytest.mark.asyncio
+async def test_coalesced_text_flushed_when_stream_pauses(mock_session, mock_runtime, mock_tools):
+    """Buffered text deltas are forwarded once the window ends, not at the next event"""
+    def text(t):
+        return Event(type=EventType.AGENT_TEXT, source="test", session_id="test-session-123",
+                     data={"delta": {"text": t}})
+    
+    async def slow_stream(*args, **kwargs):
+        yield text("a")
+        yield text("b")  # within the window: buffered
+        await asyncio.sleep(0.5)
+        yield Event(type=EventType.AGENT_TURN_COMPLETE, source="test",
+                    session_id="test-session-123", data={})
+    
+    mock_runtime._stream_single_turn = Mock(side_effect=slow_stream)
+    orchestrator = ToolLoopOrchestrator(max_iterations=5, text_coalesce_ms=50)
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    
+    received = []
+    async for event in orchestrator.execute_with_tools(
+        session=mock_session,
+        prompt="Hello",
+        tools=mock_tools,
+        runtime=mock_runtime,
+    ):
+        if event.type == EventType.AGENT_TEXT:
+            received.append((event.data["delta"]["text"], loop.time() - start))
+    
+    assert [t for t, _ in received] == ["a", "b"]
+    assert received[1][1] < 0.3
+
+
+@pytest.mark.asyncio
+async def test_early_exit_closes_runtime_stream(mock_session, mock_runtime, mock_tools):
+    """Leaving the turn early settles the read-ahead task and closes the stream"""
+    closed = asyncio.Event()
+    
+    async def slow_stream(*args, **kwargs):
+        try:
+            yield Event(type=EventType.AGENT_TEXT, source="test", session_id="test-session-123",
+                        data={"delta": {"text": "a"}})
+            yield Event(type=EventType.AGENT_TEXT, source="test", session_id="test-session-123",
+                        data={"delta": {"text": "b"}})
+            await asyncio.sleep(10)
+        finally:
+            closed.set()
+    
+    mock_runtime._stream_single_turn = Mock(side_effect=slow_stream)
+    orchestrator = ToolLoopOrchestrator(max_iterations=5, text_coalesce_ms=50)
+    
+    events = orchestrator.execute_with_tools(
+        session=mock_session, prompt="Hello", tools=mock_tools, runtime=mock_runtime,
+    )
+    async for event in events:
+        if event.data.get("delta", {}).get("text") == "b":
+            break  # the stream is paused in the read-ahead task here
+    await events.aclose()
+    
+    assert closed.is_set()
+    current = asyncio.current_task()
+    assert [t for t in asyncio.all_tasks() if t is not current] == []
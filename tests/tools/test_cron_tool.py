@@ -0,0 +1,216 @@
+"""Tests for the cron agent tool"""
+import pytest
+
+from openclaw.agents.tools.base import ToolResult
+from openclaw.agents.tools.cron import CronTool
+
+
+class FakeCronService:
+    """Records calls made by CronTool"""
+
+    log_dir = None
+
+    def __init__(self, jobs=None):
+        self.jobs = jobs or []
+        self.calls = []
+
+    async def status(self):
+        self.calls.append(("status",))
+        return {"enabled": True, "jobs": len(self.jobs)}
+
+    async def list_jobs(self, include_disabled=False):
+        self.calls.append(("list_jobs", include_disabled))
+        return self.jobs
+
+    async def run(self, job_id, mode="force"):
+        self.calls.append(("run", job_id, mode))
+        return {"ran": True}
+
+    def wake(self, text, mode="now"):
+        self.calls.append(("wake", text, mode))
+        return {"ok": True}
+
+
+@pytest.mark.asyncio
+async def test_cron_tool_dispatch_defaults():
+    """Actions receive their documented defaults for omitted args"""
+    service = FakeCronService()
+    tool = CronTool(cron_service=service)
+
+    assert (await tool.execute({"action": "status"})).success
+    assert (await tool.execute({"action": "list"})).success
+    assert (await tool.execute({"action": "run", "jobId": "cron-1"})).success
+    assert (await tool.execute({"action": "wake", "text": "hi"})).success
+
+    assert service.calls == [
+        ("status",),
+        ("list_jobs", False),
+        ("run", "cron-1", "force"),
+        ("wake", "hi", "now"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_cron_tool_unknown_action():
+    tool = CronTool(cron_service=FakeCronService())
+
+    result = await tool.execute({"action": "bogus"})
+    assert not result.success
+    assert result.error
+
+
+@pytest.mark.asyncio
+async def test_cron_tool_requires_job_id():
+    tool = CronTool(cron_service=FakeCronService())
+
+    result = await tool.execute({"action": "remove"})
+    assert not result.success
+    assert "jobId" in result.error
+
+
+def test_cron_tool_format_schedule():
+    fmt = CronTool._format_schedule
+
+    assert fmt({"type": "at", "timestamp": "2026-01-01T00:00:00Z"}) == "One-time at 2026-01-01T00:00:00Z"
+    assert fmt({"type": "every", "interval_ms": 7_200_000}) == "Every 2.0h"
+    assert fmt({"type": "every", "intervalMs": 120_000}) == "Every 2m"
+    assert fmt({"type": "every", "interval_ms": 5000}) == "Every 5s"
+    assert fmt({"type": "cron", "expression": "0 9 * * *"}) == "Cron: 0 9 * * * (UTC)"
+    assert fmt({"type": "other"}) == "Unknown schedule"
+    # Unhashable field values still format
+    assert fmt({"type": "at", "timestamp": ["x"]}) == "One-time at ['x']"
+
+
+@pytest.mark.asyncio
+async def test_cron_tool_list_output():
+    jobs = [
+        {
+            "id": "cron-a",
+            "name": "Morning",
+            "enabled": True,
+            "schedule": {"type": "cron", "expression": "0 9 * * *", "timezone": "UTC"},
+            "session_target": "isolated",
+            "delivery": {"channel": "telegram", "target": "42"},
+        },
+        {
+            "id": "cron-b",
+            "name": "Ping",
+            "enabled": False,
+            "schedule": {"type": "every", "interval_ms": 60_000},
+        },
+    ]
+    tool = CronTool(cron_service=FakeCronService(jobs))
+
+    result = await tool.execute({"action": "list", "includeDisabled": True})
+    assert result.success
+    assert result.content == (
+        "Scheduled Jobs (2):\n"
+        "\n"
+        "[ON] Morning\n"
+        "  ID: cron-a\n"
+        "  Schedule: Cron: 0 9 * * * (UTC)\n"
+        "  Type: Isolated Agent\n"
+        "  Delivery: telegram -> 42\n"
+        "\n"
+        "[OFF] Ping\n"
+        "  ID: cron-b\n"
+        "  Schedule: Every 1m\n"
+        "  Type: System Event"
+    )
+
+
+def test_cron_tool_normalize_schedule_and_payload():
+    from openclaw.agents.tools.cron import _normalize_payload, _normalize_schedule
+    from openclaw.cron.types import AgentTurnPayload, AtSchedule, CronSchedule, EverySchedule
+
+    assert _normalize_schedule({"kind": "at", "at": "2026-01-01"}) == AtSchedule(timestamp="2026-01-01")
+    assert _normalize_schedule({"type": "every", "intervalMs": 5000}) == EverySchedule(interval_ms=5000)
+    assert _normalize_schedule({"type": "cron", "expression": "* * * * *"}) == CronSchedule(expression="* * * * *")
+    assert _normalize_schedule({"type": "hourly"}) is None
+
+    assert _normalize_payload({"kind": "agentTurn", "message": "hi"}) == AgentTurnPayload(prompt="hi")
+    assert _normalize_payload({"kind": "other"}) is None
+
+
+@pytest.mark.asyncio
+async def test_cron_tool_execute_raw():
+    service = FakeCronService()
+    tool = CronTool(cron_service=service)
+
+    result = await tool.execute_raw(b'{"action": "wake", "text": "hi", "mode": "next-heartbeat"}')
+    assert result.success
+    assert service.calls == [("wake", "hi", "next-heartbeat")]
+
+    assert not (await tool.execute_raw("{not json")).success
+    assert not (await tool.execute_raw("[1, 2]")).success
+
+
+@pytest.mark.asyncio
+async def test_cron_tool_bulk():
+    service = FakeCronService()
+    tool = CronTool(cron_service=service)
+
+    result = await tool.execute({
+        "action": "bulk",
+        "actions": [
+            {"action": "run", "jobId": "cron-1"},
+            {"action": "wake", "text": "hi"},
+        ],
+    })
+    assert result.success
+    assert result.content == "[1] run: Executed job: cron-1\n\n[2] wake: Wake event sent (mode=now): hi"
+    assert sorted(service.calls) == [("run", "cron-1", "force"), ("wake", "hi", "now")]
+
+    result = await tool.execute({
+        "action": "bulk",
+        "actions": [{"action": "run", "jobId": "cron-1"}, {"action": "remove"}],
+    })
+    assert not result.success
+    assert result.error == "1 of 2 actions failed"
+    assert "[2] remove: Error: jobId is required" in result.content
+
+    assert not (await tool.execute({"action": "bulk", "actions": [{"action": "bulk"}]})).success
+
+
+@pytest.mark.asyncio
+async def test_cron_tool_lenient_args():
+    """Args the actions normalize themselves are not rejected up front"""
+    service = FakeCronService()
+    tool = CronTool(cron_service=service)
+
+    args = {"action": "run", "jobId": "cron-1", "mode": "later"}
+    assert (await tool.execute(args)).success
+    assert args == {"action": "run", "jobId": "cron-1", "mode": "later"}
+    assert service.calls == [("run", "cron-1", "force")]
+    assert tool.get_schema() is tool.get_schema()
+
+
+@pytest.mark.asyncio
+async def test_cron_tool_subclass_override():
+    """Dispatch honours subclass overrides of action methods"""
+
+    class QuietCronTool(CronTool):
+        async def _action_status(self):
+            return ToolResult(success=True, content="quiet")
+
+    service = FakeCronService()
+    result = await QuietCronTool(cron_service=service).execute({"action": "status"})
+    assert result.content == "quiet"
+    assert service.calls == []
+
+
+def test_cron_tool_action_defaults_are_immutable():
+    """No shared mutable default is handed to the action methods"""
+    for _, arg_defaults in CronTool._ACTIONS.values():
+        for _, default in arg_defaults:
+            assert not isinstance(default, (dict, list, set))
+
+
+@pytest.mark.asyncio
+async def test_cron_tool_missing_job_and_patch():
+    tool = CronTool(cron_service=FakeCronService())
+
+    assert not (await tool.execute({"action": "add"})).success
+    result = await tool.execute({"action": "update", "jobId": "cron-1"})
+    assert result.error == "patch object is required"
+    assert not (await tool.execute({"action": "bulk"})).success
@@ -287,6 +287,139 @@ async def test_bash_with_environment_variables():
     assert len(result.content[0].text.strip()) > 0
 
 
+@pytest.mark.asyncio
+async def test_bash_large_output_keeps_tail():
+    """Test that large bash output is tail-truncated and saved in full"""
+    bash_tool = create_bash_tool("/tmp")
+    
+    result = await bash_tool.execute(
+        tool_call_id="bash-large",
+        params={"command": "seq 1 30000"},
+        signal=None,
+        on_update=None,
+    )
+    
+    text = result.content[0].text
+    assert text.startswith("28002\n")
+    assert "[Showing lines" in text
+    
+    full_output_path = result.details["full_output_path"]
+    try:
+        with open(full_output_path) as f:
+            lines = f.read().split()
+        assert lines == [str(i) for i in range(1, 30001)]
+    finally:
+        os.unlink(full_output_path)
+
+
+@pytest.mark.asyncio
+async def test_bash_persistent_pty_operations():
+    """Test bash tool on a persistent PTY shell"""
+    pytest.importorskip("ptyprocess")
+    from openclaw.agents.tools.default_operations import PersistentPtyBashOperations
+    
+    ops = PersistentPtyBashOperations()
+    try:
+        bash_tool = create_bash_tool("/tmp", operations=ops)
+        
+        await bash_tool.execute(
+            tool_call_id="bash-pty-1",
+            params={"command": "export OPENCLAW_PTY_TEST='a b'"},
+            signal=None,
+            on_update=None,
+        )
+        result = await bash_tool.execute(
+            tool_call_id="bash-pty-2",
+            params={"command": "pwd; echo \"$OPENCLAW_PTY_TEST\""},
+            signal=None,
+            on_update=None,
+        )
+        assert result.content[0].text == "/tmp\na b\n"
+        
+        with pytest.raises(Exception, match="exited with code 3"):
+            await bash_tool.execute(
+                tool_call_id="bash-pty-3",
+                params={"command": "echo bye; exit 3"},
+                signal=None,
+                on_update=None,
+            )
+    finally:
+        ops.close()
+
+
+@pytest.mark.asyncio
+async def test_bash_persistent_pty_on_data_error():
+    """An on_data failure ends the command instead of hanging exec"""
+    pytest.importorskip("ptyprocess")
+    from openclaw.agents.tools.default_operations import PersistentPtyBashOperations
+    
+    def failing_on_data(data: bytes):
+        raise RuntimeError("disk full")
+    
+    ops = PersistentPtyBashOperations()
+    try:
+        with pytest.raises(RuntimeError, match="disk full"):
+            await asyncio.wait_for(
+                ops.exec("seq 1 2000; sleep 5", "/tmp", failing_on_data), timeout=3
+            )
+        
+        # A fresh shell serves the next command
+        chunks = []
+        result = await ops.exec("echo again", "/tmp", chunks.append)
+        assert result["exit_code"] == 0
+        assert b"".join(chunks) == b"again\n"
+    finally:
+        ops.close()
+
+
+@pytest.mark.asyncio
+async def test_bash_persistent_pty_close_does_not_block():
+    """close() returns at once even while a command hangs"""
+    pytest.importorskip("ptyprocess")
+    from openclaw.agents.tools.default_operations import PersistentPtyBashOperations
+    
+    ops = PersistentPtyBashOperations()
+    # Ignoring SIGHUP makes ptyprocess escalate (with sleeps) to SIGKILL
+    task = asyncio.ensure_future(ops.exec("trap '' HUP INT; sleep 3", "/tmp", lambda data: None))
+    await asyncio.sleep(0.5)
+    process = ops._process
+    
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    ops.close()
+    assert loop.time() - start < 0.05
+    
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    for _ in range(50):
+        if not process.isalive():
+            break
+        await asyncio.sleep(0.1)
+    assert not process.isalive()
+
+
+@pytest.mark.asyncio
+async def test_bash_stream_fallback_without_add_reader(monkeypatch):
+    """On Windows (no loop add_reader) exec reads output via StreamReader"""
+    from types import SimpleNamespace
+    
+    from openclaw.agents.tools import default_operations
+    
+    def no_add_reader(*args):
+        raise NotImplementedError
+    
+    monkeypatch.setattr(default_operations, "sys", SimpleNamespace(platform="win32"))
+    monkeypatch.setattr(asyncio.get_running_loop(), "add_reader", no_add_reader)
+    
+    chunks = []
+    result = await default_operations.DefaultBashOperations().exec(
+        "echo hello; exit 3", "/tmp", chunks.append
+    )
+    assert result["exit_code"] == 3
+    assert b"".join(chunks) == b"hello\n"
+
+
 @pytest.mark.asyncio
 async def test_edit_with_no_changes():
     """Test edit where old and new text are the same"""
@@ -113,6 +113,16 @@ def test_truncate_tail_last_line_partial():
     assert result.output_bytes <= DEFAULT_MAX_BYTES
 
 
+def test_truncation_as_details_dict():
+    """Test that details are only produced for truncated results"""
+    assert truncate_tail("short").as_details_dict() is None
+    
+    result = truncate_tail("\n".join(str(i) for i in range(2500)))
+    details = result.as_details_dict()
+    assert details["truncated_by"] == "lines"
+    assert details["output_lines"] == DEFAULT_MAX_LINES
+
+
 def test_truncate_string_to_bytes_from_end():
     """Test UTF-8 safe truncation from end"""
     text = "Hello 世界 World"
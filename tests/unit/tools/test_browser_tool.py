@@ -182,3 +182,19 @@ def test_browser_tool_imports():
         assert BrowserTool is not None
     except ImportError as e:
         pytest.fail(f"Failed to import BrowserTool: {e}")
+
+
+@pytest.mark.asyncio
+async def test_query_inner_text():
+    """Element text is read through Playwright's selector engine"""
+    from openclaw.browser.controller import query_inner_text
+    
+    element = MagicMock()
+    element.inner_text = AsyncMock(return_value="hello")
+    page = MagicMock()
+    page.query_selector = AsyncMock(return_value=element)
+    assert await query_inner_text(page, "text=hello") == "hello"
+    page.query_selector.assert_awaited_once_with("text=hello")
+    
+    page.query_selector = AsyncMock(return_value=None)
+    assert await query_inner_text(page, "#nope") is None